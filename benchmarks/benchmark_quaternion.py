@@ -0,0 +1,426 @@
+"""
+This file is part of the pyquaternion python module
+
+Author:         Kieran Wynn
+Website:        https://github.com/KieranWynn/pyquaternion
+Documentation:  http://kieranwynn.github.io/pyquaternion/
+
+Version:         1.0.0
+License:         The MIT License (MIT)
+
+Copyright (c) 2015 Kieran Wynn
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+benchmark_quaternion.py - Micro-benchmarks of pyquaternion operations
+
+Usage:
+    python benchmarks/benchmark_quaternion.py [section ...]
+
+Runs every section when none is named. Timings are the best of several repeats, in microseconds per call.
+
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import sys
+import time
+import timeit
+import tracemalloc
+
+import numpy as np
+
+from pyquaternion import Quaternion
+
+
+def time_per_call(stmt, setup_globals, number=20000, repeat=5):
+    """Best time of `repeat` runs of `stmt`, in microseconds per call.
+    """
+    timer = timeit.Timer(stmt, globals=setup_globals)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def report(title, cases, setup_globals, number=20000):
+    """Time and print a list of (label, statement) pairs.
+    """
+    print("\n" + title)
+    print("-" * len(title))
+    for label, stmt in cases:
+        print("{:<48} {:>10.3f} us".format(label, time_per_call(stmt, setup_globals, number)))
+
+
+def bench_construction():
+    g = {
+        'Quaternion': Quaternion,
+        'a': np.random.uniform(-1, 1, 4),
+        'p': Quaternion.random(),
+        'q': Quaternion.random(),
+    }
+    report("Construction", [
+        ("Quaternion(array=a)  [validated]", "Quaternion(array=a)"),
+        ("Quaternion.from_array(a)  [trusted copy]", "Quaternion.from_array(a)"),
+        ("Quaternion.from_array(a, copy=False)", "Quaternion.from_array(a, copy=False)"),
+    ], g)
+    n = 100000
+    g['rng'] = np.random.default_rng(0)
+    g['n'] = n
+    loop = time_per_call("[Quaternion.random(rng=rng) for _ in range(1000)]", g, number=20) / 1000
+    batch = time_per_call("Quaternion.random(n, rng=rng)", g, number=20) / n
+    print("\nRandom, per quaternion")
+    print("----------------------")
+    print("{:<48} {:>10.3f} us".format("loop of 1000 Quaternion.random()", loop))
+    print("{:<48} {:>10.3f} us".format("Quaternion.random(n), N={}".format(n), batch))
+    report("Operators", [
+        ("-q", "-q"),
+        ("p + q", "p + q"),
+        ("p * q", "p * q"),
+        ("q.conjugate", "q.conjugate"),
+        ("q.inverse", "q.inverse"),
+    ], g)
+
+
+def bench_multiplication():
+    from pyquaternion import QuaternionArray
+    n = 100000
+    g = {
+        'np': np,
+        'Quaternion': Quaternion,
+        'p': Quaternion.random(),
+        'q': Quaternion.random(),
+        'a': QuaternionArray(np.random.uniform(-1, 1, (n, 4))),
+        'b': QuaternionArray(np.random.uniform(-1, 1, (n, 4))),
+        'pairs': list(zip(QuaternionArray(np.random.uniform(-1, 1, (1000, 4))), QuaternionArray(np.random.uniform(-1, 1, (1000, 4))))),
+    }
+    report("Hamilton product, single", [
+        ("_q_matrix() product  [before]", "Quaternion.from_array(np.dot(p._q_matrix(), q.q), copy=False)"),
+        ("p * q  [{} backend]".format(Quaternion.get_backend()), "p * q"),
+    ], g)
+    loop = time_per_call("[x * y for x, y in pairs]", g, number=20) / len(g['pairs'])
+    batch = time_per_call("a * b", g, number=20) / n
+    print("\nHamilton product, per product")
+    print("-----------------------------")
+    print("{:<48} {:>10.3f} us".format("loop of 1000 Quaternion products", loop))
+    print("{:<48} {:>10.3f} us".format("QuaternionArray product, N={}".format(n), batch))
+
+
+def bench_memory(n=10**6):
+    rows = list(np.random.uniform(-1, 1, (n, 4)))
+    print("\nMemory, {} instances".format(n))
+    print("-" * len("Memory, {} instances".format(n)))
+    for label, build in [
+        ("Quaternion(array=a)", lambda: [Quaternion(array=a) for a in rows]),
+        ("Quaternion.from_array(a)", lambda: [Quaternion.from_array(a) for a in rows]),
+    ]:
+        tracemalloc.start()
+        start = time.time()
+        instances = build()
+        elapsed = time.time() - start
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print("{:<48} {:>10.1f} bytes per instance, {:>10.0f} instances per second".format(label, size / n, n / elapsed))
+        del instances
+    q = Quaternion.random()
+    print("{:<48} {:>10d} bytes".format("  of which Quaternion object", sys.getsizeof(q)))
+    print("{:<48} {:>10d} bytes".format("  of which elements array", sys.getsizeof(q.q)))
+
+
+def bench_scalar():
+    g = {
+        'Quaternion': Quaternion,
+        'q': Quaternion.random(),
+        's': 2.5,
+    }
+    report("Scalar operands", [
+        ("q * Quaternion(s)  [before]", "q * Quaternion(s)"),
+        ("q * s", "q * s"),
+        ("Quaternion(s) * q  [before]", "Quaternion(s) * q"),
+        ("s * q", "s * q"),
+        ("q * Quaternion(s).inverse  [before]", "q * Quaternion(s).inverse"),
+        ("q / s", "q / s"),
+        ("Quaternion(s) * q.inverse  [before]", "Quaternion(s) * q.inverse"),
+        ("s / q", "s / q"),
+        ("q + Quaternion(s)  [before]", "q + Quaternion(s)"),
+        ("q + s", "q + s"),
+        ("q + -Quaternion(s)  [before]", "q + -Quaternion(s)"),
+        ("q - s", "q - s"),
+        ("-(q - Quaternion(s))  [before]", "-(q - Quaternion(s))"),
+        ("s - q", "s - q"),
+        ("q / q", "q / q"),
+    ], g)
+
+
+def bench_slerp():
+    from pyquaternion import QuaternionArray, SlerpPlan
+    n = 100000
+    g = {
+        'Quaternion': Quaternion,
+        'QuaternionArray': QuaternionArray,
+        'a': QuaternionArray.random(n),
+        'b': QuaternionArray.random(n),
+        't': np.random.random(n),
+    }
+    g['triples'] = list(zip(g['a'][:1000], g['b'][:1000], g['t'][:1000]))
+    loop = time_per_call("[Quaternion.slerp(p, q, s) for p, q, s in triples]", g, number=5) / len(g['triples'])
+    batch = time_per_call("QuaternionArray.slerp(a, b, t)", g, number=5) / n
+    print("\nSlerp, per pair")
+    print("---------------")
+    print("{:<48} {:>10.3f} us".format("loop of 1000 Quaternion.slerp()", loop))
+    print("{:<48} {:>10.3f} us".format("QuaternionArray.slerp(), N={}".format(n), batch))
+
+    g['SlerpPlan'] = SlerpPlan
+    g['p'], g['q'] = Quaternion.random(), Quaternion.random()
+    report("Intermediates, 100 steps", [
+        ("Quaternion.slerp() per step  [before]", "[Quaternion.slerp(p, q, s) for s in t[:100]]"),
+        ("Quaternion.intermediates()", "list(Quaternion.intermediates(p, q, 100))"),
+        ("SlerpPlan.intermediates()", "SlerpPlan(p, q).intermediates(100)"),
+    ], g, number=200)
+
+
+def bench_track():
+    from pyquaternion import QuaternionArray, OrientationTrack
+    n = 10**6
+    times = np.cumsum(np.random.uniform(0.5, 1.5, n))
+    orientations = QuaternionArray.random(n)
+    start = time.time()
+    track = OrientationTrack(times, orientations)
+    build = time.time() - start
+    g = {
+        'track': track,
+        'queries': np.linspace(times[0], times[-1], n),
+        't': times[n // 2] + 0.25,
+    }
+    resample = time_per_call("track.evaluate(queries)", g, number=1, repeat=3)
+    print("\nOrientation track, N={}".format(n))
+    print("--------------------------------")
+    print("{:<48} {:>10.1f} ms".format("OrientationTrack(times, orientations)", build * 1e3))
+    print("{:<48} {:>10.1f} ms".format("track.evaluate() of {} query times".format(n), resample / 1e3))
+    print("{:<48} {:>10.3f} us".format("track(t)", time_per_call("track(t)", g)))
+
+
+def bench_spline():
+    from pyquaternion import QuaternionArray, SquadSpline, CumulativeBSpline
+    n = 10000
+    times = np.arange(float(n))
+    orientations = QuaternionArray.random(n)
+    g = {
+        'np': np,
+        'SquadSpline': SquadSpline,
+        'CumulativeBSpline': CumulativeBSpline,
+        'times': times,
+        'orientations': orientations,
+        'queries': np.linspace(0.0, n - 1.0, 10**5),
+    }
+    print("\nSplines, {} keyframes".format(n))
+    print("------------------------")
+    for name in ['SquadSpline', 'CumulativeBSpline']:
+        g['spline'] = g[name](times, orientations)
+        build = time_per_call("{}(times, orientations)".format(name), g, number=5, repeat=3)
+        evaluate = time_per_call("spline.evaluate(queries)", g, number=5, repeat=3) / len(g['queries'])
+        insert = time_per_call("spline.insert(np.random.uniform(0, {}), orientations[0])".format(n - 1), g, number=100, repeat=1)
+        print("{:<48} {:>10.1f} ms".format("{}(times, orientations)".format(name), build / 1e3))
+        print("{:<48} {:>10.3f} us".format("  evaluate(), per query time", evaluate))
+        print("{:<48} {:>10.3f} us".format("  insert()", insert))
+
+
+def bench_exp_log():
+    from pyquaternion import QuaternionArray
+    n = 100000
+    g = {
+        'Quaternion': Quaternion,
+        'QuaternionArray': QuaternionArray,
+        'a': QuaternionArray.random(n),
+        'b': QuaternionArray.random(n),
+    }
+    g['pairs'] = list(zip(g['a'][:1000], g['b'][:1000]))
+    print("\nExp and log maps, per element")
+    print("-----------------------------")
+    for name in ['exp', 'log']:
+        loop = time_per_call("[Quaternion.{}(p) for p, _ in pairs]".format(name), g, number=5) / len(g['pairs'])
+        batch = time_per_call("QuaternionArray.{}(a)".format(name), g, number=5) / n
+        print("{:<48} {:>10.3f} us".format("loop of 1000 Quaternion.{}()".format(name), loop))
+        print("{:<48} {:>10.3f} us".format("QuaternionArray.{}(), N={}".format(name, n), batch))
+    for name in ['exp_map', 'log_map', 'sym_exp_map', 'sym_log_map']:
+        loop = time_per_call("[Quaternion.{}(p, q) for p, q in pairs]".format(name), g, number=5) / len(g['pairs'])
+        batch = time_per_call("QuaternionArray.{}(a, b)".format(name), g, number=5) / n
+        print("{:<48} {:>10.3f} us".format("loop of 1000 Quaternion.{}()".format(name), loop))
+        print("{:<48} {:>10.3f} us".format("QuaternionArray.{}(), N={}".format(name, n), batch))
+
+
+def bench_deduplicate(n=10**5):
+    from pyquaternion import QuaternionArray, deduplicate
+    rng = np.random.default_rng(0)
+    unique = QuaternionArray.random(n, rng)
+    repeats = unique.q[rng.integers(0, n // 10, n)] * rng.choice([-1.0, 1.0], (n, 1))
+    g = {
+        'Quaternion': Quaternion,
+        'deduplicate': deduplicate,
+        'small': list(unique[:300]),
+        'unique': unique,
+        'repeats': repeats + rng.normal(size=(n, 4)) * 1e-10,
+    }
+    report("Deduplication", [
+        ("300 rotations, pairwise ==  [before]", "[q for i, q in enumerate(small) if not any(q == p or q == -p for p in small[:i])]"),
+        ("deduplicate(small)", "deduplicate(small)"),
+        ("deduplicate(unique), N={}".format(n), "deduplicate(unique)"),
+        ("deduplicate(unique, 1e-3), N={}".format(n), "deduplicate(unique, 1e-3)"),
+        ("deduplicate(repeats), N={}, 10% distinct".format(n), "deduplicate(repeats)"),
+    ], g, number=1)
+
+
+def bench_distance():
+    from pyquaternion import QuaternionArray
+    n = 100000
+    g = {
+        'Quaternion': Quaternion,
+        'QuaternionArray': QuaternionArray,
+        'a': QuaternionArray.random(n),
+        'b': QuaternionArray.random(n),
+        'p': Quaternion.random(),
+        'q': Quaternion.random(),
+    }
+    report("Distance, single pair", [
+        ("Quaternion.log_map(p, q).norm  [before]", "Quaternion.log_map(p, q).norm"),
+        ("Quaternion.distance(p, q)", "Quaternion.distance(p, q)"),
+        ("min((p - q).norm, (p + q).norm)  [before]", "min((p - q).norm, (p + q).norm)"),
+        ("Quaternion.absolute_distance(p, q)", "Quaternion.absolute_distance(p, q)"),
+        ("Quaternion.sym_log_map(p, q).norm  [before]", "Quaternion.sym_log_map(p, q).norm"),
+        ("Quaternion.sym_distance(p, q)", "Quaternion.sym_distance(p, q)"),
+    ], g, number=5000)
+    print("\nDistance, per pair, N={}".format(n))
+    print("----------------------------")
+    for name in ['distance', 'absolute_distance', 'sym_distance']:
+        batch = time_per_call("QuaternionArray.{}(a, b)".format(name), g, number=5) / n
+        print("{:<48} {:>10.3f} us".format("QuaternionArray.{}()".format(name), batch))
+
+
+def bench_backends():
+    g = {
+        'p': Quaternion.random(),
+        'q': Quaternion.random(),
+        'v': [1.0, 2.0, 3.0],
+    }
+    cases = [
+        ("-q", "-q"),
+        ("p + q", "p + q"),
+        ("p - q", "p - q"),
+        ("p * q", "p * q"),
+        ("p / q", "p / q"),
+        ("q.conjugate", "q.conjugate"),
+        ("q.inverse", "q.inverse"),
+        ("q.norm", "q.norm"),
+        ("q._sum_of_squares()", "q._sum_of_squares()"),
+        ("q.is_unit()", "q.is_unit()"),
+        ("q.rotate(v)", "q.rotate(v)"),
+    ]
+    default = Quaternion.get_backend()
+    try:
+        for name in ['numpy', 'python']:
+            Quaternion.set_backend(name)
+            report("Backend: {}".format(name), cases, g)
+    finally:
+        Quaternion.set_backend(default)
+
+
+def bench_hashing():
+    from pyquaternion import FrozenQuaternion
+    keys = [Quaternion.random() for _ in range(1000)]
+    frozen = [FrozenQuaternion(q) for q in keys]
+    g = {
+        'q': keys[500],
+        'f': frozen[500],
+        'by_quaternion': dict((q, i) for i, q in enumerate(keys)),
+        'by_frozen': dict((f, i) for i, f in enumerate(frozen)),
+        'FrozenQuaternion': FrozenQuaternion,
+    }
+    report("Hashing", [
+        ("hash(q)  [before]", "hash(q)"),
+        ("hash(f)", "hash(f)"),
+        ("by_quaternion[q]  [before]", "by_quaternion[q]"),
+        ("by_frozen[f]", "by_frozen[f]"),
+        ("FrozenQuaternion(q)", "FrozenQuaternion(q)"),
+        ("FrozenQuaternion(f)", "FrozenQuaternion(f)"),
+        ("f.thaw()", "f.thaw()"),
+        ("f.thaw(copy=False)", "f.thaw(copy=False)"),
+    ], g)
+
+
+def bench_index(n=10**6):
+    from pyquaternion import QuaternionArray, RotationIndex, pairwise_top_k
+    refs = QuaternionArray.random(n)
+    print("\nRotation index, N={}".format(n))
+    print("----------------------------")
+    start = time.time()
+    index = RotationIndex(refs)
+    print("{:<48} {:>10.3f} s".format("RotationIndex(refs)", time.time() - start))
+    g = {
+        'index': index,
+        'pairwise_top_k': pairwise_top_k,
+        'refs': refs,
+        'q': Quaternion.random(),
+    }
+    report("Nearest neighbours of one query", [
+        ("pairwise_top_k(q, refs, k=5)  [scan]", "pairwise_top_k(q, refs, k=5)"),
+        ("index.query(q, k=5)", "index.query(q, k=5)"),
+        ("index.query_radius(q, 0.05)", "index.query_radius(q, 0.05)"),
+        ("index.insert(q)", "index.insert(q)"),
+    ], g, number=20)
+
+
+def bench_pairwise():
+    from pyquaternion import QuaternionArray, pairwise_distances, pairwise_top_k
+    n, m = 200, 1000
+    g = {
+        'Quaternion': Quaternion,
+        'pairwise_distances': pairwise_distances,
+        'pairwise_top_k': pairwise_top_k,
+        'a': QuaternionArray.random(n),
+        'b': QuaternionArray.random(m),
+    }
+    g['qa'] = list(g['a'])
+    g['qb'] = list(g['b'])
+    report("Pairwise distances, {} x {}".format(n, m), [
+        ("Quaternion.absolute_distance loop  [before]", "[[Quaternion.absolute_distance(p, q) for q in qb] for p in qa]"),
+        ("pairwise_distances(a, b)", "pairwise_distances(a, b)"),
+        ("pairwise_distances(a, b, 'distance')", "pairwise_distances(a, b, 'distance')"),
+        ("pairwise_top_k(a, b, k=5)", "pairwise_top_k(a, b, k=5)"),
+    ], g, number=1)
+
+
+SECTIONS = {
+    'backends': bench_backends,
+    'construction': bench_construction,
+    'deduplicate': bench_deduplicate,
+    'distance': bench_distance,
+    'explog': bench_exp_log,
+    'hashing': bench_hashing,
+    'index': bench_index,
+    'memory': bench_memory,
+    'multiplication': bench_multiplication,
+    'pairwise': bench_pairwise,
+    'scalar': bench_scalar,
+    'slerp': bench_slerp,
+    'spline': bench_spline,
+    'track': bench_track,
+}
+
+
+if __name__ == '__main__':
+    names = sys.argv[1:] or sorted(SECTIONS)
+    for name in names:
+        SECTIONS[name]()
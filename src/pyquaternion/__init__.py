@@ -1 +1,4 @@
-from .pyquaternion import Quaternion
+from .pyquaternion import Quaternion, FrozenQuaternion
+from .quaternion_array import QuaternionArray
+from .interpolation import SlerpPlan, IntermediatesSequence, OrientationTrack, SquadSpline, CumulativeBSpline
+from .spatial import pairwise_distances, pairwise_top_k, RotationIndex, rotation_keys, deduplicate
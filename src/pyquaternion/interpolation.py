@@ -0,0 +1,558 @@
+"""
+This file is part of the pyquaternion python module
+
+Author:         Kieran Wynn
+Website:        https://github.com/KieranWynn/pyquaternion
+Documentation:  http://kieranwynn.github.io/pyquaternion/
+
+Version:         1.0.0
+License:         The MIT License (MIT)
+
+Copyright (c) 2015 Kieran Wynn
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+interpolation.py - This file defines reusable interpolation plans and tracks for Quaternion objects
+
+"""
+
+from __future__ import absolute_import, division, print_function # Add compatibility for Python 2.7+
+
+from collections import OrderedDict
+from copy import copy
+from math import sqrt, sin, cos
+from numbers import Integral
+
+import numpy as np # Numpy is required for many vector operations
+
+from .pyquaternion import Quaternion
+from .quaternion_array import QuaternionArray, _conjugate, _exp, _log, _multiply, _normalise, _slerp_angle, _slerp_weights
+
+
+def _samples(times, orientations):
+    """Timestamps and normalised orientation elements of a set of samples, sorted by timestamp.
+    """
+    times = np.array(times, dtype=np.float64).reshape(-1)
+    q = QuaternionArray._elements(orientations)
+    if len(times) == 0 or len(times) != len(q):
+        raise ValueError("Expected at least one sample and equal numbers of times and orientations. Got: {} and {}.".format(
+            len(times), len(q)))
+    order = np.argsort(times, kind='mergesort')
+    times = times[order]
+    if np.any(np.diff(times) == 0.0):
+        raise ValueError("Timestamps must be unique")
+    return times, _normalise(q[order])
+
+
+def _locate(times, t):
+    """Segment index i, from sample i to i + 1, and the amount along that segment of each query time in `t`.
+
+    Segments are found by binary search. Query times outside the samples are clamped to the first or last segment end.
+    """
+    i = np.clip(np.searchsorted(times, t, side='right') - 1, 0, len(times) - 2)
+    t0 = times[i]
+    return i, np.clip((t - t0) / (times[i + 1] - t0), 0, 1)
+
+
+def _intermediate_steps(n, include_endpoints=False):
+    """Amounts of `n` evenly spaced intermediates, as used by `Quaternion.intermediates()`
+    """
+    step_size = 1.0 / (n + 1)
+    if include_endpoints:
+        return np.arange(0, n + 2) * step_size
+    return np.arange(1, n + 1) * step_size
+
+
+class SlerpPlan(object):
+    """Spherical Linear Interpolation between a fixed pair of quaternion endpoints.
+
+    Normalisation of the endpoints, the shortest path sign flip, the dot product and the angle
+    between the endpoints are computed once on construction, so that evaluating the interpolation at
+    any number of amounts costs only the amount dependent trigonometry.
+    Results are identical to those of `Quaternion.slerp()` for the same endpoints.
+
+    The endpoint objects themselves are never modified.
+    """
+
+    def __init__(self, q0, q1):
+        """Prepare the interpolation between two endpoints.
+
+        Params:
+            q0: first endpoint rotation as a Quaternion object
+            q1: second endpoint rotation as a Quaternion object
+
+        Note:
+            This feature only makes sense when interpolating between unit quaternions (those lying on the unit radius hypersphere).
+                Endpoints that are not already unit length are interpolated as their normalised equivalents.
+        """
+        p0 = np.array(q0._unit_elements())
+        p1 = np.array(q1._unit_elements())
+        dot = np.dot(p0, p1)
+
+        # If the dot product is negative, slerp won't take the shorter path.
+        # Fix by reversing one quaternion
+        if dot < 0.0:
+            p0 = -p0
+            dot = -dot
+        self._p0 = p0
+        self._p1 = p1
+        self._angle = _slerp_angle(dot)
+        # Python float copies for evaluating a single amount without numpy's per-call overhead
+        self._scalar_terms = (p0.tolist(), p1.tolist()) + tuple(float(x) for x in self._angle)
+
+    def _scalar_elements(self, amount):
+        (a0, a1, a2, a3), (b0, b1, b2, b3), dot, linear, theta_0, sin_theta_0 = self._scalar_terms
+        amount = min(max(amount, 0.0), 1.0)
+        if linear:
+            s0, s1 = 1.0 - amount, amount
+        else:
+            theta = theta_0 * amount
+            sin_theta = sin(theta)
+            s0 = cos(theta) - dot * sin_theta / sin_theta_0
+            s1 = sin_theta / sin_theta_0
+        w, x, y, z = s0 * a0 + s1 * b0, s0 * a1 + s1 * b1, s0 * a2 + s1 * b2, s0 * a3 + s1 * b3
+        n = sqrt(w * w + x * x + y * y + z * z)
+        if n == 0.0:
+            return np.array([w, x, y, z]) # Zero endpoints remain zero
+        return np.array([w / n, x / n, y / n, z / n])
+
+    def elements(self, amounts):
+        """Elements of the interpolated rotations at one or many amounts.
+
+        Params:
+            amounts: interpolation parameter between 0 and 1, as a real number or an array-like of any shape.
+                0 is at the first endpoint and 1 is at the second.
+
+        Returns:
+            A Numpy array of unit quaternion elements, of shape (4,) for a single amount or (..., 4) for an array of amounts.
+        """
+        if np.ndim(amounts) == 0:
+            return self._scalar_elements(float(amounts))
+        amounts = np.clip(np.asarray(amounts, dtype=np.float64), 0, 1)
+        s0, s1 = _slerp_weights(self._angle, amounts)
+        return _normalise(s0[..., np.newaxis] * self._p0 + s1[..., np.newaxis] * self._p1)
+
+    def __call__(self, amount=0.5):
+        """Interpolated rotation at a single amount, as a new Quaternion object. Defaults to the midpoint (0.5).
+        """
+        q = Quaternion.from_array(self.elements(amount), copy=False)
+        q._known_unit = 0
+        return q
+
+    def evaluate(self, amounts):
+        """Interpolated rotations at an (n,) array-like of amounts, as a new QuaternionArray object of length n.
+        """
+        return QuaternionArray._wrap(self.elements(amounts).reshape(-1, 4))
+
+    def intermediates(self, n, include_endpoints=False):
+        """Get `n` evenly spaced rotations between the endpoints in a single vectorised evaluation.
+
+        This is the array equivalent of `Quaternion.intermediates()`.
+
+        Params:
+            n: number of intermediate rotations to include within the interval
+            include_endpoints: [optional] if set to `True`, the intermediates will be 'bookended' by
+                the endpoints, resulting in a length of `n + 2`. Defaults to `False`.
+
+        Returns:
+            A new QuaternionArray object holding the intermediate rotations in order.
+        """
+        return self.evaluate(_intermediate_steps(n, include_endpoints))
+
+    def sequence(self, n, include_endpoints=False, cache_size=64):
+        """Get `n` evenly spaced rotations between the endpoints as a lazily evaluated, random access sequence.
+
+        See `IntermediatesSequence`. The parameters are as for `intermediates()`.
+        """
+        return IntermediatesSequence(self, n, include_endpoints, cache_size)
+
+
+class IntermediatesSequence(object):
+    """Random access sequence of the evenly spaced rotations of `Quaternion.intermediates()`.
+
+    Every element has a closed form, so elements are computed on demand in any order, instead of
+    materialising the whole sequence. The most recently accessed elements are kept in a small
+    least recently used cache, so memory use is constant however long the sequence.
+
+    Supports `len()`, iteration, and indexing by integer (returning a Quaternion object) or by slice
+    (returning a QuaternionArray object, computed in one vectorised pass).
+    """
+
+    def __init__(self, plan, n, include_endpoints=False, cache_size=64):
+        """Initialise a new sequence. Usually created by `Quaternion.intermediates(..., lazy=True)`.
+
+        Params:
+            plan: SlerpPlan object between the two endpoints
+            n: number of intermediate rotations within the interval
+            include_endpoints: [optional] if set to `True`, the sequence is 'bookended' by the endpoints,
+                resulting in a length of `n + 2`. Defaults to `False`.
+            cache_size: [optional] maximum number of computed elements to keep. Defaults to 64.
+        """
+        self._plan = plan
+        self._step_size = 1.0 / (n + 1)
+        self._first = 0 if include_endpoints else 1
+        self._length = n + 2 if include_endpoints else n
+        self._cache_size = cache_size
+        self._cache = OrderedDict()
+
+    def _amounts(self, indices):
+        return (np.asarray(indices) + self._first) * self._step_size
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        # Elements are computed in order without touching the cache, which would only evict recent frames
+        for i in range(self._length):
+            yield self._plan((i + self._first) * self._step_size)
+
+    def __getitem__(self, index):
+        """Get a single Quaternion by integer index, or a QuaternionArray by slice.
+
+        Raises:
+            IndexError: if an integer index is out of range
+            TypeError: for any other type of index
+        """
+        if isinstance(index, slice):
+            return self._plan.evaluate(self._amounts(np.arange(*index.indices(self._length))))
+        if not isinstance(index, Integral):
+            raise TypeError("Sequence indices must be integers or slices, not {}".format(type(index).__name__))
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Sequence index out of range")
+        try:
+            q = self._cache.pop(index)
+        except KeyError:
+            q = self._plan((index + self._first) * self._step_size)
+            if len(self._cache) >= self._cache_size > 0:
+                self._cache.popitem(last=False) # Evict the least recently used element
+        if self._cache_size > 0:
+            self._cache[index] = q # (Re)insert as the most recently used element
+        return copy(q) # Callers may modify the result without affecting the cache
+
+    def to_array(self):
+        """Get the whole sequence as a QuaternionArray object, computed in one vectorised pass.
+        """
+        return self._plan.evaluate(self._amounts(np.arange(self._length)))
+
+
+class OrientationTrack(object):
+    """Orientation as a function of time, interpolated from timestamped samples.
+
+    Between consecutive samples the orientation is given by `Quaternion.slerp()`. The angle data of every
+    segment is computed once on construction, the segment containing each query time is found by binary
+    search, and arrays of query times are evaluated in a single vectorised pass.
+
+    Query times before the first or after the last sample are clamped to the first or last orientation.
+
+    Samples are stored with their signs chosen so that consecutive samples lie in the same hemisphere,
+    which makes the interpolated elements continuous in time. Each interpolated orientation is therefore
+    the same rotation as the `Quaternion.slerp()` of its segment, but may have the opposite sign.
+    """
+
+    def __init__(self, times, orientations):
+        """Initialise a new OrientationTrack object.
+
+        Params:
+            times: (N,) array-like of real timestamps, which need not be sorted
+            orientations: the N orientations at those times, as a QuaternionArray object,
+                a sequence of Quaternion objects or an (N, 4) array-like of elements
+
+        Raises:
+            ValueError: if there are no samples, the number of times and orientations differ, or timestamps are repeated
+
+        Note:
+            This feature only makes sense when interpolating between unit quaternions (those lying on the unit radius hypersphere).
+                Orientations that are not already unit length are interpolated as their normalised equivalents.
+        """
+        times, q = _samples(times, orientations)
+        dot = np.einsum('ij,ij->i', q[:-1], q[1:])
+
+        # Slerp takes the shorter path by reversing one endpoint of a segment where the dot product is negative.
+        # Reversing every later sample instead gives the same rotations, while keeping the track continuous
+        # across sample times, so each segment then needs no further sign flip.
+        flip = np.cumprod(np.where(dot < 0.0, -1.0, 1.0))
+        q[1:] *= flip[:, np.newaxis]
+        self._angle = _slerp_angle(np.abs(dot))
+        self._times = times
+        self._q = q
+
+    @classmethod
+    def from_pairs(cls, pairs):
+        """Initialise from an iterable of (timestamp, Quaternion) pairs.
+        """
+        pairs = list(pairs)
+        return cls([t for t, _ in pairs], [q for _, q in pairs])
+
+    def __len__(self):
+        return len(self._times)
+
+    @property
+    def times(self):
+        """Sorted timestamps of the samples, as an (N,) Numpy array copy.
+        """
+        return self._times.copy()
+
+    @property
+    def orientations(self):
+        """Normalised orientations of the samples in timestamp order, as a new QuaternionArray object.
+
+        Each has the sign used for interpolation, so may be the negative of the orientation it was built from.
+        """
+        return QuaternionArray(self._q)
+
+    def elements(self, times):
+        """Elements of the interpolated orientations at one or many query times.
+
+        Params:
+            times: query time as a real number, or an array-like of query times of any shape
+
+        Returns:
+            A Numpy array of unit quaternion elements, of shape (4,) for a single time or (..., 4) for an array of times.
+        """
+        t = np.asarray(times, dtype=np.float64)
+        if len(self._times) == 1:
+            return np.broadcast_to(self._q[0], t.shape + (4,)).copy()
+        i, amount = _locate(self._times, t)
+        s0, s1 = _slerp_weights(tuple(a[i] for a in self._angle), amount)
+        # Gather the segment endpoints with np.take and combine them in place, to limit temporaries for long queries
+        out = np.take(self._q, i, axis=0)
+        out *= s0[..., np.newaxis]
+        end = np.take(self._q, i + 1, axis=0)
+        end *= s1[..., np.newaxis]
+        out += end
+        return _normalise(out)
+
+    def __call__(self, time):
+        """Interpolated orientation at a single query time, as a new Quaternion object.
+        """
+        q = Quaternion.from_array(self.elements(time), copy=False)
+        q._known_unit = 0
+        return q
+
+    def evaluate(self, times):
+        """Interpolated orientations at an (M,) array-like of query times, as a new QuaternionArray object of length M.
+
+        Use this to resample the whole track to a new clock in a single call.
+        """
+        return QuaternionArray._wrap(self.elements(times).reshape(-1, 4))
+
+
+def _slerp_signed(p0, p1, amount):
+    """Slerp between broadcastable (..., 4) arrays of unit quaternions, without the shortest path sign flip.
+
+    Spline construction keeps consecutive quaternions in the same hemisphere itself,
+    and must interpolate its control quaternions exactly as given.
+    """
+    dot = np.clip(np.einsum('...i,...i->...', p0, p1), -1.0, 1.0)
+    s0, s1 = _slerp_weights(_slerp_angle(dot), amount)
+    return _normalise(s0[..., np.newaxis] * p0 + s1[..., np.newaxis] * p1)
+
+
+class _KeyframeSpline(object):
+    """Common keyframe storage, incremental updates and batched evaluation of the spherical splines below.
+
+    Subclasses store per-keyframe control data, computed by `_refresh(lo, hi)` for everything that depends
+    on keyframes lo to hi - 1, and evaluate segments in `_evaluate(i, u)`.
+    """
+
+    def __init__(self, times, orientations):
+        """Initialise from keyframe orientations at given times.
+
+        Params:
+            times: (N,) array-like of unique real keyframe times, which need not be sorted
+            orientations: the N keyframe orientations, as a QuaternionArray object,
+                a sequence of Quaternion objects or an (N, 4) array-like of elements
+
+        Raises:
+            ValueError: if there are no keyframes, the number of times and orientations differ, or times are repeated
+
+        Note:
+            This feature only makes sense when interpolating between unit quaternions (those lying on the unit radius hypersphere).
+                Orientations that are not already unit length are interpolated as their normalised equivalents.
+        """
+        self._times, self._q = _samples(times, orientations)
+        self._allocate()
+        self._refresh(0, len(self._times))
+
+    def __len__(self):
+        return len(self._times)
+
+    @property
+    def times(self):
+        """Sorted keyframe times, as an (N,) Numpy array copy.
+        """
+        return self._times.copy()
+
+    @property
+    def orientations(self):
+        """Normalised keyframe orientations in time order, as a new QuaternionArray object.
+        """
+        return QuaternionArray(self._q)
+
+    def insert(self, time, orientation):
+        """Add a keyframe.
+
+        Only the control data of the neighbouring keyframes is recomputed, not the whole spline.
+
+        Params:
+            time: real keyframe time, which must differ from the times of all existing keyframes
+            orientation: keyframe orientation as a Quaternion object or a 4-element array-like
+
+        Raises:
+            ValueError: if a keyframe already exists at `time`
+        """
+        k = np.searchsorted(self._times, time)
+        if k < len(self._times) and self._times[k] == time:
+            raise ValueError("A keyframe already exists at time {}".format(time))
+        q = _normalise(QuaternionArray._elements(orientation)).reshape(4)
+        self._times = np.insert(self._times, k, time)
+        self._q = np.insert(self._q, k, q, axis=0)
+        self._insert(k)
+        self._refresh(k, k + 1)
+
+    def elements(self, times):
+        """Elements of the interpolated orientations at one or many times.
+
+        Params:
+            times: time as a real number, or an array-like of times of any shape.
+                Times outside the keyframes are clamped to the first or last keyframe time.
+
+        Returns:
+            A Numpy array of unit quaternion elements, of shape (4,) for a single time or (..., 4) for an array of times.
+        """
+        t = np.asarray(times, dtype=np.float64)
+        if len(self._times) == 1:
+            return np.broadcast_to(self._q[0], t.shape + (4,)).copy()
+        i, u = _locate(self._times, t)
+        return self._evaluate(i, u)
+
+    def __call__(self, time):
+        """Interpolated orientation at a single time, as a new Quaternion object.
+        """
+        q = Quaternion.from_array(self.elements(time), copy=False)
+        q._known_unit = 0
+        return q
+
+    def evaluate(self, times):
+        """Interpolated orientations at an (M,) array-like of times, as a new QuaternionArray object of length M.
+        """
+        return QuaternionArray._wrap(self.elements(times).reshape(-1, 4))
+
+
+class SquadSpline(_KeyframeSpline):
+    """Spherical quadrangle (SQUAD) interpolation through keyframe orientations.
+
+    The path passes through every keyframe and, unlike piecewise `Quaternion.slerp()`, has continuous angular velocity.
+    Within the segment from keyframe i to i + 1, at amount u:
+
+        squad = slerp(slerp(q_i, q_i+1, u), slerp(s_i, s_i+1, u), 2u(1 - u))
+
+    where the control quaternion of each interior keyframe is
+
+        s_i = q_i * exp(-(log(q_i^-1 * q_i+1) + log(q_i^-1 * q_i-1)) / 4)
+
+    and the first and last keyframes are their own control quaternions.
+    Control quaternions are computed once and cached, and inserting a keyframe recomputes only those of its neighbours.
+
+    The amount is linear in time within each segment, so keyframes should be roughly evenly spaced in time for the
+    angular velocity to be continuous. Each segment takes the shorter path between its keyframes, so the elements of
+    the result may change sign at keyframes, while the rotation they represent is continuous.
+    """
+
+    def _allocate(self):
+        n = len(self._times)
+        self._sign = np.ones(max(n - 1, 0)) # Sign applied to the end of each segment, to take the shorter path
+        self._s = np.empty((n, 4))
+
+    def _insert(self, k):
+        self._sign = np.insert(self._sign, min(k, len(self._sign)), 1.0)
+        self._s = np.insert(self._s, k, 0.0, axis=0)
+
+    def _refresh(self, lo, hi):
+        q = self._q
+        n = len(q)
+        # Segments starting at keyframes lo - 1 to hi - 1
+        a, b = max(lo - 1, 0), min(hi, n - 1)
+        if a < b:
+            dot = np.einsum('ij,ij->i', q[a:b], q[a + 1:b + 1])
+            self._sign[a:b] = np.where(dot < 0.0, -1.0, 1.0)
+        # Control quaternions of keyframes lo - 1 to hi, of which only interior keyframes are computed
+        c, d = max(lo - 1, 0), min(hi + 1, n)
+        self._s[c:d] = q[c:d]
+        c, d = max(c, 1), min(d, n - 1)
+        if c < d:
+            inverse = _conjugate(q[c:d])
+            following = _log(_multiply(inverse, self._sign[c:d, np.newaxis] * q[c + 1:d + 1]))
+            preceding = _log(_multiply(inverse, self._sign[c - 1:d - 1, np.newaxis] * q[c - 1:d - 1]))
+            self._s[c:d] = _normalise(_multiply(q[c:d], _exp(-0.25 * (following + preceding))))
+
+    def _evaluate(self, i, u):
+        sign = self._sign[i][..., np.newaxis]
+        p = _slerp_signed(self._q[i], sign * self._q[i + 1], u)
+        s = _slerp_signed(self._s[i], sign * self._s[i + 1], u)
+        return _slerp_signed(p, s, 2.0 * u * (1.0 - u))
+
+
+class CumulativeBSpline(_KeyframeSpline):
+    """Cumulative cubic B-spline on the unit quaternion sphere, with the keyframes as control points.
+
+    The path is twice continuously differentiable, so has continuous angular velocity and acceleration,
+    but approximates rather than passes through the keyframes. Within the segment from keyframe i to i + 1, at amount u:
+
+        q(u) = q_i-1 * exp(B1(u) w_i) * exp(B2(u) w_i+1) * exp(B3(u) w_i+2)
+
+    where w_k = log(q_k-1^-1 * q_k) is the relative rotation between consecutive keyframes, taking the shorter path,
+    and B1, B2 and B3 are the cumulative cubic B-spline basis functions. The first and last keyframes are repeated
+    to provide the control points beyond either end.
+    Relative rotations are computed once and cached, and inserting a keyframe recomputes only those of its neighbours.
+
+    The amount is linear in time within each segment, so keyframes should be roughly evenly spaced in time.
+    """
+
+    def _allocate(self):
+        self._w = np.zeros((len(self._times) + 1, 4)) # w_0 and w_N relate the repeated end keyframes, so are zero
+
+    def _insert(self, k):
+        self._w = np.insert(self._w, k, 0.0, axis=0)
+
+    def _refresh(self, lo, hi):
+        q = self._q
+        n = len(q)
+        # Relative rotations w_lo to w_hi, of which w_0 and w_n remain zero
+        a, b = max(lo, 1), min(hi + 1, n)
+        if a < b:
+            relative = _multiply(_conjugate(q[a - 1:b - 1]), q[a:b])
+            relative[relative[:, 0] < 0.0] *= -1.0
+            self._w[a:b] = _log(_normalise(relative))
+        self._w[0] = 0.0
+        self._w[n] = 0.0
+
+    def _evaluate(self, i, u):
+        uu = u * u
+        uuu = uu * u
+        weights = [
+            (5.0 + 3.0 * u - 3.0 * uu + uuu) / 6.0,
+            (1.0 + 3.0 * u + 3.0 * uu - 2.0 * uuu) / 6.0,
+            uuu / 6.0]
+        out = self._q[np.maximum(i - 1, 0)]
+        for j, b in enumerate(weights):
+            out = _multiply(out, _exp(b[..., np.newaxis] * self._w[i + j]))
+        return _normalise(out)
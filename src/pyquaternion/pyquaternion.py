@@ -34,11 +34,125 @@ quaternion.py - This file defines the core Quaternion class
 
 from __future__ import absolute_import, division, print_function # Add compatibility for Python 2.7+
 
-from math import sqrt, pi, sin, cos, asin, acos, atan2, exp, log
-from copy import deepcopy
+from math import sqrt, pi, sin, cos, asin, acos, atan2, exp, log, hypot
+from copy import copy, deepcopy
+from numbers import Real
 import numpy as np # Numpy is required for many vector operations
 
 
+# Element-wise signs of the conjugate
+_CONJUGATE = np.array([1.0, -1.0, -1.0, -1.0])
+
+
+# Single quaternion arithmetic backends, see `Quaternion.set_backend()`.
+# Each operates on numpy 4-arrays of elements, returning a numpy 4-array from multiply and a float from sum_of_squares.
+# Element-wise operations such as negation, addition and conjugation are a single ufunc call, which is cheaper
+# than unpacking the elements, so they are not part of the backends.
+
+class _PythonBackend(object):
+    """Unpacks the elements into Python floats, avoiding numpy's per-call overhead on 4-element arrays.
+    """
+    name = 'python'
+
+    @staticmethod
+    def multiply(p, q):
+        """Hamilton product, expanded into its 16 scalar terms.
+        """
+        p0, p1, p2, p3 = p.tolist()
+        q0, q1, q2, q3 = q.tolist()
+        return np.array([
+            p0 * q0 - p1 * q1 - p2 * q2 - p3 * q3,
+            p0 * q1 + p1 * q0 + p2 * q3 - p3 * q2,
+            p0 * q2 - p1 * q3 + p2 * q0 + p3 * q1,
+            p0 * q3 + p1 * q2 - p2 * q1 + p3 * q0])
+
+    @staticmethod
+    def sum_of_squares(p):
+        p0, p1, p2, p3 = p.tolist()
+        return p0 * p0 + p1 * p1 + p2 * p2 + p3 * p3
+
+
+class _NumpyBackend(object):
+    """Applies numpy operations to the element arrays directly.
+    """
+    name = 'numpy'
+
+    # Left multiplication matrices of the basis quaternions 1, i, j and k, flattened so that
+    # np.dot(p, _LEFT).reshape(4, 4) is the matrix representation of p used by `Quaternion._q_matrix()`
+    _LEFT = np.array([
+        [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]],
+        [[0, -1, 0, 0], [1, 0, 0, 0], [0, 0, 0, -1], [0, 0, 1, 0]],
+        [[0, 0, -1, 0], [0, 0, 0, 1], [1, 0, 0, 0], [0, -1, 0, 0]],
+        [[0, 0, 0, -1], [0, 0, -1, 0], [0, 1, 0, 0], [1, 0, 0, 0]]], dtype=np.float64).reshape(4, 16)
+
+    @staticmethod
+    def multiply(p, q):
+        return np.dot(np.dot(p, _NumpyBackend._LEFT).reshape(4, 4), q)
+
+    @staticmethod
+    def sum_of_squares(p):
+        return np.dot(p, p)
+
+
+_BACKENDS = {backend.name: backend for backend in (_PythonBackend, _NumpyBackend)}
+
+
+# Unit quaternion products accumulate rounding error in their norm, so a product is only
+# trusted to be of unit length for this many products since its inputs were last normalised.
+_UNIT_PRODUCT_LIMIT = 4
+
+# Absolute tolerance of `Quaternion.__eq__()`, below which every element of a divisor is taken to be zero
+_ZERO_TOLERANCE = 1.0e-14
+
+
+def _copy_result(value):
+    """Copy a cached derived quantity, so that callers can never modify the cached value itself.
+    """
+    if isinstance(value, tuple):
+        return tuple(_copy_result(v) for v in value)
+    if isinstance(value, (np.ndarray, Quaternion)):
+        return copy(value)
+    return value
+
+
+def _cached_property(method):
+    """Property decorator for derived quantities that are stored in the per-instance cache when it is enabled.
+
+    See `Quaternion.enable_cache()`
+    """
+    key = method.__name__
+
+    def getter(self):
+        cache = self._cache
+        if cache is None:
+            return method(self)
+        if key not in cache:
+            cache[key] = method(self)
+        return _copy_result(cache[key])
+
+    getter.__doc__ = method.__doc__
+    return property(getter)
+
+
+def _log_norm(w, v_norm, q_norm):
+    """Norm of the logarithm of a quaternion, given its scalar part, vector norm and norm, as in `Quaternion.log()`
+    """
+    tolerance = 1e-17
+    if q_norm < tolerance:
+        # 0 quaternion - undefined
+        return float('nan')
+    if v_norm < tolerance:
+        # real quaternions - no imaginary part
+        return abs(log(q_norm))
+    return hypot(log(q_norm), acos(min(max(w / q_norm, -1.0), 1.0)))
+
+
+def _is_quaternion_array(obj):
+    """Check for a batched QuaternionArray operand, which must be left to handle mixed arithmetic itself.
+    """
+    from .quaternion_array import QuaternionArray # Deferred to avoid a circular import
+    return isinstance(obj, QuaternionArray)
+
 class Quaternion(object):
     """Class to represent a 4-dimensional complex number or quaternion.
 
@@ -50,6 +164,15 @@ class Quaternion(object):
 
     """
 
+    # Instances carry no __dict__, only these attributes:
+    #   _q: the elements, exposed as `q`
+    #   _known_unit: None if unknown, otherwise the number of products since the elements were known to be unit length.
+    #       Cleared whenever the elements array is handed out, since it can then be modified in place.
+    #   _cache: derived quantities, stored only when enabled with enable_cache()
+    __slots__ = ('_q', '_known_unit', '_cache', '__weakref__')
+
+    _backend = _PythonBackend # Implementation of single quaternion arithmetic, shared by all instances
+
     def __init__(self, *args, **kwargs):
         """Initialise a new Quaternion object.
 
@@ -58,6 +181,8 @@ class Quaternion(object):
         http://kieranwynn.github.io/pyquaternion/initialisation/
 
         """
+        self._known_unit = None
+        self._cache = None
         s = len(args)
         if s == 0:
             # No positional arguments supplied
@@ -94,6 +219,7 @@ class Quaternion(object):
                         )
                     angle = kwargs.get('radians') or self.to_radians(kwargs.get('degrees')) or kwargs.get('angle') or 0.0
                     self.q = Quaternion._from_axis_angle(axis, angle).q
+                    self._known_unit = 0
                 elif "array" in kwargs:
                     self.q = self._validate_number_sequence(kwargs["array"], 4)
                 elif "matrix" in kwargs:
@@ -114,7 +240,10 @@ class Quaternion(object):
         elif s == 1:
             # Single positional argument supplied
             if isinstance(args[0], Quaternion):
-                self.q = args[0].q
+                # The elements are shared, which clears the unit mark of both objects (see `q`).
+                # The read-only elements of a FrozenQuaternion are copied, so that the new object can be modified
+                q = args[0].q
+                self.q = q if q.flags.writeable else np.array(q)
                 return
             if args[0] is None:
                 raise TypeError("Object cannot be initialised from {}".format(type(args[0])))
@@ -132,8 +261,92 @@ class Quaternion(object):
             # More than one positional argument supplied
             self.q = self._validate_number_sequence(args, 4)
 
+    @classmethod
+    def from_array(cls, array, copy=True):
+        """Trusted initialisation from a numpy array of elements, bypassing all validation.
+
+        This is a fast path for code that already holds quaternion elements in the correct form,
+        e.g. the result of a numpy operation. No checks are made on the input.
+
+        Params:
+            array: a numpy 4-array of float64 elements in the order [w, x, y, z]
+            copy: [optional] if set to `False`, the new object adopts `array` as its element storage
+                instead of copying it, so later changes to one are seen by the other. Defaults to `True`.
+
+        Returns:
+            A new Quaternion object holding the given elements
+        """
+        q = cls.__new__(cls)
+        q._q = np.array(array, dtype=np.float64) if copy else array
+        q._known_unit = None
+        q._cache = None
+        return q
+
+    @property
+    def q(self):
+        self._known_unit = None # The returned array may be modified in place
+        return self._q
+
+    @q.setter
+    def q(self, value):
+        self._q = value
+        self._invalidate()
+
+    # Caching of derived quantities
+    def enable_cache(self):
+        """Store derived quantities of this object after they are first computed.
+
+        Repeated reads of `norm`, `inverse`, `rotation_matrix`, `transformation_matrix`, `yaw_pitch_roll`,
+        `polar_decomposition`, `axis` and `angle` are then answered from the cache, until the object is modified.
+
+        Note:
+            The cache is cleared whenever the elements are modified through `q`, item assignment or `vector`.
+            Writing directly into the elements array (e.g. `my_quaternion.q[0] = 1.0`) cannot be detected,
+            so do not modify a cached object in this way.
+        """
+        if self._cache is None:
+            self._cache = {}
+
+    def disable_cache(self):
+        """Stop storing derived quantities of this object and discard any that are stored.
+        """
+        self._cache = None
+
+    def _invalidate(self):
+        self._known_unit = None
+        if self._cache:
+            self._cache.clear()
+
+    @staticmethod
+    def set_backend(name):
+        """Select how single quaternion arithmetic is computed by all Quaternion objects.
+
+        Params:
+            name: either of the following:
+                'python' (default): unpack the four elements into Python floats and compute with scalar arithmetic.
+                    This avoids numpy's fixed per-call overhead, which dominates for 4-element arrays.
+                'numpy': apply numpy operations to the element arrays.
+
+        Affects Hamilton products, and the sums of squares used by inversion, unit checks and `_fast_normalise()`.
+        Element-wise operations such as negation, addition and conjugation, and the `norm` property, are computed
+        by numpy in either case. Results are numpy arrays either way, so the public API is unchanged.
+
+        Raises:
+            ValueError: if `name` is not a known backend
+        """
+        try:
+            Quaternion._backend = _BACKENDS[name]
+        except KeyError:
+            raise ValueError("Unknown backend '{}'. Expected one of: {}".format(name, ", ".join(sorted(_BACKENDS))))
+
+    @staticmethod
+    def get_backend():
+        """Name of the backend currently used for single quaternion arithmetic. See `set_backend()`
+        """
+        return Quaternion._backend.name
+
     def __hash__(self):
-        return hash(tuple(self.q))
+        return hash(tuple(self._q))
 
     def _validate_number_sequence(self, seq, n):
         """Validate a sequence to be of a certain length and ensure it's a numpy array of floats.
@@ -231,7 +444,8 @@ class Quaternion(object):
             q *= 0.5 / sqrt(t)
             return q
 
-        return cls(array=trace_method(R))
+        # Not marked as unit length, since the matrix is only orthogonal to within the given tolerance
+        return cls.from_array(trace_method(R), copy=False)
 
     # Initialise from axis-angle
     @classmethod
@@ -255,29 +469,46 @@ class Quaternion(object):
         r = cos(theta)
         i = axis * sin(theta)
 
-        return cls(r, i[0], i[1], i[2])
+        q = cls.from_array(np.hstack((r, i)), copy=False)
+        q._known_unit = 0
+        return q
 
     @classmethod
-    def random(cls):
+    def random(cls, n=None, rng=None):
         """Generate a random unit quaternion.
 
         Uniformly distributed across the rotation space
         As per: http://planning.cs.uiuc.edu/node198.html
+
+        Params:
+            n: [optional] number of quaternions to generate. If given, they are generated in
+                one vectorised pass and returned as a QuaternionArray of length `n`.
+            rng: [optional] a `numpy.random.Generator` (or `numpy.random.RandomState`) to draw from,
+                e.g. to give parallel workers independent, reproducible streams.
+                Defaults to numpy's global random state.
+
+        Returns:
+            A new Quaternion object, or a QuaternionArray object if `n` is given.
         """
-        r1, r2, r3 = np.random.random(3)
+        if n is not None:
+            from .quaternion_array import QuaternionArray # Deferred to avoid a circular import
+            return QuaternionArray.random(n, rng)
+        r1, r2, r3 = (np.random if rng is None else rng).random(3)
 
         q1 = sqrt(1.0 - r1) * (sin(2 * pi * r2))
         q2 = sqrt(1.0 - r1) * (cos(2 * pi * r2))
         q3 = sqrt(r1)       * (sin(2 * pi * r3))
         q4 = sqrt(r1)       * (cos(2 * pi * r3))
 
-        return cls(q1, q2, q3, q4)
+        q = cls.from_array(np.array([q1, q2, q3, q4]), copy=False)
+        q._known_unit = 0
+        return q
 
     # Representation
     def __str__(self):
         """An informal, nicely printable string representation of the Quaternion object.
         """
-        return "{:.3f} {:+.3f}i {:+.3f}j {:+.3f}k".format(self.q[0], self.q[1], self.q[2], self.q[3])
+        return "{:.3f} {:+.3f}i {:+.3f}j {:+.3f}k".format(self._q[0], self._q[1], self._q[2], self._q[3])
 
     def __repr__(self):
         """The 'official' string representation of the Quaternion object.
@@ -285,7 +516,7 @@ class Quaternion(object):
         This is a string representation of a valid Python expression that could be used
         to recreate an object with the same value (given an appropriate environment)
         """
-        return "Quaternion({!r}, {!r}, {!r}, {!r})".format(self.q[0], self.q[1], self.q[2], self.q[3])
+        return "{}({!r}, {!r}, {!r}, {!r})".format(type(self).__name__, self._q[0], self._q[1], self._q[2], self._q[3])
 
     def __format__(self, formatstr):
         """Inserts a customisable, nicely printable string representation of the Quaternion object
@@ -301,7 +532,7 @@ class Quaternion(object):
             "{:" + formatstr +"}i " + \
             "{:" + formatstr +"}j " + \
             "{:" + formatstr +"}k"
-        return string.format(self.q[0], self.q[1], self.q[2], self.q[3])
+        return string.format(self._q[0], self._q[1], self._q[2], self._q[3])
 
     # Type Conversion
     def __int__(self):
@@ -311,7 +542,7 @@ class Quaternion(object):
         component and rounding to the next integer value towards zero.
         Note: to round to the closest integer, use int(round(float(q)))
         """
-        return int(self.q[0])
+        return int(self._q[0])
 
     def __float__(self):
         """Implements type conversion to float.
@@ -319,7 +550,7 @@ class Quaternion(object):
         Truncates the Quaternion object by only considering the real
         component.
         """
-        return float(self.q[0])
+        return float(self._q[0])
 
     def __complex__(self):
         """Implements type conversion to complex.
@@ -329,7 +560,7 @@ class Quaternion(object):
         This is equivalent to a projection from the 4-dimensional hypersphere
         to the 2-dimensional complex plane.
         """
-        return complex(self.q[0], self.q[1])
+        return complex(self._q[0], self._q[1])
 
     def __bool__(self):
         return not (self == Quaternion(0.0))
@@ -347,9 +578,9 @@ class Quaternion(object):
         """
         if isinstance(other, Quaternion):
             r_tol = 1.0e-13
-            a_tol = 1.0e-14
+            a_tol = _ZERO_TOLERANCE
             try:
-                isEqual = np.allclose(self.q, other.q, rtol=r_tol, atol=a_tol)
+                isEqual = np.allclose(self._q, other._q, rtol=r_tol, atol=a_tol)
             except AttributeError:
                 raise AttributeError("Error in internal quaternion representation means it cannot be compared like a numpy array.")
             return isEqual
@@ -357,16 +588,27 @@ class Quaternion(object):
 
     # Negation
     def __neg__(self):
-        return self.__class__(array= -self.q)
+        result = self.from_array(-self._q, copy=False)
+        result._known_unit = self._known_unit
+        return result
 
     # Absolute value
     def __abs__(self):
         return self.norm
 
+    # Real scalar operands are applied to the elements directly, rather than promoted to Quaternion objects.
+    # Other operands are converted with the Quaternion constructor.
+
     # Addition
     def __add__(self, other):
         if isinstance(other, Quaternion):
-            return self.__class__(array=self.q + other.q)
+            return self.from_array(self._q + other._q, copy=False)
+        if isinstance(other, Real):
+            q = self._q.copy()
+            q[0] += float(other)
+            return self.from_array(q, copy=False)
+        if _is_quaternion_array(other):
+            return NotImplemented
         return self + self.__class__(other)
 
     def __iadd__(self, other):
@@ -377,49 +619,82 @@ class Quaternion(object):
 
     # Subtraction
     def __sub__(self, other):
+        if isinstance(other, Real):
+            q = self._q.copy()
+            q[0] -= float(other)
+            return self.from_array(q, copy=False)
         return self + (-other)
 
     def __isub__(self, other):
-        return self + (-other)
+        return self - other
 
     def __rsub__(self, other):
+        if isinstance(other, Real):
+            q = -self._q
+            q[0] += float(other)
+            return self.from_array(q, copy=False)
         return -(self - other)
 
     # Multiplication
     def __mul__(self, other):
         if isinstance(other, Quaternion):
-            return self.__class__(array=np.dot(self._q_matrix(), other.q))
+            result = self.from_array(self._backend.multiply(self._q, other._q), copy=False)
+            if self._known_unit is not None and other._known_unit is not None:
+                depth = self._known_unit + other._known_unit + 1
+                if depth <= _UNIT_PRODUCT_LIMIT:
+                    result._known_unit = depth
+            return result
+        if isinstance(other, Real):
+            return self.from_array(self._q * float(other), copy=False)
+        if _is_quaternion_array(other):
+            return NotImplemented
         return self * self.__class__(other)
 
     def __imul__(self, other):
         return self * other
 
     def __rmul__(self, other):
+        if isinstance(other, Real):
+            return self.from_array(float(other) * self._q, copy=False)
         return self.__class__(other) * self
 
     def __matmul__(self, other):
         if isinstance(other, Quaternion):
-            return self.q.__matmul__(other.q)
+            return self._q.__matmul__(other._q)
+        if isinstance(other, Real):
+            return self._q[0] * float(other)
         return self.__matmul__(self.__class__(other))
 
     def __imatmul__(self, other):
         return self.__matmul__(other)
 
     def __rmatmul__(self, other):
+        if isinstance(other, Real):
+            return float(other) * self._q[0]
         return self.__class__(other).__matmul__(self)
 
     # Division
     def __div__(self, other):
         if isinstance(other, Quaternion):
-            if other == self.__class__(0.0):
+            # Equivalent to `other == Quaternion(0.0)`
+            if all(abs(x) <= _ZERO_TOLERANCE for x in other._q.tolist()):
                 raise ZeroDivisionError("Quaternion divisor must be non-zero")
             return self * other.inverse
+        if isinstance(other, Real):
+            other = float(other)
+            if abs(other) <= _ZERO_TOLERANCE:
+                raise ZeroDivisionError("Quaternion divisor must be non-zero")
+            return self.from_array(self._q / other, copy=False)
+        if _is_quaternion_array(other):
+            return NotImplemented
         return self.__div__(self.__class__(other))
 
     def __idiv__(self, other):
         return self.__div__(other)
 
     def __rdiv__(self, other):
+        if isinstance(other, Real):
+            return self.from_array(float(other) * self.inverse._q, copy=False)
         return self.__class__(other) * self.inverse
 
     def __truediv__(self, other):
@@ -441,9 +716,9 @@ class Quaternion(object):
                 n, theta = self.polar_decomposition
             except ZeroDivisionError:
                 # quaternion is a real number (no vector or imaginary part)
-                return Quaternion(scalar=self.scalar ** exponent)
-            return (self.norm ** exponent) * Quaternion(scalar=cos(exponent * theta), vector=(n * sin(exponent * theta)))
-        return Quaternion(self)
+                return self.from_array(np.array([self.scalar ** exponent, 0.0, 0.0, 0.0]), copy=False)
+            return (self.norm ** exponent) * self.from_array(np.hstack((cos(exponent * theta), n * sin(exponent * theta))), copy=False)
+        return self.from_array(self._q)
 
     def __ipow__(self, other):
         return self ** other
@@ -453,10 +728,10 @@ class Quaternion(object):
 
     # Quaternion Features
     def _vector_conjugate(self):
-        return np.hstack((self.q[0], -self.q[1:4]))
+        return self._q * _CONJUGATE
 
     def _sum_of_squares(self):
-        return np.dot(self.q, self.q)
+        return self._backend.sum_of_squares(self._q)
 
     @property
     def conjugate(self):
@@ -467,9 +742,11 @@ class Quaternion(object):
         Returns:
             A new Quaternion object clone with its vector part negated
         """
-        return self.__class__(scalar=self.scalar, vector=-self.vector)
+        result = self.from_array(self._vector_conjugate(), copy=False)
+        result._known_unit = self._known_unit
+        return result
 
-    @property
+    @_cached_property
     def inverse(self):
         """Inverse of the quaternion object, encapsulated in a new instance.
 
@@ -480,11 +757,11 @@ class Quaternion(object):
         """
         ss = self._sum_of_squares()
         if ss > 0:
-            return self.__class__(array=(self._vector_conjugate() / ss))
+            return self.from_array(self._vector_conjugate() / ss, copy=False)
         else:
             raise ZeroDivisionError("a zero quaternion (0 + 0i + 0j + 0k) cannot be inverted")
 
-    @property
+    @_cached_property
     def norm(self):
         """L2 norm of the quaternion 4-vector.
 
@@ -494,7 +771,7 @@ class Quaternion(object):
         Returns:
             A scalar real number representing the square root of the sum of the squares of the elements of the quaternion.
         """
-        mag_squared = self._sum_of_squares()
+        mag_squared = np.dot(self._q, self._q) # Reduced by numpy in every backend, to match np.linalg.norm() exactly
         return sqrt(mag_squared)
 
     @property
@@ -504,20 +781,35 @@ class Quaternion(object):
     def _normalise(self):
         """Object is guaranteed to be a unit quaternion after calling this
         operation UNLESS the object is equivalent to Quaternion(0)
+
+        Objects already known to be of unit length are not checked again. Otherwise the object is given its own
+        elements array, so that the unit length it is marked with cannot be changed through another object.
         """
+        if self._known_unit is not None:
+            return
         if not self.is_unit():
             n = self.norm
-            if n > 0:
-                self.q = self.q / n
+            if n == 0:
+                return
+            self.q = self._q / n
+        else:
+            # The elements may be shared with another object, through which they could later be modified
+            self._q = self._q.copy()
+        self._known_unit = 0
 
     def _fast_normalise(self):
         """Normalise the object to a unit quaternion using a fast approximation method if appropriate.
 
         Object is guaranteed to be a quaternion of approximately unit length
         after calling this operation UNLESS the object is equivalent to Quaternion(0)
+
+        Objects already known to be of unit length are not checked again. Otherwise the object is given its own
+        elements array, as by `_normalise()`.
         """
+        if self._known_unit is not None:
+            return
         if not self.is_unit():
-            mag_squared = np.dot(self.q, self.q)
+            mag_squared = self._sum_of_squares()
             if (mag_squared == 0):
                 return
             if (abs(1.0 - mag_squared) < 2.107342e-08):
@@ -525,7 +817,24 @@ class Quaternion(object):
             else:
                 mag =  sqrt(mag_squared) # Error is too big, take the performance hit to calculate the square root properly
 
-            self.q = self.q / mag
+            self.q = self._q / mag
+        else:
+            # The elements may be shared with another object, through which they could later be modified
+            self._q = self._q.copy()
+        self._known_unit = 0
+
+    def _unit_elements(self):
+        """Elements of the unit quaternion equivalent to this object, computed without modifying the object.
+
+        Returns the internal elements array itself if the object is already of unit length, or if it is zero,
+        so the result must be treated as read-only.
+        """
+        if self._known_unit is not None or self.is_unit():
+            return self._q
+        n = self.norm
+        if n == 0:
+            return self._q
+        return self._q / n
 
     @property
     def normalised(self):
@@ -536,7 +845,7 @@ class Quaternion(object):
         Returns:
             A new Quaternion object clone that is guaranteed to be a unit quaternion
         """
-        q = Quaternion(self)
+        q = copy(self)
         q._normalise()
         return q
 
@@ -551,7 +860,7 @@ class Quaternion(object):
     def polar_angle(self):
          return acos(self.scalar / self.norm)
 
-    @property
+    @_cached_property
     def polar_decomposition(self):
         """
         Returns the unit vector and angle of a non-scalar quaternion according to the following decomposition
@@ -581,19 +890,19 @@ class Quaternion(object):
         """Matrix representation of quaternion for multiplication purposes.
         """
         return np.array([
-            [self.q[0], -self.q[1], -self.q[2], -self.q[3]],
-            [self.q[1],  self.q[0], -self.q[3],  self.q[2]],
-            [self.q[2],  self.q[3],  self.q[0], -self.q[1]],
-            [self.q[3], -self.q[2],  self.q[1],  self.q[0]]])
+            [self._q[0], -self._q[1], -self._q[2], -self._q[3]],
+            [self._q[1],  self._q[0], -self._q[3],  self._q[2]],
+            [self._q[2],  self._q[3],  self._q[0], -self._q[1]],
+            [self._q[3], -self._q[2],  self._q[1],  self._q[0]]])
 
     def _q_bar_matrix(self):
         """Matrix representation of quaternion for multiplication purposes.
         """
         return np.array([
-            [self.q[0], -self.q[1], -self.q[2], -self.q[3]],
-            [self.q[1],  self.q[0],  self.q[3], -self.q[2]],
-            [self.q[2], -self.q[3],  self.q[0],  self.q[1]],
-            [self.q[3],  self.q[2], -self.q[1],  self.q[0]]])
+            [self._q[0], -self._q[1], -self._q[2], -self._q[3]],
+            [self._q[1],  self._q[0],  self._q[3], -self._q[2]],
+            [self._q[2], -self._q[3],  self._q[0],  self._q[1]],
+            [self._q[3],  self._q[2], -self._q[1],  self._q[0]]])
 
     def _rotate_quaternion(self, q):
         """Rotate a quaternion vector using the stored rotation.
@@ -604,10 +913,19 @@ class Quaternion(object):
         Returns:
             A Quaternion object representing the rotated vector in quaternion from (0 + xi + yj + kz)
         """
-        self._normalise()
-        return self * q * self.conjugate
+        unit = Quaternion.from_array(self._unit_elements(), copy=False)
+        return unit * q * unit.conjugate
+
+    def _rotate_vectors(self, vectors, out=None):
+        """Rotate a (N, 3) array of vectors using the stored rotation.
 
-    def rotate(self, vector):
+        The rotation matrix is computed once and applied to all vectors with a single matrix product.
+        """
+        if vectors.shape[-1] != 3:
+            raise ValueError("Unexpected vector array shape. Got: {}, Expected: (N, 3).".format(vectors.shape))
+        return np.matmul(vectors, self.rotation_matrix.T, out=out)
+
+    def rotate(self, vector, out=None):
         """Rotate a 3D vector by the rotation stored in the Quaternion object.
 
         Params:
@@ -615,6 +933,9 @@ class Quaternion(object):
                 Some types that are recognised are: numpy arrays, lists and tuples.
                 A 3-vector can also be represented by a Quaternion object who's scalar part is 0 and vector part is the required 3-vector.
                 Thus it is possible to call `Quaternion.rotate(q)` with another quaternion object as an input.
+                A numpy array of shape (N, 3) is treated as a collection of N vectors, which are all rotated at once.
+            out: [optional] a numpy array of the same shape as an (N, 3) `vector` array, into which the rotated
+                vectors are written instead of allocating a new array. Ignored for single vectors.
 
         Returns:
             The rotated vector returned as the same type it was specified at input.
@@ -625,7 +946,9 @@ class Quaternion(object):
 
         """
         if isinstance(vector, Quaternion):
-            return self._rotate_quaternion(vector)
+            return self.from_array(self._rotate_quaternion(vector)._q, copy=False)
+        if isinstance(vector, np.ndarray) and vector.ndim > 1:
+            return self._rotate_vectors(vector, out)
         q = Quaternion(vector=vector)
         a = self._rotate_quaternion(q).vector
         if isinstance(vector, list):
@@ -658,7 +981,7 @@ class Quaternion(object):
         if v_norm > tolerance:
             vec = vec / v_norm
         magnitude = exp(q.scalar)
-        return Quaternion(scalar = magnitude * cos(v_norm), vector = magnitude * sin(v_norm) * vec)
+        return cls.from_array(np.hstack((magnitude * cos(v_norm), magnitude * sin(v_norm) * vec)), copy=False)
 
     @classmethod
     def log(cls, q):
@@ -680,12 +1003,12 @@ class Quaternion(object):
         tolerance = 1e-17
         if q_norm < tolerance:
             # 0 quaternion - undefined
-            return Quaternion(scalar=-float('inf'), vector=float('nan')*q.vector)
+            return cls.from_array(np.hstack((-float('inf'), float('nan') * q.vector)), copy=False)
         if v_norm < tolerance:
             # real quaternions - no imaginary part
-            return Quaternion(scalar=log(q_norm), vector=[0, 0, 0])
+            return cls.from_array(np.array([log(q_norm), 0.0, 0.0, 0.0]), copy=False)
         vec = q.vector / v_norm
-        return Quaternion(scalar=log(q_norm), vector=acos(q.scalar/q_norm)*vec)
+        return cls.from_array(np.hstack((log(q_norm), acos(q.scalar / q_norm) * vec)), copy=False)
 
     @classmethod
     def exp_map(cls, q, eta):
@@ -787,14 +1110,11 @@ class Quaternion(object):
            it takes into account the fact that q and -q encode the same rotation.
            It is thus a good indicator for rotation similarities.
         """
-        q0_minus_q1 = q0 - q1
-        q0_plus_q1  = q0 + q1
-        d_minus = q0_minus_q1.norm
-        d_plus  = q0_plus_q1.norm
-        if d_minus < d_plus:
-            return d_minus
-        else:
-            return d_plus
+        # |q0 - q1| < |q0 + q1| exactly when the dot product is positive, so only the shorter chord is computed
+        a = q0._q
+        b = q1._q if np.dot(a, q1._q) > 0.0 else -q1._q
+        d = a - b
+        return sqrt(np.dot(d, d))
 
     @classmethod
     def distance(cls, q0, q1):
@@ -815,8 +1135,17 @@ class Quaternion(object):
            them is given by the logarithm of those product quaternions, the norm
            of which is the same.
         """
-        q = Quaternion.log_map(q0, q1)
-        return q.norm
+        a0, a1, a2, a3 = q0._q.tolist()
+        b0, b1, b2, b3 = q1._q.tolist()
+        ss0 = a0 * a0 + a1 * a1 + a2 * a2 + a3 * a3
+        if not ss0 > 0:
+            raise ZeroDivisionError("a zero quaternion (0 + 0i + 0j + 0k) cannot be inverted")
+        # Components of q0^-1 * q1, whose logarithm has a norm of sqrt(log(|q1| / |q0|)^2 + theta^2)
+        w = (a0 * b0 + a1 * b1 + a2 * b2 + a3 * b3) / ss0
+        x = (a0 * b1 - a1 * b0 - a2 * b3 + a3 * b2) / ss0
+        y = (a0 * b2 + a1 * b3 - a2 * b0 - a3 * b1) / ss0
+        z = (a0 * b3 - a1 * b2 + a2 * b1 - a3 * b0) / ss0
+        return _log_norm(w, sqrt(x * x + y * y + z * z), sqrt((b0 * b0 + b1 * b1 + b2 * b2 + b3 * b3) / ss0))
 
     @classmethod
     def sym_distance(cls, q0, q1):
@@ -840,8 +1169,21 @@ class Quaternion(object):
            samples are spread over a "solid" angle of more than pi/2 radians
            (the spread refers to quaternions as point samples on the unit hypersphere).
         """
-        q = Quaternion.sym_log_map(q0, q1)
-        return q.norm
+        # q0^-0.5 * q1 * q0^-0.5 has the same scalar part and norm as q0^-1 * q1
+        a0, a1, a2, a3 = q0._q.tolist()
+        b0, b1, b2, b3 = q1._q.tolist()
+        ss0 = a0 * a0 + a1 * a1 + a2 * a2 + a3 * a3
+        if not ss0 > 0:
+            return float('nan')
+        if a1 == 0.0 and a2 == 0.0 and a3 == 0.0:
+            # q0^-0.5 is real, so the product is q1 / q0. It is undefined for a negative q0.
+            if a0 < 0.0:
+                return float('nan')
+            v_norm = sqrt(b1 * b1 + b2 * b2 + b3 * b3) / a0
+        else:
+            # Otherwise the product is taken not to be real, so that the distance between q and -q is pi
+            v_norm = 1.0
+        return _log_norm((a0 * b0 + a1 * b1 + a2 * b2 + a3 * b3) / ss0, v_norm, sqrt((b0 * b0 + b1 * b1 + b2 * b2 + b3 * b3) / ss0))
 
     @classmethod
     def slerp(cls, q0, q1, amount=0.5):
@@ -866,25 +1208,26 @@ class Quaternion(object):
 
         Note:
             This feature only makes sense when interpolating between unit quaternions (those lying on the unit radius hypersphere).
-                Calling this method will implicitly normalise the endpoints to unit quaternions if they are not already unit length.
+                Endpoints that are not already unit length are interpolated as their normalised equivalents.
+                The endpoint objects themselves are never modified.
         """
-        # Ensure quaternion inputs are unit quaternions and 0 <= amount <=1
-        q0._fast_normalise()
-        q1._fast_normalise()
+        # Use unit length copies of the endpoints and ensure 0 <= amount <=1
+        p0 = q0._unit_elements()
+        p1 = q1._unit_elements()
         amount = np.clip(amount, 0, 1)
 
-        dot = np.dot(q0.q, q1.q)
+        dot = np.dot(p0, p1)
 
         # If the dot product is negative, slerp won't take the shorter path.
         # Note that v1 and -v1 are equivalent when the negation is applied to all four components.
         # Fix by reversing one quaternion
         if dot < 0.0:
-            q0.q = -q0.q
+            p0 = -p0
             dot = -dot
 
         # sin_theta_0 can not be zero
         if dot > 0.9995:
-            qr = Quaternion(q0.q + amount * (q1.q - q0.q))
+            qr = cls.from_array(p0 + amount * (p1 - p0), copy=False)
             qr._fast_normalise()
             return qr
 
@@ -896,12 +1239,12 @@ class Quaternion(object):
 
         s0 = np.cos(theta) - dot * sin_theta / sin_theta_0
         s1 = sin_theta / sin_theta_0
-        qr = Quaternion((s0 * q0.q) + (s1 * q1.q))
+        qr = cls.from_array((s0 * p0) + (s1 * p1), copy=False)
         qr._fast_normalise()
         return qr
 
     @classmethod
-    def intermediates(cls, q0, q1, n, include_endpoints=False):
+    def intermediates(cls, q0, q1, n, include_endpoints=False, lazy=False):
         """Generator method to get an iterable sequence of `n` evenly spaced quaternion
         rotations between any two existing quaternion endpoints lying on the unit
         radius hypersphere.
@@ -917,21 +1260,34 @@ class Quaternion(object):
             include_endpoints: [optional] if set to `True`, the sequence of intermediates
                 will be 'bookended' by `q_start` and `q_end`, resulting in a sequence length of `n + 2`.
                 If set to `False`, endpoints are not included. Defaults to `False`.
+            lazy: [optional] if set to `True`, return a random access `IntermediatesSequence` instead of
+                a generator. Its elements are computed on demand, in any order. Defaults to `False`.
 
         Yields:
             A generator object iterating over a sequence of intermediate quaternion objects.
 
+        Returns:
+            An `IntermediatesSequence` object if `lazy` is set to `True`.
+
         Note:
             This feature only makes sense when interpolating between unit quaternions (those lying on the unit radius hypersphere).
-            Calling this method will implicitly normalise the endpoints to unit quaternions if they are not already unit length.
+            Endpoints that are not already unit length are interpolated as their normalised equivalents.
+
+            The angle between the endpoints is computed once for the whole sequence, see `SlerpPlan`.
+            Use `SlerpPlan(q0, q1).intermediates(n)` to get all intermediates as a QuaternionArray in one vectorised pass.
         """
-        step_size = 1.0 / (n + 1)
-        if include_endpoints:
-            steps = [i * step_size for i in range(0, n + 2)]
-        else:
-            steps = [i * step_size for i in range(1, n + 1)]
+        from .interpolation import SlerpPlan, _intermediate_steps # Deferred to avoid a circular import
+        plan = SlerpPlan(q0, q1)
+        if lazy:
+            return plan.sequence(n, include_endpoints)
+        return cls._iter_intermediates(plan, _intermediate_steps(n, include_endpoints))
+
+    @classmethod
+    def _iter_intermediates(cls, plan, steps):
         for step in steps:
-            yield cls.slerp(q0, q1, step)
+            q = cls.from_array(plan.elements(step), copy=False)
+            q._known_unit = 0
+            yield q
 
     def derivative(self, rate):
         """Get the instantaneous quaternion derivative representing a quaternion rotating at a 3D rate vector `rate`
@@ -977,7 +1333,7 @@ class Quaternion(object):
             self._fast_normalise()
 
 
-    @property
+    @_cached_property
     def rotation_matrix(self):
         """Get the 3x3 rotation matrix equivalent of the quaternion rotation.
 
@@ -985,14 +1341,19 @@ class Quaternion(object):
             A 3x3 orthogonal rotation matrix as a 3x3 Numpy array
 
         Note:
-            This feature only makes sense when referring to a unit quaternion. Calling this method will implicitly normalise the Quaternion object to a unit quaternion if it is not already one.
+            This feature only makes sense when referring to a unit quaternion. A Quaternion object that is not already one is treated as its normalised equivalent.
+            The object itself is never modified, so this is safe to call concurrently.
 
         """
-        self._normalise()
-        product_matrix = np.dot(self._q_matrix(), self._q_bar_matrix().conj().transpose())
-        return product_matrix[1:][:, 1:]
+        w, x, y, z = self._unit_elements().tolist()
+        if w == 0.0 and x == 0.0 and y == 0.0 and z == 0.0:
+            return np.zeros((3, 3)) # The zero quaternion maps every vector to zero
+        return np.array([
+            [1.0 - 2.0 * (y * y + z * z), 2.0 * (x * y - w * z),       2.0 * (x * z + w * y)],
+            [2.0 * (x * y + w * z),       1.0 - 2.0 * (x * x + z * z), 2.0 * (y * z - w * x)],
+            [2.0 * (x * z - w * y),       2.0 * (y * z + w * x),       1.0 - 2.0 * (x * x + y * y)]])
 
-    @property
+    @_cached_property
     def transformation_matrix(self):
         """Get the 4x4 homogeneous transformation matrix equivalent of the quaternion rotation.
 
@@ -1000,13 +1361,15 @@ class Quaternion(object):
             A 4x4 homogeneous transformation matrix as a 4x4 Numpy array
 
         Note:
-            This feature only makes sense when referring to a unit quaternion. Calling this method will implicitly normalise the Quaternion object to a unit quaternion if it is not already one.
+            This feature only makes sense when referring to a unit quaternion. A Quaternion object that is not already one is treated as its normalised equivalent.
+            The object itself is never modified, so this is safe to call concurrently.
         """
-        t = np.array([[0.0], [0.0], [0.0]])
-        Rt = np.hstack([self.rotation_matrix, t])
-        return np.vstack([Rt, np.array([0.0, 0.0, 0.0, 1.0])])
+        T = np.zeros((4, 4))
+        T[:3, :3] = self.rotation_matrix
+        T[3, 3] = 1.0
+        return T
 
-    @property
+    @_cached_property
     def yaw_pitch_roll(self):
         """Get the equivalent yaw-pitch-roll angles aka. intrinsic Tait-Bryan angles following the z-y'-x'' convention
 
@@ -1018,15 +1381,15 @@ class Quaternion(object):
         The resulting rotation_matrix would be R = R_x(roll) R_y(pitch) R_z(yaw)
 
         Note:
-            This feature only makes sense when referring to a unit quaternion. Calling this method will implicitly normalise the Quaternion object to a unit quaternion if it is not already one.
+            This feature only makes sense when referring to a unit quaternion. A Quaternion object that is not already one is treated as its normalised equivalent.
+            The object itself is never modified, so this is safe to call concurrently.
         """
-
-        self._normalise()
-        yaw = np.arctan2(2 * (self.q[0] * self.q[3] - self.q[1] * self.q[2]),
-            1 - 2 * (self.q[2] ** 2 + self.q[3] ** 2))
-        pitch = np.arcsin(2 * (self.q[0] * self.q[2] + self.q[3] * self.q[1]))
-        roll = np.arctan2(2 * (self.q[0] * self.q[1] - self.q[2] * self.q[3]),
-            1 - 2 * (self.q[1] ** 2 + self.q[2] ** 2))
+        q = self._unit_elements()
+        yaw = np.arctan2(2 * (q[0] * q[3] - q[1] * q[2]),
+            1 - 2 * (q[2] ** 2 + q[3] ** 2))
+        pitch = np.arcsin(2 * (q[0] * q[2] + q[3] * q[1]))
+        roll = np.arctan2(2 * (q[0] * q[1] - q[2] * q[3]),
+            1 - 2 * (q[1] ** 2 + q[2] ** 2))
 
         return yaw, pitch, roll
 
@@ -1057,22 +1420,23 @@ class Quaternion(object):
 
         Note:
             This feature only makes sense when referring to a unit quaternion.
-            Calling this method will implicitly normalise the Quaternion object to a unit quaternion if it is not already one.
+            A Quaternion object that is not already one is treated as its normalised equivalent.
+            The object itself is never modified, so this is safe to call concurrently.
         """
         tolerance = 1e-17
-        self._normalise()
-        norm = np.linalg.norm(self.vector)
+        vector = self._unit_elements()[1:4]
+        norm = np.linalg.norm(vector)
         if norm < tolerance:
             # Here there are an infinite set of possible axes, use what has been specified as an undefined axis.
             return undefined
         else:
-            return self.vector / norm
+            return vector / norm
 
-    @property
+    @_cached_property
     def axis(self):
         return self.get_axis()
 
-    @property
+    @_cached_property
     def angle(self):
         """Get the angle (in radians) describing the magnitude of the quaternion rotation about its rotation axis.
 
@@ -1090,11 +1454,12 @@ class Quaternion(object):
 
         Note:
             This feature only makes sense when referring to a unit quaternion.
-            Calling this method will implicitly normalise the Quaternion object to a unit quaternion if it is not already one.
+            A Quaternion object that is not already one is treated as its normalised equivalent.
+            The object itself is never modified, so this is safe to call concurrently.
         """
-        self._normalise()
-        norm = np.linalg.norm(self.vector)
-        return self._wrap_angle(2.0 * atan2(norm, self.scalar))
+        q = self._unit_elements()
+        norm = np.linalg.norm(q[1:4])
+        return self._wrap_angle(2.0 * atan2(norm, q[0]))
 
     @property
     def degrees(self):
@@ -1111,7 +1476,7 @@ class Quaternion(object):
         Returns:
             A real number i.e. float
         """
-        return self.q[0]
+        return self._q[0]
 
     @property
     def vector(self):
@@ -1120,14 +1485,16 @@ class Quaternion(object):
         Returns:
             A numpy 3-array of floats. NOT guaranteed to be a unit vector
         """
-        return self.q[1:4]
+        self._known_unit = None # The returned view may be modified in place
+        return self._q[1:4]
 
     @vector.setter
     def vector(self, v):
         if len(v) != 3:
             raise AttributeError("Expected vector component to be of length 3 but received length {} instead!"
                                  .format(len(v)))
-        self.q[1:4] = v
+        self._q[1:4] = v
+        self._invalidate()
 
     @property
     def real(self):
@@ -1139,19 +1506,19 @@ class Quaternion(object):
 
     @property
     def w(self):
-        return self.q[0]
+        return self._q[0]
 
     @property
     def x(self):
-        return self.q[1]
+        return self._q[1]
 
     @property
     def y(self):
-        return self.q[2]
+        return self._q[2]
 
     @property
     def z(self):
-        return self.q[3]
+        return self._q[3]
 
     @property
     def elements(self):
@@ -1160,25 +1527,36 @@ class Quaternion(object):
         Returns:
             A numpy 4-array of floats. NOT guaranteed to be a unit vector
         """
-        return self.q
+        self._known_unit = None # The returned array may be modified in place
+        return self._q
 
     def __getitem__(self, index):
         index = int(index)
-        return self.q[index]
+        return self._q[index]
 
     def __setitem__(self, index, value):
         index = int(index)
-        self.q[index] = float(value)
+        self._q[index] = float(value)
+        self._invalidate()
 
     def __copy__(self):
-        result = self.__class__(self.q)
+        result = self.from_array(self._q)
+        result._known_unit = self._known_unit
         return result
 
     def __deepcopy__(self, memo):
-        result = self.__class__(deepcopy(self.q, memo))
+        result = self.from_array(deepcopy(self._q, memo), copy=False)
+        result._known_unit = self._known_unit
         memo[id(self)] = result
         return result
 
+    # Without a __dict__, pickle protocols 0 and 1 need the state of the slots to be given explicitly
+    def __getstate__(self):
+        return (self._q, self._known_unit, self._cache)
+
+    def __setstate__(self, state):
+        self._q, self._known_unit, self._cache = state
+
     @staticmethod
     def to_degrees(angle_rad):
         if angle_rad is not None:
@@ -1188,3 +1566,137 @@ class Quaternion(object):
     def to_radians(angle_deg):
         if angle_deg is not None:
             return float(angle_deg) / 180.0 * pi
+
+
+class FrozenQuaternion(Quaternion):
+    """Immutable Quaternion, for use as a dictionary key or set member.
+
+    FrozenQuaternion objects support the whole read-only API of Quaternion objects, and arithmetic on them returns
+    new FrozenQuaternion objects. Their elements are held in a read-only numpy array, and their hash is computed
+    once on construction, so that it is cheap to look up and can never go stale.
+
+    Note:
+        Like Quaternion objects, FrozenQuaternion objects hash their exact elements, while equality allows a small
+        tolerance. Use them as keys for results computed from those exact elements, e.g. memoised per orientation.
+    """
+
+    # In addition to the attributes of Quaternion:
+    #   _hash: the hash of the elements, computed once on construction
+    __slots__ = ('_hash',)
+
+    def __init__(self, *args, **kwargs):
+        """Initialise a new FrozenQuaternion object, with any of the arguments accepted by Quaternion.
+
+        The elements of a Quaternion object are copied, so that later changes to it are not seen by the new object.
+        Those of a FrozenQuaternion object are shared, along with its hash.
+        """
+        self._cache = None
+        if len(args) == 1 and not kwargs and isinstance(args[0], Quaternion):
+            other = args[0]
+            if isinstance(other, FrozenQuaternion):
+                self._q = other._q
+                self._hash = other._hash
+            else:
+                self._freeze(np.array(other._q, dtype=np.float64))
+            self._known_unit = other._known_unit
+            return
+        # Every other form of initialisation creates a new elements array, which can be adopted
+        q = Quaternion(*args, **kwargs)
+        self._freeze(q._q)
+        self._known_unit = q._known_unit
+
+    def _freeze(self, array):
+        array.flags.writeable = False
+        self._q = array
+        self._hash = hash(tuple(array.tolist()))
+
+    @classmethod
+    def from_array(cls, array, copy=True):
+        """Trusted initialisation from a numpy array of elements, bypassing all validation.
+
+        See `Quaternion.from_array()`. If `copy` is set to `False` and `array` owns its memory, it is made read-only
+        and adopted. Views of other arrays are always copied, since they could still be modified through their base.
+        """
+        q = cls.__new__(cls)
+        q._freeze(array if not copy and array.base is None else np.array(array, dtype=np.float64))
+        q._known_unit = None
+        q._cache = None
+        return q
+
+    def thaw(self, copy=True):
+        """Get a Quaternion object with the same elements.
+
+        Params:
+            copy: [optional] if set to `False`, the new object shares the read-only elements of this object
+                instead of copying them, so it cannot be modified in place. Defaults to `True`.
+
+        Returns:
+            A new Quaternion object
+        """
+        result = Quaternion.from_array(self._q, copy=copy)
+        result._known_unit = self._known_unit
+        return result
+
+    def _immutable(self, *args, **kwargs):
+        raise AttributeError("FrozenQuaternion objects cannot be modified")
+
+    # The read-only elements cannot be modified in place, so handing them out keeps the unit mark
+    def _get_q(self):
+        return self._q
+
+    def _get_vector(self):
+        return self._q[1:4]
+
+    q = property(_get_q, _immutable)
+
+    elements = property(_get_q, doc=Quaternion.elements.__doc__)
+
+    vector = property(_get_vector, _immutable, doc=Quaternion.vector.__doc__)
+
+    def __setitem__(self, index, value):
+        raise TypeError("FrozenQuaternion objects do not support item assignment")
+
+    def __hash__(self):
+        return self._hash
+
+    def _normalise(self):
+        """Mark the object as known to be a unit quaternion.
+
+        Raises:
+            AttributeError: if the object is not a unit quaternion. Use `normalised` to get a unit copy instead.
+        """
+        if self._known_unit is None and not self.is_unit():
+            self._immutable()
+        self._known_unit = 0
+
+    _fast_normalise = _normalise
+
+    @property
+    def normalised(self):
+        """Get a unit quaternion (versor) copy of this FrozenQuaternion object.
+
+        Returns:
+            A new FrozenQuaternion object that is guaranteed to be a unit quaternion
+        """
+        q = self.from_array(self._unit_elements())
+        q._known_unit = 0
+        return q
+
+    def integrate(self, rate, timestep):
+        self._immutable()
+
+    @classmethod
+    def slerp(cls, q0, q1, amount=0.5):
+        """Spherical Linear Interpolation between quaternions, as a FrozenQuaternion object. See `Quaternion.slerp()`
+        """
+        return cls(Quaternion.slerp(q0, q1, amount))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        memo[id(self)] = self
+        return self
+
+    def __reduce__(self):
+        return (self.__class__.from_array, (np.array(self._q),))
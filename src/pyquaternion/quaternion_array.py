@@ -0,0 +1,874 @@
+"""
+This file is part of the pyquaternion python module
+
+Author:         Kieran Wynn
+Website:        https://github.com/KieranWynn/pyquaternion
+Documentation:  http://kieranwynn.github.io/pyquaternion/
+
+Version:         1.0.0
+License:         The MIT License (MIT)
+
+Copyright (c) 2015 Kieran Wynn
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+quaternion_array.py - This file defines the batched QuaternionArray class
+
+"""
+
+from __future__ import absolute_import, division, print_function # Add compatibility for Python 2.7+
+
+from numbers import Number
+
+import numpy as np # Numpy is required for many vector operations
+
+from .pyquaternion import Quaternion
+
+
+# Vectorised kernels
+# These operate on the trailing axis of (..., 4) float arrays and broadcast over all leading axes.
+
+def _multiply(a, b):
+    """Hamilton product of two broadcastable (..., 4) arrays of quaternion elements.
+    """
+    a0, a1, a2, a3 = a[..., 0], a[..., 1], a[..., 2], a[..., 3]
+    b0, b1, b2, b3 = b[..., 0], b[..., 1], b[..., 2], b[..., 3]
+    out = np.empty(np.broadcast(a0, b0).shape + (4,))
+    out[..., 0] = a0 * b0 - a1 * b1 - a2 * b2 - a3 * b3
+    out[..., 1] = a0 * b1 + a1 * b0 + a2 * b3 - a3 * b2
+    out[..., 2] = a0 * b2 - a1 * b3 + a2 * b0 + a3 * b1
+    out[..., 3] = a0 * b3 + a1 * b2 - a2 * b1 + a3 * b0
+    return out
+
+
+def _conjugate(a):
+    out = -a
+    out[..., 0] = a[..., 0]
+    return out
+
+
+def _sum_of_squares(a):
+    return np.einsum('...i,...i->...', a, a)
+
+
+def _inverse(a):
+    ss = _sum_of_squares(a)
+    if not np.all(ss > 0):
+        raise ZeroDivisionError("a zero quaternion (0 + 0i + 0j + 0k) cannot be inverted")
+    return _conjugate(a) / ss[..., np.newaxis]
+
+
+def _normalise(a):
+    """Scale every quaternion in `a` to unit length. Zero quaternions are left as zero.
+    """
+    n = np.sqrt(_sum_of_squares(a))
+    return a / np.where(n > 0.0, n, 1.0)[..., np.newaxis]
+
+
+def _exp(a):
+    """Quaternion exponential of every quaternion in the (..., 4) array `a`, as in `Quaternion.exp()`.
+    """
+    v = a[..., 1:]
+    v_norm = np.sqrt(_sum_of_squares(v))
+    magnitude = np.exp(a[..., 0])
+    out = np.empty(a.shape)
+    out[..., 0] = magnitude * np.cos(v_norm)
+    # Vectors no longer than the tolerance are used as they are, rather than scaled to unit length
+    scale = magnitude * np.sin(v_norm) / np.where(v_norm > 1e-17, v_norm, 1.0)
+    out[..., 1:] = scale[..., np.newaxis] * v
+    return out
+
+
+def _log(a):
+    """Quaternion logarithm of every quaternion in the (..., 4) array `a`, as in `Quaternion.log()`.
+
+    Real quaternions have a zero vector part, and zero quaternions result in (-inf, nan, nan, nan).
+    """
+    v = a[..., 1:]
+    v_norm = np.sqrt(_sum_of_squares(v))
+    q_norm = np.sqrt(_sum_of_squares(a))
+    out = np.empty(a.shape)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out[..., 0] = np.log(q_norm)
+        angle = np.arccos(np.clip(a[..., 0] / q_norm, -1.0, 1.0))
+        scale = np.where(v_norm < 1e-17, 0.0, angle / v_norm)
+        scale[q_norm < 1e-17] = np.nan
+    out[..., 1:] = scale[..., np.newaxis] * v
+    return out
+
+
+def _power(a, exponent):
+    """Every quaternion in the (..., 4) array `a` raised to the real `exponent`, as in `Quaternion.__pow__()`.
+
+    Real quaternions are raised as real numbers, and zero quaternions are returned unchanged.
+    """
+    v = a[..., 1:]
+    v_norm = np.sqrt(_sum_of_squares(v))
+    norm = np.sqrt(_sum_of_squares(a))
+    real = v_norm <= 0.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        theta = np.arccos(np.clip(a[..., 0] / norm, -1.0, 1.0))
+        magnitude = norm ** exponent
+        out = np.empty(a.shape)
+        out[..., 0] = np.where(real, a[..., 0] ** exponent, magnitude * np.cos(exponent * theta))
+        scale = np.where(real, 0.0, magnitude * np.sin(exponent * theta) / v_norm)
+    out[..., 1:] = scale[..., np.newaxis] * v
+    zero = norm == 0.0
+    if np.any(zero):
+        out[zero] = a[zero]
+    return out
+
+
+def _log_norm(w, v_norm, q_norm):
+    """Norm of the logarithm of quaternions, given their scalar parts, vector norms and norms, as in `Quaternion.log()`.
+    """
+    tolerance = 1e-17
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_norm = np.log(q_norm)
+        out = np.hypot(log_norm, np.arccos(np.clip(w / q_norm, -1.0, 1.0)))
+    out = np.where(v_norm < tolerance, np.abs(log_norm), out) # real quaternions - no imaginary part
+    return np.where(q_norm < tolerance, np.nan, out) # 0 quaternion - undefined
+
+
+def _distance(a, b):
+    """Intrinsic distance |log(a^-1 * b)| between broadcastable (..., 4) arrays, as in `Quaternion.distance()`.
+
+    Computed from the dot product and norms of the inputs, without forming the logarithm.
+    """
+    ss0 = _sum_of_squares(a)
+    if not np.all(ss0 > 0):
+        raise ZeroDivisionError("a zero quaternion (0 + 0i + 0j + 0k) cannot be inverted")
+    # The vector part of a^-1 * b only decides whether the product is treated as a real quaternion
+    v = _multiply(_conjugate(a), b)[..., 1:]
+    return _log_norm(np.einsum('...i,...i->...', a, b) / ss0, np.sqrt(_sum_of_squares(v)) / ss0, np.sqrt(_sum_of_squares(b) / ss0))
+
+
+def _sym_vector_norm(a, b):
+    """Vector norm of a^-0.5 * b * a^-0.5 as used by `Quaternion.sym_distance()`, for broadcastable (..., 4) arrays.
+
+    If `a` is real the product is b / a, and negative real `a` result in nan. Otherwise the product is never
+    treated as a real quaternion, and 1.0 is returned.
+    """
+    real = np.all(a[..., 1:] == 0.0, axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        v_norm = np.sqrt(_sum_of_squares(b[..., 1:])) / a[..., 0]
+    return np.where(real, np.where(a[..., 0] < 0.0, np.nan, v_norm), 1.0)
+
+
+def _sym_distance(a, b):
+    """Symmetrized distance |log(a^-0.5 * b * a^-0.5)| between broadcastable (..., 4) arrays, as in `Quaternion.sym_distance()`.
+
+    a^-0.5 * b * a^-0.5 has the same scalar part and norm as a^-1 * b, from which its logarithm follows.
+    Zero or negative real quaternions `a` result in nan.
+    """
+    ss0 = _sum_of_squares(a)
+    v_norm = _sym_vector_norm(a, b)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out = _log_norm(np.einsum('...i,...i->...', a, b) / ss0, v_norm, np.sqrt(_sum_of_squares(b) / ss0))
+    return np.where((ss0 > 0) & ~np.isnan(v_norm), out, np.nan)
+
+
+def _absolute_distance(a, b):
+    """Chord distance min(|a - b|, |a + b|) between broadcastable (..., 4) arrays, as in `Quaternion.absolute_distance()`.
+    """
+    # |a - b| < |a + b| exactly when the dot product is positive, so only the shorter chord is computed
+    sign = np.where(np.einsum('...i,...i->...', a, b) > 0.0, 1.0, -1.0)
+    return np.sqrt(_sum_of_squares(a - sign[..., np.newaxis] * b))
+
+
+def _rotate(q, v, out=None):
+    """Rotate (..., 3) vectors `v` by the broadcastable (..., 4) unit quaternions `q`.
+
+    Uses the closed form v' = v + 2w(u x v) + 2u x (u x v), where w and u are the scalar and vector parts of q.
+    Zero quaternions map every vector to zero, as `Quaternion.rotate()` does.
+    """
+    w = q[..., :1]
+    u = q[..., 1:]
+    t = 2.0 * np.cross(u, v)
+    out = np.add(v, w * t, out=out)
+    out += np.cross(u, t)
+    nonzero = np.any(q != 0.0, axis=-1, keepdims=True)
+    if not np.all(nonzero):
+        out *= nonzero
+    return out
+
+
+def _rotation_matrix(q, out=None):
+    """Stack of 3x3 rotation matrices equivalent to the (..., 4) unit quaternions `q`.
+
+    The matrices are written directly from the quadratic terms of the elements, into `out` if provided.
+    Zero quaternions result in zero matrices, as they map every vector to zero.
+    """
+    if out is None:
+        out = np.empty(q.shape[:-1] + (3, 3))
+    w, x, y, z = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    xx, yy, zz = x * x, y * y, z * z
+    xy, xz, yz = x * y, x * z, y * z
+    wx, wy, wz = w * x, w * y, w * z
+    one = np.any(q != 0.0, axis=-1).astype(np.float64) # 1.0 for unit quaternions, 0.0 for zero quaternions
+    out[..., 0, 0] = one - 2.0 * (yy + zz)
+    out[..., 0, 1] = 2.0 * (xy - wz)
+    out[..., 0, 2] = 2.0 * (xz + wy)
+    out[..., 1, 0] = 2.0 * (xy + wz)
+    out[..., 1, 1] = one - 2.0 * (xx + zz)
+    out[..., 1, 2] = 2.0 * (yz - wx)
+    out[..., 2, 0] = 2.0 * (xz - wy)
+    out[..., 2, 1] = 2.0 * (yz + wx)
+    out[..., 2, 2] = one - 2.0 * (xx + yy)
+    return out
+
+
+def _transformation_matrix(q, out=None):
+    """Stack of 4x4 homogeneous transformation matrices equivalent to the (..., 4) unit quaternions `q`.
+    """
+    if out is None:
+        out = np.empty(q.shape[:-1] + (4, 4))
+    _rotation_matrix(q, out[..., :3, :3])
+    out[..., :3, 3] = 0.0
+    out[..., 3, :3] = 0.0
+    out[..., 3, 3] = 1.0
+    return out
+
+
+def _slerp(p0, p1, amount):
+    """Spherical linear interpolation between broadcastable (..., 4) arrays of endpoints.
+
+    Follows `Quaternion.slerp()`, with its shortest path sign flip and its linear fallback
+    for nearby endpoints applied as masks over all elements at once.
+    """
+    p0 = _normalise(p0)
+    p1 = _normalise(p1)
+    amount = np.clip(amount, 0, 1)
+    dot = np.einsum('...i,...i->...', p0, p1)
+
+    # Reverse one endpoint wherever slerp would otherwise take the longer path
+    sign = np.where(dot < 0.0, -1.0, 1.0)
+    dot = np.abs(dot)
+
+    s0, s1 = _slerp_weights(_slerp_angle(dot), amount)
+    return _normalise((sign * s0)[..., np.newaxis] * p0 + s1[..., np.newaxis] * p1)
+
+
+def _slerp_angle(dot):
+    """Amount independent slerp terms for endpoints with non-negative dot product(s) `dot`.
+
+    Returns a tuple (dot, linear, theta_0, sin_theta_0), where `linear` marks nearby endpoints to be
+    interpolated linearly, since sin_theta_0 can not be zero.
+    Elsewhere dot is in range [0, 0.9995], so np.arccos() is safe.
+    """
+    linear = dot > 0.9995
+    theta_0 = np.arccos(np.minimum(dot, 0.9995))
+    return dot, linear, theta_0, np.sin(theta_0)
+
+
+def _slerp_weights(angle, amount):
+    """Weights (s0, s1) of the two endpoints at each `amount`, given the terms returned by `_slerp_angle()`.
+    """
+    dot, linear, theta_0, sin_theta_0 = angle
+    theta = theta_0 * amount
+    sin_theta = np.sin(theta)
+    s0 = np.where(linear, 1.0 - amount, np.cos(theta) - dot * sin_theta / sin_theta_0)
+    s1 = np.where(linear, amount, sin_theta / sin_theta_0)
+    return s0, s1
+
+
+def _random(n, rng):
+    """(n, 4) array of unit quaternions uniformly distributed across the rotation space.
+
+    Same method as `Quaternion.random()`, with the three uniform samples of each quaternion drawn from
+    `rng` in the same order, and the trigonometric terms written in place to limit temporaries.
+    """
+    r1, r2, r3 = rng.random((n, 3)).T
+    out = np.empty((n, 4))
+    np.multiply(r2, 2 * np.pi, out=r2)
+    np.multiply(r3, 2 * np.pi, out=r3)
+    np.sin(r2, out=out[:, 0])
+    np.cos(r2, out=out[:, 1])
+    np.sin(r3, out=out[:, 2])
+    np.cos(r3, out=out[:, 3])
+    out[:, :2] *= np.sqrt(1.0 - r1)[:, np.newaxis]
+    out[:, 2:] *= np.sqrt(r1)[:, np.newaxis]
+    return out
+
+
+def _from_rotation_matrix(R):
+    """Unit quaternions equivalent to a (..., 3, 3) stack of rotation matrices.
+
+    Vectorised form of the trace method used by `Quaternion._from_matrix()`,
+    where the branch taken by each matrix is selected with boolean masks.
+    """
+    m = np.swapaxes(R, -1, -2) # The trace method assumes row-vector and postmultiplication of that vector
+    m00, m01, m02 = m[..., 0, 0], m[..., 0, 1], m[..., 0, 2]
+    m10, m11, m12 = m[..., 1, 0], m[..., 1, 1], m[..., 1, 2]
+    m20, m21, m22 = m[..., 2, 0], m[..., 2, 1], m[..., 2, 2]
+
+    branches = [
+        (m22 < 0) & (m00 > m11),
+        (m22 < 0) & ~(m00 > m11),
+        (m22 >= 0) & (m00 < -m11),
+    ] # Any remaining matrices take the positive trace branch
+    t = np.select(branches, [1 + m00 - m11 - m22, 1 - m00 + m11 - m22, 1 - m00 - m11 + m22], 1 + m00 + m11 + m22)
+    d01, d12, d20 = m01 - m10, m12 - m21, m20 - m02
+    s01, s12, s20 = m01 + m10, m12 + m21, m20 + m02
+
+    q = np.empty(R.shape[:-2] + (4,))
+    q[..., 0] = np.select(branches, [d12, d20, d01], t)
+    q[..., 1] = np.select(branches, [t, s01, s20], d12)
+    q[..., 2] = np.select(branches, [s01, t, s12], d20)
+    q[..., 3] = np.select(branches, [s20, s12, t], d01)
+    q *= (0.5 / np.sqrt(t))[..., np.newaxis]
+    return q
+
+
+def _special_orthogonal(R, rtol, atol):
+    """Boolean mask of the matrices in a (..., 3, 3) stack that are orthogonal with determinant +1.
+    """
+    product = np.matmul(R, np.swapaxes(R, -1, -2))
+    orthogonal = np.all(np.isclose(product, np.eye(3), rtol=rtol, atol=atol), axis=(-2, -1))
+    return orthogonal & np.isclose(np.linalg.det(R), 1.0, rtol=rtol, atol=atol)
+
+
+def _check_out(out, shape):
+    if out is not None and out.shape != shape:
+        raise ValueError("Unexpected output array shape. Got: {}, Expected: {}.".format(out.shape, shape))
+
+
+class QuaternionArray(object):
+    """Class to represent a batch of quaternions stored in a single contiguous array.
+
+    QuaternionArray objects support the same arithmetic and rotation features as
+    Quaternion objects, evaluated for every element at once with vectorised Numpy operations.
+
+    Attributes:
+        q: Quaternion elements represented as an (N, 4) Numpy array of float64
+
+    """
+
+    def __init__(self, data):
+        """Initialise a new QuaternionArray object.
+
+        Params:
+            data: any of the following:
+                an (N, 4) array-like of real numbers, each row being the elements of one quaternion;
+                a single 4-element sequence, resulting in an array of length 1;
+                a sequence of Quaternion objects;
+                an existing QuaternionArray or Quaternion object, which will be copied.
+
+        Raises:
+            ValueError: if `data` cannot be interpreted as an (N, 4) array of real numbers
+        """
+        if isinstance(data, QuaternionArray):
+            data = data.q
+        elif isinstance(data, Quaternion):
+            data = data.q
+        elif isinstance(data, (list, tuple)):
+            data = [e.q if isinstance(e, Quaternion) else e for e in data]
+        try:
+            q = np.array(data, dtype=np.float64)
+        except (TypeError, ValueError):
+            raise ValueError("One or more elements cannot be interpreted as a real number")
+        if q.ndim == 1:
+            q = q.reshape(1, -1)
+        if q.ndim != 2 or q.shape[1] != 4:
+            raise ValueError("Unexpected array shape. Got: {}, Expected: (N, 4).".format(q.shape))
+        self.q = q
+
+    @staticmethod
+    def _matrix_stack(matrix):
+        try:
+            shape = matrix.shape
+        except AttributeError:
+            raise TypeError("Invalid matrix type: Input must be an (N, 3, 3) or (N, 4, 4) numpy array")
+        if len(shape) == 2:
+            matrix = matrix[np.newaxis]
+        if matrix.ndim != 3 or matrix.shape[1:] not in [(3, 3), (4, 4)]:
+            raise ValueError("Invalid matrix shape: Input must be an (N, 3, 3) or (N, 4, 4) numpy array")
+        return matrix[:, :3, :3] # Upper left 3x3 sub-matrices
+
+    @classmethod
+    def validate_matrix(cls, matrix, rtol=1e-05, atol=1e-08):
+        """Check a stack of matrices for conversion into quaternions with `from_matrix()`.
+
+        Params:
+            matrix: an (N, 3, 3) stack of rotation matrices or (N, 4, 4) stack of transformation matrices
+            rtol: [optional] relative tolerance of the orthogonality and determinant checks
+            atol: [optional] absolute tolerance of the orthogonality and determinant checks
+
+        Returns:
+            An (N,) boolean Numpy array, which is `True` where the matrix is special orthogonal
+            i.e. a valid rotation, and `False` otherwise.
+        """
+        return _special_orthogonal(cls._matrix_stack(matrix), rtol, atol)
+
+    @classmethod
+    def from_matrix(cls, matrix, rtol=1e-05, atol=1e-08, validate=True):
+        """Initialise from a stack of matrix representations.
+
+        Params:
+            matrix: an (N, 3, 3) stack of rotation matrices or (N, 4, 4) stack of transformation matrices
+            rtol: [optional] relative tolerance of the orthogonality and determinant checks
+            atol: [optional] absolute tolerance of the orthogonality and determinant checks
+            validate: [optional] if set to `False`, the matrices are assumed to be valid rotations
+                and are not checked. Defaults to `True`.
+
+        Returns:
+            A new QuaternionArray object holding the unit quaternion equivalent of each matrix.
+
+        Raises:
+            TypeError: if `matrix` is not a numpy array
+            ValueError: if `matrix` is not a stack of 3x3 or 4x4 matrices, or if validation is enabled and any
+                of the matrices is not special orthogonal. The message lists the indices of all invalid matrices.
+        """
+        R = cls._matrix_stack(matrix)
+        if validate:
+            invalid = np.flatnonzero(~_special_orthogonal(R, rtol, atol))
+            if len(invalid):
+                raise ValueError("Matrices must be special orthogonal, but {} of {} are not, at indices: {}".format(
+                    len(invalid), len(R), np.array2string(invalid, separator=', ', threshold=20)))
+        return cls._wrap(_from_rotation_matrix(R))
+
+    @classmethod
+    def slerp(cls, q0, q1, amount=0.5):
+        """Spherical Linear Interpolation between many pairs of quaternions at once.
+
+        The vectorised equivalent of `Quaternion.slerp()`, evaluated for every element in a single call.
+
+        This is a class method and is called as a method of the class itself rather than on a particular instance.
+
+        Params:
+            q0: first endpoint rotations as a QuaternionArray object or an (N, 4) array-like of elements.
+                A single Quaternion object is used as the first endpoint of every pair.
+            q1: second endpoint rotations, in any of the forms accepted for `q0`.
+            amount: interpolation parameter between 0 and 1, as a real number or an (N,) array-like.
+                0 is at `q0` and 1 is at `q1`. Defaults to the midpoint (0.5).
+
+        Returns:
+            A new QuaternionArray object holding the N interpolated rotations. These are guaranteed to be unit quaternions.
+
+        Raises:
+            ValueError: if the endpoints and amounts cannot be broadcast to a common length N.
+
+        Note:
+            This feature only makes sense when interpolating between unit quaternions (those lying on the unit radius hypersphere).
+                Endpoints that are not already unit length are interpolated as their normalised equivalents.
+                The endpoint objects themselves are never modified.
+        """
+        p0 = cls._elements(q0)
+        p1 = cls._elements(q1)
+        amount = np.asarray(amount, dtype=np.float64)
+        try:
+            shape = np.broadcast(p0[..., 0], p1[..., 0], amount).shape
+        except ValueError:
+            raise ValueError("Cannot broadcast endpoints of shape {} and {} with amounts of shape {}.".format(
+                p0.shape, p1.shape, amount.shape))
+        if len(shape) > 1:
+            raise ValueError("Unexpected amount shape. Got: {}, Expected: a real number or an (N,) array.".format(amount.shape))
+        return cls._wrap(_slerp(p0, p1, amount).reshape(-1, 4))
+
+    @classmethod
+    def _elements(cls, obj):
+        """Element array of a Quaternion, QuaternionArray or any array-like accepted by the constructor.
+        """
+        if isinstance(obj, (QuaternionArray, Quaternion)):
+            return obj.q
+        return cls(obj).q
+
+    @classmethod
+    def _broadcast(cls, q):
+        return cls._wrap(q.reshape(-1, 4))
+
+    @classmethod
+    def exp(cls, q):
+        """Quaternion Exponential of every element, as in `Quaternion.exp()`.
+
+        Params:
+             q: the input quaternions as a QuaternionArray object or an (N, 4) array-like of elements.
+
+        Returns:
+             A new QuaternionArray object representing exp(q) of every element.
+        """
+        return cls._broadcast(_exp(cls._elements(q)))
+
+    @classmethod
+    def log(cls, q):
+        """Quaternion Logarithm of every element, as in `Quaternion.log()`.
+
+        Params:
+             q: the input quaternions as a QuaternionArray object or an (N, 4) array-like of elements.
+
+        Returns:
+             A new QuaternionArray object representing log(q) := (log(|q|), v/|v|acos(w/|q|)) of every element.
+             Real elements have a zero vector part, and zero elements result in (-inf, nan, nan, nan).
+        """
+        return cls._broadcast(_log(cls._elements(q)))
+
+    @classmethod
+    def exp_map(cls, q, eta):
+        """Quaternion exponential map of every pair of base points and tangent vectors, as in `Quaternion.exp_map()`.
+
+        Params:
+             q: the base points as a QuaternionArray object, an (N, 4) array-like or a single Quaternion object
+           eta: the tangent vectors, in any of the forms accepted for `q`
+
+        Returns:
+            A new QuaternionArray object holding q * exp(eta) for every pair.
+        """
+        return cls._broadcast(_multiply(cls._elements(q), _exp(cls._elements(eta))))
+
+    @classmethod
+    def sym_exp_map(cls, q, eta):
+        """Quaternion symmetrized exponential map of every pair, as in `Quaternion.sym_exp_map()`.
+
+        Params:
+             q: the base points as a QuaternionArray object, an (N, 4) array-like or a single Quaternion object
+           eta: the tangent vectors, in any of the forms accepted for `q`
+
+        Returns:
+            A new QuaternionArray object holding q^0.5 * exp(eta) * q^0.5 for every pair.
+        """
+        sqrt_q = _power(cls._elements(q), 0.5)
+        return cls._broadcast(_multiply(_multiply(sqrt_q, _exp(cls._elements(eta))), sqrt_q))
+
+    @classmethod
+    def log_map(cls, q, p):
+        """Quaternion logarithm map of every pair, as in `Quaternion.log_map()`.
+
+        Params:
+             q: the base points as a QuaternionArray object, an (N, 4) array-like or a single Quaternion object
+             p: the arguments of the map, in any of the forms accepted for `q`
+
+        Returns:
+            A new QuaternionArray object holding the tangent vectors log(q^-1 * p) for every pair.
+
+        Raises:
+            ZeroDivisionError: if any base point is a zero quaternion
+        """
+        return cls._broadcast(_log(_multiply(_inverse(cls._elements(q)), cls._elements(p))))
+
+    @classmethod
+    def sym_log_map(cls, q, p):
+        """Quaternion symmetrized logarithm map of every pair, as in `Quaternion.sym_log_map()`.
+
+        Params:
+             q: the base points as a QuaternionArray object, an (N, 4) array-like or a single Quaternion object
+             p: the arguments of the map, in any of the forms accepted for `q`
+
+        Returns:
+            A new QuaternionArray object holding log(q^-0.5 * p * q^-0.5) for every pair.
+        """
+        inv_sqrt_q = _power(cls._elements(q), -0.5)
+        return cls._broadcast(_log(_multiply(_multiply(inv_sqrt_q, cls._elements(p)), inv_sqrt_q)))
+
+    @classmethod
+    def distance(cls, q0, q1):
+        """Quaternion intrinsic distance between every pair, as in `Quaternion.distance()`.
+
+        Params:
+            q0: the first quaternions as a QuaternionArray object, an (N, 4) array-like or a single Quaternion object
+            q1: the second quaternions, in any of the forms accepted for `q0`
+
+        Returns:
+            An (N,) Numpy array of the lengths of the geodesic arcs connecting each pair.
+
+        Raises:
+            ZeroDivisionError: if any of `q0` is a zero quaternion
+        """
+        return _distance(cls._elements(q0), cls._elements(q1)).reshape(-1)
+
+    @classmethod
+    def absolute_distance(cls, q0, q1):
+        """Quaternion absolute distance between every pair, as in `Quaternion.absolute_distance()`.
+
+        Params:
+            q0: the first quaternions as a QuaternionArray object, an (N, 4) array-like or a single Quaternion object
+            q1: the second quaternions, in any of the forms accepted for `q0`
+
+        Returns:
+            An (N,) Numpy array of the chords of the shortest arcs connecting each pair, accounting for the sign ambiguity.
+        """
+        return _absolute_distance(cls._elements(q0), cls._elements(q1)).reshape(-1)
+
+    @classmethod
+    def sym_distance(cls, q0, q1):
+        """Quaternion symmetrized distance between every pair, as in `Quaternion.sym_distance()`.
+
+        Params:
+            q0: the first quaternions as a QuaternionArray object, an (N, 4) array-like or a single Quaternion object
+            q1: the second quaternions, in any of the forms accepted for `q0`
+
+        Returns:
+            An (N,) Numpy array of the lengths of the symmetrized geodesic curves connecting each pair.
+        """
+        return _sym_distance(cls._elements(q0), cls._elements(q1)).reshape(-1)
+
+    @classmethod
+    def random(cls, n, rng=None):
+        """Generate `n` random unit quaternions in one vectorised pass.
+
+        Uniformly distributed across the rotation space
+        As per: http://planning.cs.uiuc.edu/node198.html
+
+        Params:
+            n: number of quaternions to generate
+            rng: [optional] a `numpy.random.Generator` (or `numpy.random.RandomState`) to draw from,
+                e.g. to give parallel workers independent, reproducible streams.
+                Defaults to numpy's global random state.
+
+        Returns:
+            A new QuaternionArray object of length `n`.
+        """
+        return cls._wrap(_random(n, np.random if rng is None else rng))
+
+    @classmethod
+    def _wrap(cls, q):
+        """Adopt an (N, 4) float64 array produced by a vectorised kernel without copying or validation.
+        """
+        result = cls.__new__(cls)
+        result.q = q
+        return result
+
+    # Representation
+    def __str__(self):
+        return "\n".join(str(q) for q in self)
+
+    def __repr__(self):
+        return "QuaternionArray({})".format(np.array2string(self.q, separator=', '))
+
+    # Container protocol
+    def __len__(self):
+        return self.q.shape[0]
+
+    def __iter__(self):
+        for row in self.q:
+            yield Quaternion.from_array(row)
+
+    def __getitem__(self, index):
+        """Get a single Quaternion by integer index, or a QuaternionArray by slice, mask or index array.
+        """
+        if isinstance(index, (int, np.integer)):
+            return Quaternion.from_array(self.q[index])
+        return self._wrap(self.q[index].reshape(-1, 4))
+
+    def __setitem__(self, index, value):
+        if isinstance(value, (Quaternion, QuaternionArray)):
+            value = value.q
+        self.q[index] = value
+
+    def __copy__(self):
+        return self.__class__(self)
+
+    def __deepcopy__(self, memo):
+        result = self.__class__(self)
+        memo[id(self)] = result
+        return result
+
+    def _operand(self, other):
+        """Element array of an arithmetic operand, or None if the operand type is not supported.
+        """
+        if isinstance(other, (QuaternionArray, Quaternion)):
+            return other.q
+        if isinstance(other, Number):
+            return np.array([float(other), 0.0, 0.0, 0.0])
+        return None
+
+    # Negation
+    def __neg__(self):
+        return self._wrap(-self.q)
+
+    # Addition
+    def __add__(self, other):
+        p = self._operand(other)
+        if p is None:
+            return NotImplemented
+        return self._wrap(self.q + p)
+
+    def __radd__(self, other):
+        return self + other
+
+    # Subtraction
+    def __sub__(self, other):
+        p = self._operand(other)
+        if p is None:
+            return NotImplemented
+        return self._wrap(self.q - p)
+
+    def __rsub__(self, other):
+        p = self._operand(other)
+        if p is None:
+            return NotImplemented
+        return self._wrap(p - self.q)
+
+    # Multiplication
+    def __mul__(self, other):
+        p = self._operand(other)
+        if p is None:
+            return NotImplemented
+        return self._wrap(_multiply(self.q, p))
+
+    def __rmul__(self, other):
+        p = self._operand(other)
+        if p is None:
+            return NotImplemented
+        return self._wrap(_multiply(p, self.q))
+
+    # Exponentiation
+    def __pow__(self, exponent):
+        """Raise every element to a real power, as in `Quaternion.__pow__()`.
+        """
+        return self._wrap(_power(self.q, float(exponent)))
+
+    # Quaternion Features
+    @property
+    def conjugate(self):
+        """Element-wise quaternion conjugate, encapsulated in a new instance.
+
+        Returns:
+            A new QuaternionArray object with the vector part of every element negated
+        """
+        return self._wrap(_conjugate(self.q))
+
+    @property
+    def inverse(self):
+        """Element-wise inverse, encapsulated in a new instance.
+
+        Returns:
+            A new QuaternionArray object representing the inverse of every element
+
+        Raises:
+            ZeroDivisionError: if any element is a zero quaternion (0 + 0i + 0j + 0k)
+        """
+        return self._wrap(_inverse(self.q))
+
+    @property
+    def norm(self):
+        """L2 norm of every quaternion 4-vector.
+
+        Returns:
+            An (N,) Numpy array of real numbers
+        """
+        return np.sqrt(_sum_of_squares(self.q))
+
+    @property
+    def magnitude(self):
+        return self.norm
+
+    @property
+    def normalised(self):
+        """Get a unit quaternion (versor) copy of this QuaternionArray object.
+
+        Returns:
+            A new QuaternionArray object in which every element is a unit quaternion,
+            except for zero elements which remain zero.
+        """
+        return self._wrap(_normalise(self.q))
+
+    @property
+    def unit(self):
+        return self.normalised
+
+    def rotate(self, vectors, out=None):
+        """Rotate 3D vectors by the rotations stored in the QuaternionArray object.
+
+        Params:
+            vectors: any of the following array-likes:
+                a single 3-vector, to be rotated by every element;
+                an (N, 3) array of vectors, each rotated by the corresponding element;
+                an (N, M, 3) array, in which all M vectors of row i are rotated by element i.
+            out: [optional] a numpy array of the broadcast result shape into which the rotated vectors are written.
+
+        Returns:
+            A Numpy array of rotated vectors, of shape (N, 3) or (N, M, 3).
+
+        Raises:
+            ValueError: if `vectors` is not a 3-vector or a stack of 3-vectors with N rows.
+
+        Note:
+            This feature only makes sense when referring to unit quaternions.
+            Elements are implicitly normalised before being applied, without modifying this object.
+        """
+        v = np.asarray(vectors, dtype=np.float64)
+        if v.shape[-1:] != (3,) or (v.ndim > 1 and v.shape[0] != len(self)):
+            raise ValueError("Unexpected vector shape. Got: {}, Expected: (3,), ({n}, 3) or ({n}, M, 3).".format(v.shape, n=len(self)))
+        q = _normalise(self.q)
+        if v.ndim > 2:
+            # Align each quaternion with its own row of vectors
+            q = q.reshape((len(self),) + (1,) * (v.ndim - 2) + (4,))
+        return _rotate(q, v, out)
+
+    def get_rotation_matrix(self, out=None):
+        """Get the 3x3 rotation matrix equivalent of every quaternion rotation.
+
+        Params:
+            out: [optional] an (N, 3, 3) numpy array of float64 into which the matrices are written.
+
+        Returns:
+            An (N, 3, 3) Numpy array of orthogonal rotation matrices
+
+        Note:
+            Elements are implicitly normalised before conversion, without modifying this object.
+        """
+        _check_out(out, (len(self), 3, 3))
+        return _rotation_matrix(_normalise(self.q), out)
+
+    @property
+    def rotation_matrix(self):
+        return self.get_rotation_matrix()
+
+    def get_transformation_matrix(self, out=None):
+        """Get the 4x4 homogeneous transformation matrix equivalent of every quaternion rotation.
+
+        Params:
+            out: [optional] an (N, 4, 4) numpy array of float64 into which the matrices are written.
+
+        Returns:
+            An (N, 4, 4) Numpy array of homogeneous transformation matrices
+
+        Note:
+            Elements are implicitly normalised before conversion, without modifying this object.
+        """
+        _check_out(out, (len(self), 4, 4))
+        return _transformation_matrix(_normalise(self.q), out)
+
+    @property
+    def transformation_matrix(self):
+        return self.get_transformation_matrix()
+
+    @property
+    def scalar(self):
+        """ Return the real or scalar components as an (N,) Numpy array view.
+        """
+        return self.q[:, 0]
+
+    @property
+    def vector(self):
+        """ Return the imaginary or vector components as an (N, 3) Numpy array view.
+        """
+        return self.q[:, 1:4]
+
+    @property
+    def real(self):
+        return self.scalar
+
+    @property
+    def imaginary(self):
+        return self.vector
+
+    @property
+    def elements(self):
+        return self.q
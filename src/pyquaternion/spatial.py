@@ -0,0 +1,585 @@
+"""
+This file is part of the pyquaternion python module
+
+Author:         Kieran Wynn
+Website:        https://github.com/KieranWynn/pyquaternion
+Documentation:  http://kieranwynn.github.io/pyquaternion/
+
+Version:         1.0.0
+License:         The MIT License (MIT)
+
+Copyright (c) 2015 Kieran Wynn
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+spatial.py - This file defines pairwise distance and search functions over sets of rotations
+
+"""
+
+from __future__ import absolute_import, division, print_function # Add compatibility for Python 2.7+
+
+from heapq import heapify, heappop, heappush
+from itertools import product
+from math import sin
+
+import numpy as np # Numpy is required for many vector operations
+
+from .quaternion_array import QuaternionArray, _absolute_distance, _distance, _log_norm, _sum_of_squares, _sym_distance
+
+
+# Upper bound on the number of elements of each block of the distance matrix, and of its temporaries
+_CHUNK_ELEMENTS = 2 ** 20
+
+
+def _absolute_distance_block(a, b, dot, ss0, ss1):
+    # |a -+ b|^2 = |a|^2 + |b|^2 -+ 2 a.b, taking the shorter chord
+    return np.sqrt(np.maximum(ss0[:, np.newaxis] + ss1 - 2.0 * np.abs(dot), 0.0))
+
+
+def _distance_block(a, b, dot, ss0, ss1):
+    # Scalar part, norm and vector norm of a^-1 * b, as in `Quaternion.distance()`
+    with np.errstate(divide='ignore', invalid='ignore'):
+        w = dot / ss0[:, np.newaxis]
+        q_norm_squared = ss1 / ss0[:, np.newaxis]
+    v_norm = np.sqrt(np.maximum(q_norm_squared - w * w, 0.0))
+    out = _log_norm(w, v_norm, np.sqrt(q_norm_squared))
+    # The vector norm above is only accurate to rounding error, so rows of real quaternions, whose products
+    # with real quaternions are exactly real, are computed from the vector parts as in `Quaternion.distance()`
+    real = np.all(a[:, 1:] == 0.0, axis=1)
+    if np.any(real):
+        out[real] = _distance(a[real, np.newaxis], b)
+    return out
+
+
+def _sym_distance_block(a, b, dot, ss0, ss1):
+    # a^-0.5 * b * a^-0.5 has the same scalar part and norm as a^-1 * b, as in `Quaternion.sym_distance()`,
+    # and is only treated as a real quaternion if a is real
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out = _log_norm(dot / ss0[:, np.newaxis], 1.0, np.sqrt(ss1 / ss0[:, np.newaxis]))
+    real = np.all(a[:, 1:] == 0.0, axis=1)
+    if np.any(real):
+        out[real] = _sym_distance(a[real, np.newaxis], b)
+    return np.where(ss0[:, np.newaxis] > 0, out, np.nan)
+
+
+_METRICS = {
+    'absolute_distance': _absolute_distance_block,
+    'distance': _distance_block,
+    'sym_distance': _sym_distance_block,
+}
+
+
+def _sets(q0, q1):
+    a = QuaternionArray._elements(q0).reshape(-1, 4)
+    b = a if q1 is None else QuaternionArray._elements(q1).reshape(-1, 4)
+    return a, b
+
+
+def _pairwise_blocks(a, b, metric, chunk_size):
+    """Yield (start, block) pairs, where block holds the distances from rows start to start + len(block) of `a`
+    to every row of `b`, computed from one matrix product of dot products per block.
+    """
+    try:
+        kernel = _METRICS[metric]
+    except KeyError:
+        raise ValueError("Unknown metric '{}'. Expected one of: {}".format(metric, ", ".join(sorted(_METRICS))))
+    if metric == 'distance' and not np.all(_sum_of_squares(a) > 0):
+        raise ZeroDivisionError("a zero quaternion (0 + 0i + 0j + 0k) cannot be inverted")
+    if chunk_size is None:
+        chunk_size = max(1, _CHUNK_ELEMENTS // max(len(b), 1))
+    ss1 = _sum_of_squares(b)
+    for start in range(0, len(a), chunk_size):
+        rows = a[start:start + chunk_size]
+        yield start, kernel(rows, b, np.dot(rows, b.T), _sum_of_squares(rows), ss1)
+
+
+def pairwise_distances(q0, q1=None, metric='absolute_distance', chunk_size=None):
+    """Distance matrix between two sets of quaternions.
+
+    Equivalent to calling the Quaternion class method named by `metric` for every pair, but computed from
+    matrix products of dot products, one block of rows at a time to bound the memory used by temporaries.
+
+    Params:
+        q0: the first set of N quaternions as a QuaternionArray object, an (N, 4) array-like or a sequence of Quaternion objects
+        q1: [optional] the second set of M quaternions, in any of the forms accepted for `q0`. Defaults to `q0`.
+        metric: [optional] either of the following, defaulting to 'absolute_distance':
+            'absolute_distance': chord distance, accounting for the sign ambiguity, see `Quaternion.absolute_distance()`
+            'distance': intrinsic geodesic distance, see `Quaternion.distance()`
+            'sym_distance': symmetrized geodesic distance, see `Quaternion.sym_distance()`
+        chunk_size: [optional] number of rows of `q0` to process at a time.
+            Defaults to a number of rows bounding each block to about a million elements.
+
+    Returns:
+        An (N, M) Numpy array of distances.
+
+    Raises:
+        ValueError: if `metric` is unknown
+        ZeroDivisionError: for the 'distance' metric, if any of `q0` is a zero quaternion
+
+    Note:
+        Distances are derived from dot products, so for nearly identical rotations they are accurate to about 1e-8
+        rather than to machine precision.
+    """
+    a, b = _sets(q0, q1)
+    out = np.empty((len(a), len(b)))
+    for start, block in _pairwise_blocks(a, b, metric, chunk_size):
+        out[start:start + len(block)] = block
+    return out
+
+
+def pairwise_top_k(q0, q1=None, k=1, metric='absolute_distance', chunk_size=None):
+    """The `k` nearest quaternions of a second set to each quaternion of a first set.
+
+    Computed in blocks as by `pairwise_distances()`, keeping only the `k` smallest distances of each row,
+    so the full distance matrix is never held in memory.
+
+    Params:
+        q0: the N query quaternions as a QuaternionArray object, an (N, 4) array-like or a sequence of Quaternion objects
+        q1: [optional] the M candidate quaternions, in any of the forms accepted for `q0`. Defaults to `q0`,
+            in which case each quaternion is its own nearest neighbour.
+        k: [optional] number of nearest candidates to find for each query, at most M. Defaults to 1.
+        metric: [optional] distance metric, as for `pairwise_distances()`
+        chunk_size: [optional] number of queries to process at a time, as for `pairwise_distances()`
+
+    Returns:
+        A tuple of two (N, k) Numpy arrays: the indices into `q1` of the nearest candidates of each query,
+        and their distances, both in order of increasing distance.
+
+    Raises:
+        ValueError: if `metric` is unknown, or `k` is not between 1 and M
+        ZeroDivisionError: for the 'distance' metric, if any of `q0` is a zero quaternion
+    """
+    a, b = _sets(q0, q1)
+    m = len(b)
+    if not 1 <= k <= m:
+        raise ValueError("Expected k between 1 and the number of candidates {}. Got: {}.".format(m, k))
+    indices = np.empty((len(a), k), dtype=np.intp)
+    distances = np.empty((len(a), k))
+    for start, block in _pairwise_blocks(a, b, metric, chunk_size):
+        rows = np.arange(len(block))[:, np.newaxis]
+        nearest = np.argpartition(block, k - 1, axis=1)[:, :k]
+        order = np.argsort(block[rows, nearest], axis=1, kind='mergesort')
+        nearest = nearest[rows, order]
+        indices[start:start + len(block)] = nearest
+        distances[start:start + len(block)] = block[rows, nearest]
+    return indices, distances
+
+
+# Exact distances between a query and sign-aligned unit references, for each metric of `RotationIndex`
+_ALIGNED_METRICS = {
+    'absolute_distance': _absolute_distance,
+    'distance': _distance,
+    'sym_distance': _sym_distance,
+}
+
+# Slack on the squared chord bounds used for pruning, so that rounding never discards a true neighbour
+_BOUND_TOLERANCE = 1e-12
+
+
+def _unit_rotations(rotations):
+    """Normalised (N, 4) elements of rotations in any of the forms accepted by `QuaternionArray._elements()`.
+    """
+    q = QuaternionArray._elements(rotations).reshape(-1, 4)
+    norm = np.sqrt(_sum_of_squares(q))
+    if not np.all(norm > 0):
+        raise ValueError("A zero quaternion (0 + 0i + 0j + 0k) does not represent a rotation")
+    return q / norm[:, np.newaxis]
+
+
+def _canonical(p):
+    """Fold the (N, 4) unit quaternions `p` so that the first non-zero element of each is positive,
+    picking one of q and -q for every rotation.
+    """
+    first = np.argmax(p != 0.0, axis=1)
+    signs = np.where(p[np.arange(len(p)), first] < 0.0, -1.0, 1.0)
+    return p * signs[:, np.newaxis]
+
+
+def _box_bound(q, lo, hi):
+    """Lower bound on min(|q - r|, |q + r|)^2 over the points r of the box [lo, hi].
+    """
+    near = 0.0
+    far = 0.0
+    for x, l, h in zip(q, lo, hi):
+        if x < l:
+            near += (l - x) * (l - x)
+        elif x > h:
+            near += (x - h) * (x - h)
+        if -x < l:
+            far += (l + x) * (l + x)
+        elif -x > h:
+            far += (x + h) * (x + h)
+    return min(near, far)
+
+
+class _RotationTree(object):
+    """Static KD-tree over canonical unit quaternions, which lie on the w >= 0 hemisphere.
+
+    Nodes are stored in flat lists: the bounding box of node i is (lo[i], hi[i]), its points are
+    points[start[i]:end[i]] and children[i] holds the pair of child nodes, or None for a leaf.
+    """
+
+    def __init__(self, points, ids, leaf_size):
+        self.points = points
+        self.ids = ids
+        self.leaf_size = leaf_size
+        self.lo = []
+        self.hi = []
+        self.start = []
+        self.end = []
+        self.children = []
+        self._build(0, len(points))
+
+    def __len__(self):
+        return len(self.points)
+
+    def _build(self, start, end):
+        node = len(self.start)
+        block = self.points[start:end]
+        self.lo.append(block.min(axis=0).tolist())
+        self.hi.append(block.max(axis=0).tolist())
+        self.start.append(start)
+        self.end.append(end)
+        self.children.append(None)
+        if end - start > self.leaf_size:
+            # Split at the median of the widest dimension
+            dim = int(np.argmax(np.subtract(self.hi[node], self.lo[node])))
+            mid = (start + end) // 2
+            order = np.argpartition(block[:, dim], mid - start)
+            self.points[start:end] = block[order]
+            self.ids[start:end] = self.ids[start:end][order]
+            self.children[node] = (self._build(start, mid), self._build(mid, end))
+        return node
+
+
+class RotationIndex(object):
+    """Nearest neighbour index over rotations, treating q and -q as the same rotation.
+
+    References are normalised and folded onto one hemisphere of the unit 4-sphere by `_canonical()`, then stored in KD-trees
+    searched best-first, so queries only visit the part of the reference set near the query rotation.
+    Insertions are batched into trees of geometrically decreasing size, which are merged and rebuilt as they fill,
+    keeping both the amortised cost of an insertion and the number of trees logarithmic in the number of references.
+
+    References are identified by their position in order of insertion.
+    """
+
+    def __init__(self, rotations=None, leaf_size=64):
+        """Initialise an index.
+
+        Params:
+            rotations: [optional] initial reference rotations, as a QuaternionArray object,
+                an (N, 4) array-like or a sequence of Quaternion objects.
+            leaf_size: [optional] number of references below which a tree node is scanned rather than split.
+
+        Raises:
+            ValueError: if any reference is a zero quaternion, or `leaf_size` is not positive
+        """
+        if leaf_size < 1:
+            raise ValueError("Expected a positive leaf size. Got: {}.".format(leaf_size))
+        self._leaf_size = leaf_size
+        self._trees = []
+        self._size = 0
+        if rotations is not None:
+            self.insert(rotations)
+
+    def __len__(self):
+        return self._size
+
+    def insert(self, rotations):
+        """Add reference rotations to the index.
+
+        Params:
+            rotations: the rotations to add, in any of the forms accepted by the constructor.
+                They are given the indices following those of the references already in the index.
+
+        Raises:
+            ValueError: if any rotation is a zero quaternion
+        """
+        points = _canonical(_unit_rotations(rotations))
+        if not len(points):
+            return
+        ids = np.arange(self._size, self._size + len(points))
+        self._size += len(points)
+        while self._trees and len(self._trees[-1]) <= len(points):
+            tree = self._trees.pop()
+            points = np.concatenate((tree.points, points))
+            ids = np.concatenate((tree.ids, ids))
+        self._trees.append(_RotationTree(points, ids, self._leaf_size))
+
+    def _search(self, q, k, bound):
+        """Indices and elements of the `k` nearest references to the unit query `q` within a squared chord
+        distance of `bound`, unsorted. Pass k=None for all references within `bound`.
+        """
+        query = q.tolist()
+        heap = [(_box_bound(query, tree.lo[0], tree.hi[0]), i, 0) for i, tree in enumerate(self._trees)]
+        heapify(heap)
+        ids = np.empty(0, dtype=np.intp)
+        points = np.empty((0, 4))
+        chords = np.empty(0)
+        while heap:
+            node_bound, i, node = heappop(heap)
+            if node_bound > bound:
+                break
+            tree = self._trees[i]
+            children = tree.children[node]
+            if children is None:
+                start, end = tree.start[node], tree.end[node]
+                # |q -+ r|^2 = 2 - 2|q.r| for unit q and r, taking the shorter chord
+                leaf_chords = 2.0 - 2.0 * np.abs(np.dot(tree.points[start:end], q))
+                inside = leaf_chords <= bound
+                ids = np.concatenate((ids, tree.ids[start:end][inside]))
+                points = np.concatenate((points, tree.points[start:end][inside]))
+                chords = np.concatenate((chords, leaf_chords[inside]))
+                if k is not None and len(ids) >= k:
+                    keep = np.argpartition(chords, k - 1)[:k]
+                    ids, points, chords = ids[keep], points[keep], chords[keep]
+                    bound = chords.max() + _BOUND_TOLERANCE
+            else:
+                for child in children:
+                    child_bound = _box_bound(query, tree.lo[child], tree.hi[child])
+                    if child_bound <= bound:
+                        heappush(heap, (child_bound, i, child))
+        return ids, points
+
+    @staticmethod
+    def _results(q, ids, references, metric):
+        """Sorted indices and exact distances from the unit query `q` to the references `ids` with elements `references`.
+        """
+        signs = np.where(np.dot(references, q) < 0.0, -1.0, 1.0)
+        distances = _ALIGNED_METRICS[metric](q, references * signs[:, np.newaxis])
+        order = np.lexsort((ids, distances))
+        return ids[order], distances[order]
+
+    @staticmethod
+    def _check_metric(metric):
+        if metric not in _ALIGNED_METRICS:
+            raise ValueError("Unknown metric '{}'. Expected one of: {}".format(metric, ", ".join(sorted(_ALIGNED_METRICS))))
+
+    def query(self, q, k=1, metric='absolute_distance'):
+        """The `k` nearest reference rotations to each query rotation.
+
+        Params:
+            q: the N query rotations as a single Quaternion object, a QuaternionArray object,
+                an (N, 4) array-like or a sequence of Quaternion objects.
+            k: [optional] number of nearest references to find for each query, at most the size of the index. Defaults to 1.
+            metric: [optional] either of 'absolute_distance' (the default), 'distance' or 'sym_distance'.
+                Queries and references are normalised, queries are folded to one of q and -q, and each distance
+                is measured to whichever of r and -r is nearer the query, so that it only depends on the rotations.
+
+        Returns:
+            A tuple of two (N, k) Numpy arrays: the indices of the nearest references to each query,
+            and their distances, both in order of increasing distance.
+
+        Raises:
+            ValueError: if `metric` is unknown, `k` is not between 1 and the size of the index,
+                or any query is a zero quaternion
+        """
+        self._check_metric(metric)
+        if not 1 <= k <= self._size:
+            raise ValueError("Expected k between 1 and the number of references {}. Got: {}.".format(self._size, k))
+        queries = _canonical(_unit_rotations(q))
+        indices = np.empty((len(queries), k), dtype=np.intp)
+        distances = np.empty((len(queries), k))
+        for row, query in enumerate(queries):
+            ids, references = self._search(query, k, np.inf)
+            indices[row], distances[row] = self._results(query, ids, references, metric)
+        return indices, distances
+
+    def query_radius(self, q, radius, metric='absolute_distance'):
+        """All reference rotations within a distance of each query rotation.
+
+        Params:
+            q: the N query rotations, in any of the forms accepted by `query()`.
+            radius: the largest distance to include, inclusive.
+            metric: [optional] distance metric, as for `query()`.
+
+        Returns:
+            A tuple of two lists of N one-dimensional Numpy arrays: the indices of the references within `radius`
+            of each query, and their distances, both in order of increasing distance.
+
+        Raises:
+            ValueError: if `metric` is unknown or any query is a zero quaternion
+        """
+        self._check_metric(metric)
+        # Every metric is an increasing function of the chord |q - r| between aligned unit quaternions
+        if metric == 'absolute_distance':
+            chord = radius
+        else:
+            chord = 2.0 * sin(min(max(radius, 0.0), np.pi) / 2.0)
+        bound = chord * chord + _BOUND_TOLERANCE if radius >= 0 else -np.inf
+        indices = []
+        distances = []
+        for query in _canonical(_unit_rotations(q)):
+            ids, references = self._search(query, None, bound)
+            ids, found = self._results(query, ids, references, metric)
+            inside = found <= radius
+            indices.append(ids[inside])
+            distances.append(found[inside])
+        return indices, distances
+
+
+# Smallest grid cell used by `deduplicate()`, keeping cell indices of unit quaternions well within int64
+_MIN_CELL = 1e-9
+
+
+def rotation_keys(q, tol):
+    """Grid cells of rotations, for hashing them with a tolerance.
+
+    Each quaternion is normalised and folded so that q and -q get the same key, then quantised to a grid of spacing `tol`.
+    Rotations with equal keys are within an absolute distance of 2 * `tol` of each other. Rotations within `tol`
+    of each other have keys differing by at most one in each element, unless they lie on either side of the fold,
+    where both have a first non-zero element within `tol` of zero.
+
+    Params:
+        q: the N rotations as a single Quaternion object, a QuaternionArray object,
+            an (N, 4) array-like or a sequence of Quaternion objects.
+        tol: the grid spacing, a positive number.
+
+    Returns:
+        An (N, 4) Numpy array of integer grid cells, e.g. to be hashed as `tuple(keys[i])`.
+
+    Raises:
+        ValueError: if `tol` is not positive or any rotation is a zero quaternion
+    """
+    if not tol > 0:
+        raise ValueError("Expected a positive grid spacing. Got: {}.".format(tol))
+    return np.floor(_canonical(_unit_rotations(q)) / tol).astype(np.int64)
+
+
+def _chord(a, b):
+    """min(|a - b|, |a + b|) between two sequences of four floats.
+    """
+    minus = 0.0
+    plus = 0.0
+    for x, y in zip(a, b):
+        minus += (x - y) * (x - y)
+        plus += (x + y) * (x + y)
+    return min(minus, plus) ** 0.5
+
+
+def _grid(points, cell, tol):
+    """Cells of the (N, 4) `points` on a grid of spacing `cell`, and whether each element lies within `tol`
+    of the lower and of the upper boundary of its cell.
+    """
+    keys = np.floor(points / cell)
+    offset = points - keys * cell
+    return keys.astype(np.int64), offset < tol, cell - offset <= tol
+
+
+def _nearby_cells(key, lower, upper):
+    """Keys of the cells around `key` that can hold points within the tolerance of a point near the given boundaries.
+    """
+    return product(*[[k - 1] * l + [k] + [k + 1] * u for k, l, u in zip(key, lower, upper)])
+
+
+def _cell_hashes(keys):
+    """Integer hashes of the (N, 4) integer grid cells `keys`, wrapping around on overflow.
+    """
+    hashes = keys[:, 0].copy()
+    for d in range(1, 4):
+        hashes *= 1000003
+        hashes += keys[:, d]
+    return hashes
+
+
+def _crowded(points, cell, tol):
+    """Whether any other of the (N, 4) `points` may lie within `tol` of each point, judged from their cells
+    on a grid of spacing `cell`. Hash collisions can only mark more points as crowded.
+    """
+    keys, lower, upper = _grid(points, cell, tol)
+    hashes = _cell_hashes(keys)
+    occupied, counts = np.unique(hashes, return_counts=True)
+    crowded = counts[np.searchsorted(occupied, hashes)] > 1
+    # Direction of the nearby cell along each dimension, if any. Cells narrower than 2 * `tol` are treated as crowded.
+    crowded |= np.any(lower & upper, axis=1)
+    side = upper.astype(np.int64) - lower
+    for dims in product((False, True), repeat=4):
+        dims = np.array(dims)
+        if not dims.any():
+            continue
+        rows = np.nonzero(np.all(side[:, dims] != 0, axis=1) & ~crowded)[0]
+        neighbours = _cell_hashes(keys[rows] + side[rows] * dims)
+        found = occupied[np.minimum(np.searchsorted(occupied, neighbours), len(occupied) - 1)] == neighbours
+        crowded[rows[found]] = True
+    return crowded
+
+
+def deduplicate(q, tol=1e-8, return_index=False, return_inverse=False):
+    """Remove repeated rotations, treating q and -q as the same rotation.
+
+    Rotations are visited in order, and each is kept unless it is within an absolute distance of `tol` of one already kept.
+    Rotations with no other rotation in the grid cells they could match, bucketed as by `rotation_keys()`, are kept
+    in one vectorised pass. Each of the rest is only compared with the kept rotations in those cells of a finer grid,
+    in near-linear time overall.
+
+    Params:
+        q: the N rotations as a single Quaternion object, a QuaternionArray object,
+            an (N, 4) array-like or a sequence of Quaternion objects.
+        tol: [optional] the largest absolute distance, between normalised quaternions, at which rotations are repeats.
+            Defaults to 1e-8. A tolerance of 0 only removes rotations with identical normalised elements, up to sign.
+        return_index: [optional] also return the indices into `q` of the kept rotations. Defaults to False.
+        return_inverse: [optional] also return, for each rotation, the index among the kept rotations of the first one
+            within `tol` of it. Defaults to False.
+
+    Returns:
+        A QuaternionArray object of the kept rotations, with the elements they were given in `q`.
+        If either of `return_index` or `return_inverse` is True, a tuple of it followed by the requested
+        Numpy integer arrays, in that order.
+
+    Raises:
+        ValueError: if `tol` is negative or any rotation is a zero quaternion
+    """
+    if not tol >= 0:
+        raise ValueError("Expected a non-negative tolerance. Got: {}.".format(tol))
+    elements = QuaternionArray._elements(q).reshape(-1, 4)
+    points = _canonical(_unit_rotations(elements))
+    # Nearby rotations may have been folded onto the other side, but only if both are within `tol` of the fold
+    folded = np.abs(points[:, 0]) <= tol
+    crowded = np.nonzero(_crowded(points, max(8.0 * tol, _MIN_CELL), tol) | folded)[0]
+    # A fine grid bounds the number of kept rotations in each cell
+    cell = max(2.0 * tol, _MIN_CELL)
+    keys, lower, upper = _grid(points[crowded], cell, tol)
+    kept = np.ones(len(points), dtype=bool)
+    first = np.arange(len(points))
+    buckets = {}
+    rows = zip(crowded.tolist(), points[crowded].tolist(), keys.tolist(), lower.tolist(), upper.tolist(),
+               folded[crowded].tolist())
+    for i, point, key, is_lower, is_upper, is_folded in rows:
+        match = None
+        # Kept rotations are listed in order, so the first match is the first kept
+        for j, other in buckets.get(tuple(key), ()):
+            if _chord(point, other) <= tol:
+                match = j
+                break
+        if match is None:
+            # Kept rotations are added to every cell that may hold a match, so each rotation only looks in its own cell
+            cells = _nearby_cells(key, is_lower, is_upper)
+            if is_folded:
+                flipped = _grid(-points[i:i + 1], cell, tol)
+                cells = set(cells).union(_nearby_cells(*[a[0].tolist() for a in flipped]))
+            for cell_key in cells:
+                buckets.setdefault(cell_key, []).append((i, point))
+        else:
+            kept[i] = False
+            first[i] = match
+    index = np.nonzero(kept)[0]
+    unique = QuaternionArray(elements[index])
+    inverse = (np.cumsum(kept) - 1)[first]
+    extras = [index] * return_index + [inverse] * return_inverse
+    return tuple([unique] + extras) if extras else unique
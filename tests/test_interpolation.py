@@ -0,0 +1,316 @@
+#!/usr/bin python
+# -*- coding: utf-8 -*-
+"""
+This file is part of the pyquaternion python module
+
+Author:         Kieran Wynn
+Website:        https://github.com/KieranWynn/pyquaternion
+Documentation:  http://kieranwynn.github.io/pyquaternion/
+
+Version:         1.0.0
+License:         The MIT License (MIT)
+
+Copyright (c) 2015 Kieran Wynn
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+test_quaternion_array.py - Unit test for batched quaternion_array module
+
+"""
+
+import unittest
+
+import numpy as np
+
+from pyquaternion import Quaternion, QuaternionArray, SlerpPlan, IntermediatesSequence, OrientationTrack, SquadSpline, CumulativeBSpline
+
+
+ALMOST_EQUAL_TOLERANCE = 13
+
+class TestSlerpPlan(unittest.TestCase):
+
+    def test_matches_slerp(self):
+        for _ in range(10):
+            q0, q1 = Quaternion.random(), Quaternion.random()
+            plan = SlerpPlan(q0, q1)
+            for amount in np.linspace(0, 1, 11):
+                self.assertEqual(plan(amount), Quaternion.slerp(q0, q1, amount))
+
+    def test_nearby_and_opposite_endpoints(self):
+        q0 = Quaternion.random()
+        for q1 in [Quaternion(q0.q * 1.00001), -q0, Quaternion(axis=[1, 0, 0], angle=0.001) * -q0]:
+            plan = SlerpPlan(q0, q1)
+            for amount in [0.0, 0.25, 1.0]:
+                self.assertEqual(plan(amount), Quaternion.slerp(q0, q1, amount))
+
+    def test_default_amount(self):
+        q0, q1 = Quaternion.random(), Quaternion.random()
+        self.assertEqual(SlerpPlan(q0, q1)(), Quaternion.slerp(q0, q1))
+
+    def test_evaluate(self):
+        q0, q1 = Quaternion.random(), Quaternion.random()
+        amounts = np.random.random(20)
+        result = SlerpPlan(q0, q1).evaluate(amounts)
+        self.assertIsInstance(result, QuaternionArray)
+        self.assertEqual(len(result), 20)
+        for q, amount in zip(result, amounts):
+            self.assertEqual(q, Quaternion.slerp(q0, q1, amount))
+        self.assertEqual(SlerpPlan(q0, q1).elements(np.zeros((2, 3))).shape, (2, 3, 4))
+
+    def test_intermediates(self):
+        q0, q1 = Quaternion.random(), Quaternion.random()
+        for include_endpoints in [False, True]:
+            result = SlerpPlan(q0, q1).intermediates(8, include_endpoints)
+            expected = list(Quaternion.intermediates(q0, q1, 8, include_endpoints))
+            self.assertEqual(len(result), len(expected))
+            for q, e in zip(result, expected):
+                self.assertEqual(q, e)
+
+    def test_endpoints_not_modified(self):
+        q0, q1 = Quaternion(1, 2, 3, 4), Quaternion(-4, 3, -2, 1)
+        e0, e1 = q0.q.copy(), q1.q.copy()
+        plan = SlerpPlan(q0, q1)
+        plan.evaluate(np.linspace(0, 1, 5))
+        np.testing.assert_array_equal(q0.q, e0)
+        np.testing.assert_array_equal(q1.q, e1)
+        np.testing.assert_almost_equal(plan.evaluate(np.linspace(0, 1, 5)).norm, np.ones(5), decimal=ALMOST_EQUAL_TOLERANCE)
+
+
+class TestIntermediatesSequence(unittest.TestCase):
+
+    def setUp(self):
+        self.q0, self.q1 = Quaternion.random(), Quaternion.random()
+
+    def test_matches_generator(self):
+        for include_endpoints in [False, True]:
+            seq = Quaternion.intermediates(self.q0, self.q1, 10, include_endpoints, lazy=True)
+            expected = list(Quaternion.intermediates(self.q0, self.q1, 10, include_endpoints))
+            self.assertIsInstance(seq, IntermediatesSequence)
+            self.assertEqual(len(seq), len(expected))
+            self.assertEqual(list(seq), expected)
+            for i in reversed(range(len(seq))):
+                self.assertEqual(seq[i], expected[i])
+
+    def test_indexing(self):
+        seq = Quaternion.intermediates(self.q0, self.q1, 1000000, include_endpoints=True, lazy=True)
+        self.assertEqual(len(seq), 1000002)
+        self.assertEqual(seq[-1], seq[1000001])
+        self.assertEqual(seq[0], Quaternion.slerp(self.q0, self.q1, 0.0))
+        self.assertEqual(seq[500000], Quaternion.slerp(self.q0, self.q1, 500000 / 1000001.0))
+        with self.assertRaises(IndexError):
+            seq[1000002]
+        with self.assertRaises(IndexError):
+            seq[-1000003]
+        with self.assertRaises(TypeError):
+            seq[1.5]
+
+    def test_slicing(self):
+        seq = Quaternion.intermediates(self.q0, self.q1, 20, lazy=True)
+        expected = list(Quaternion.intermediates(self.q0, self.q1, 20))
+        for s in [slice(2, 8), slice(None, None, -3), slice(15, None)]:
+            part = seq[s]
+            self.assertIsInstance(part, QuaternionArray)
+            self.assertEqual(len(part), len(expected[s]))
+            for q, e in zip(part, expected[s]):
+                self.assertEqual(q, e)
+        self.assertEqual(len(seq[5:5]), 0)
+
+    def test_to_array(self):
+        seq = Quaternion.intermediates(self.q0, self.q1, 50, include_endpoints=True, lazy=True)
+        array = seq.to_array()
+        np.testing.assert_array_equal(array.q, SlerpPlan(self.q0, self.q1).intermediates(50, True).q)
+        for i in [0, 17, 51]:
+            self.assertEqual(array[i], seq[i])
+
+    def test_cache_bounded(self):
+        seq = SlerpPlan(self.q0, self.q1).sequence(1000, cache_size=4)
+        for i in range(100):
+            seq[i]
+        self.assertEqual(len(seq._cache), 4)
+        self.assertEqual(list(seq._cache), [96, 97, 98, 99])
+        seq[97]
+        seq[500]
+        self.assertEqual(list(seq._cache), [98, 99, 97, 500])
+        self.assertEqual(len(SlerpPlan(self.q0, self.q1).sequence(10, cache_size=0)[0:3]), 3)
+
+    def test_cached_results_are_copies(self):
+        seq = SlerpPlan(self.q0, self.q1).sequence(10)
+        q = seq[3]
+        expected = Quaternion(q.q.copy())
+        q[0] = 5.0
+        self.assertEqual(seq[3], expected)
+
+
+class TestOrientationTrack(unittest.TestCase):
+
+    def assertSameRotation(self, q, expected):
+        # Quaternions of opposite sign represent the same rotation
+        self.assertTrue(q == expected or q == -expected, "{!r} != {!r}".format(q, expected))
+
+    def setUp(self):
+        self.times = np.cumsum(np.random.uniform(0.1, 1.0, 20))
+        self.orientations = QuaternionArray.random(20)
+        self.track = OrientationTrack(self.times, self.orientations)
+
+    def expected(self, t):
+        i = np.searchsorted(self.times, t, side='right') - 1
+        if i < 0:
+            return self.orientations[0]
+        if i >= len(self.times) - 1:
+            return self.orientations[-1]
+        amount = (t - self.times[i]) / (self.times[i + 1] - self.times[i])
+        return Quaternion.slerp(self.orientations[i], self.orientations[i + 1], amount)
+
+    def test_samples(self):
+        self.assertEqual(len(self.track), 20)
+        for t, q in zip(self.times, self.orientations):
+            self.assertSameRotation(self.track(t), q)
+
+    def test_matches_slerp(self):
+        for t in np.random.uniform(self.times[0], self.times[-1], 50):
+            self.assertSameRotation(self.track(t), self.expected(t))
+
+    def test_evaluate(self):
+        queries = np.random.uniform(self.times[0] - 1.0, self.times[-1] + 1.0, 200)
+        result = self.track.evaluate(queries)
+        self.assertIsInstance(result, QuaternionArray)
+        self.assertEqual(len(result), 200)
+        for q, t in zip(result, queries):
+            self.assertSameRotation(q, self.expected(t))
+
+    def test_clamped(self):
+        self.assertSameRotation(self.track(self.times[0] - 10.0), self.orientations[0])
+        self.assertSameRotation(self.track(self.times[-1] + 10.0), self.orientations[-1])
+
+    def test_continuous(self):
+        # Elements either side of every sample time agree, with no jumps in sign
+        eps = 1e-9
+        before = self.track.evaluate(self.times[1:-1] - eps).q
+        after = self.track.evaluate(self.times[1:-1] + eps).q
+        np.testing.assert_allclose(before, after, atol=1e-6)
+        np.testing.assert_almost_equal(self.track.evaluate(self.times).q, self.track.orientations.q, decimal=ALMOST_EQUAL_TOLERANCE)
+
+    def test_unsorted_and_pairs(self):
+        order = np.random.permutation(20)
+        track = OrientationTrack(self.times[order], self.orientations[order])
+        np.testing.assert_array_equal(track.times, self.times)
+        queries = np.linspace(self.times[0], self.times[-1], 30)
+        np.testing.assert_array_equal(track.evaluate(queries).q, self.track.evaluate(queries).q)
+        track = OrientationTrack.from_pairs(zip(self.times, self.orientations))
+        np.testing.assert_array_equal(track.evaluate(queries).q, self.track.evaluate(queries).q)
+
+    def test_single_sample(self):
+        q = Quaternion.random()
+        track = OrientationTrack([3.0], [q])
+        self.assertEqual(track(0.0), q)
+        self.assertEqual(len(track.evaluate([1.0, 5.0])), 2)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            OrientationTrack([], [])
+        with self.assertRaises(ValueError):
+            OrientationTrack([1.0, 2.0], QuaternionArray.random(3))
+        with self.assertRaises(ValueError):
+            OrientationTrack([1.0, 1.0], QuaternionArray.random(2))
+
+
+def angularVelocity(spline, times, h=1e-6):
+    # Central difference of the rotation, as a rate vector about the global axes
+    q0 = spline.evaluate(times - h)
+    q1 = spline.evaluate(times + h)
+    q0 = QuaternionArray(q0.q * np.sign(np.einsum('ij,ij->i', q0.q, q1.q))[:, np.newaxis])
+    return (q1 * q0.conjugate).vector / h
+
+class TestSplines(unittest.TestCase):
+
+    def setUp(self):
+        self.times = np.arange(12.0)
+        self.orientations = QuaternionArray.random(12)
+
+    def assertSameRotation(self, q, expected):
+        self.assertTrue(q == expected or q == -expected, "{!r} != {!r}".format(q, expected))
+
+    def test_squad_interpolates_keyframes(self):
+        spline = SquadSpline(self.times, self.orientations)
+        self.assertEqual(len(spline), 12)
+        for t, q in zip(self.times, self.orientations):
+            self.assertSameRotation(spline(t), q)
+
+    def test_squad_two_keyframes_is_slerp(self):
+        q0, q1 = Quaternion.random(), Quaternion.random()
+        spline = SquadSpline([0.0, 1.0], [q0, q1])
+        for u in np.linspace(0, 1, 9):
+            self.assertSameRotation(spline(u), Quaternion.slerp(q0, q1, u))
+
+    def test_continuous_angular_velocity(self):
+        keyframes = self.times[1:-1]
+        eps = 1e-3
+        for spline in [SquadSpline(self.times, self.orientations), CumulativeBSpline(self.times, self.orientations)]:
+            before = angularVelocity(spline, keyframes - eps)
+            after = angularVelocity(spline, keyframes + eps)
+            self.assertLess(np.abs(after - before).max(), 0.1)
+        # Piecewise slerp has a step change in angular velocity at every keyframe
+        track = OrientationTrack(self.times, self.orientations)
+        self.assertGreater(np.abs(angularVelocity(track, keyframes + eps) - angularVelocity(track, keyframes - eps)).max(), 0.1)
+
+    def test_bspline_constant_rotation(self):
+        # Evenly spaced keyframes of a constant rate rotation are followed exactly
+        angles = np.linspace(0, 3.0, 7)
+        keyframes = [Quaternion(axis=[0, 1, 1], angle=a) for a in angles]
+        spline = CumulativeBSpline(angles, keyframes)
+        for a in np.linspace(angles[2], angles[-3], 11):
+            self.assertSameRotation(spline(a), Quaternion(axis=[0, 1, 1], angle=a))
+
+    def test_evaluate(self):
+        queries = np.random.uniform(-1.0, 13.0, 100)
+        for spline in [SquadSpline(self.times, self.orientations), CumulativeBSpline(self.times, self.orientations)]:
+            result = spline.evaluate(queries)
+            self.assertIsInstance(result, QuaternionArray)
+            np.testing.assert_almost_equal(result.norm, np.ones(100), decimal=ALMOST_EQUAL_TOLERANCE)
+            for q, t in zip(result, queries):
+                self.assertEqual(q, spline(t))
+            self.assertEqual(spline(-5.0), spline(self.times[0]))
+            self.assertEqual(spline(50.0), spline(self.times[-1]))
+
+    def test_insert(self):
+        queries = np.linspace(-1.0, 13.0, 300)
+        for cls in [SquadSpline, CumulativeBSpline]:
+            expected = cls(self.times, self.orientations).evaluate(queries)
+            for k in [0, 5, 11]:
+                keep = np.arange(12) != k
+                spline = cls(self.times[keep], self.orientations[keep])
+                spline.insert(self.times[k], self.orientations[k])
+                self.assertEqual(len(spline), 12)
+                np.testing.assert_array_equal(spline.evaluate(queries).q, expected.q)
+            spline = cls([0.0], [Quaternion.random()])
+            spline.insert(1.0, Quaternion.random())
+            self.assertEqual(len(spline.evaluate(queries)), 300)
+            with self.assertRaises(ValueError):
+                spline.insert(1.0, Quaternion.random())
+
+    def test_insert_is_local(self):
+        spline = SquadSpline(self.times, self.orientations)
+        controls = spline._s.copy()
+        spline.insert(5.5, Quaternion.random())
+        np.testing.assert_array_equal(spline._s[:5], controls[:5])
+        np.testing.assert_array_equal(spline._s[8:], controls[7:])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -35,12 +35,12 @@ test_quaternion.py - Unit test for quaternion module
 """
 
 import unittest
-from math import pi, sin, cos
+from math import pi, sin, cos, log, isnan
 from random import random
 
 import numpy as np
 
-from pyquaternion import Quaternion
+from pyquaternion import Quaternion, FrozenQuaternion, QuaternionArray
 
 
 ALMOST_EQUAL_TOLERANCE = 13
@@ -72,6 +72,15 @@ class TestQuaternionInitialisation(unittest.TestCase):
         self.assertIsInstance(r1, Quaternion)
         #self.assertNotEqual(r1, r2) #TODO, this *may* fail at random
 
+    def test_init_random_seeded(self):
+        r1 = Quaternion.random(rng=np.random.RandomState(7))
+        r2 = Quaternion.random(rng=np.random.RandomState(7))
+        self.assertEqual(r1, r2)
+        self.assertAlmostEqual(r1.norm, 1.0, ALMOST_EQUAL_TOLERANCE)
+        batch = Quaternion.random(3, rng=np.random.RandomState(7))
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(batch[0], r1)
+
     def test_init_from_scalar(self):
         s = random()
         q1 = Quaternion(s)
@@ -277,6 +286,15 @@ class TestQuaternionInitialisation(unittest.TestCase):
         with self.assertRaises(ZeroDivisionError):
             q = Quaternion(axis=[0., 0., 0.], angle=theta)
 
+    def test_init_from_array_trusted(self):
+        a = np.random.uniform(-1, 1, 4)
+        q1 = Quaternion.from_array(a)
+        q2 = Quaternion.from_array(a, copy=False)
+        self.assertIsInstance(q1, Quaternion)
+        self.assertEqual(q1, Quaternion(array=a))
+        self.assertFalse(q1.q is a)
+        self.assertTrue(q2.q is a)
+
     def test_init_from_explicit_matrix(self):
 
         def R_z(theta):
@@ -515,6 +533,13 @@ class TestQuaternionArithmetic(unittest.TestCase):
         self.assertEqual(k * k, -one)
         self.assertEqual(i * j * k, -one)
 
+    def test_multiplication_matches_matrix_form(self):
+        for _ in range(10):
+            p = Quaternion(randomElements())
+            q = Quaternion(randomElements())
+            np.testing.assert_almost_equal((p * q).q, np.dot(p._q_matrix(), q.q), decimal=ALMOST_EQUAL_TOLERANCE)
+            np.testing.assert_almost_equal((p * q).q, np.dot(q._q_bar_matrix(), p.q), decimal=ALMOST_EQUAL_TOLERANCE)
+
     def test_multiply_by_scalar(self):
         a, b, c, d = randomElements()
         q1 = Quaternion(a, b, c, d)
@@ -603,6 +628,28 @@ class TestQuaternionArithmetic(unittest.TestCase):
         with self.assertRaises(ValueError):
             q4 = q1 / 's'
 
+    def test_scalar_operands(self):
+        from fractions import Fraction
+        q = Quaternion(randomElements())
+        elements = q.elements.copy()
+        for s in [2.5, -3, np.float64(0.7), np.int32(4), Fraction(1, 4), True]:
+            p = Quaternion(float(s))
+            for result, expected in [(q + s, q + p), (s + q, p + q), (q - s, q - p), (s - q, p - q),
+                                     (q * s, q * p), (s * q, p * q), (q / s, q / p)]:
+                self.assertIs(type(result), Quaternion)
+                self.assertEqual(result.q.dtype, np.float64)
+                self.assertEqual(result, expected)
+            if q:
+                self.assertEqual(s / q, p / q)
+            self.assertEqual(q @ s, q @ p)
+            self.assertEqual(s @ q, p @ q)
+        np.testing.assert_array_equal(q.elements, elements)
+        # Divisors are zero within the tolerance of equality, as for Quaternion divisors
+        with self.assertRaises(ZeroDivisionError):
+            q / 1e-15
+        with self.assertRaises(ZeroDivisionError):
+            q / Quaternion(1e-15)
+
     def test_squared(self):
         one = Quaternion(1.0, 0.0, 0.0, 0.0)
         i   = Quaternion(0.0, 1.0, 0.0, 0.0)
@@ -716,6 +763,79 @@ class TestQuaternionFeatures(unittest.TestCase):
         self.assertFalse(q2.is_unit())
         self.assertTrue(q2.is_unit(0.001))
 
+    def test_known_unit_tracking(self):
+        p = Quaternion.random()
+        q = Quaternion(axis=[1, 2, 3], angle=0.5)
+        for unit in [p, q, p.conjugate, -p, p * q, p.normalised, Quaternion.slerp(p, q, 0.3)]:
+            self.assertIsNotNone(unit._known_unit)
+            self.assertTrue(unit.is_unit(1e-13))
+        for unknown in [Quaternion(1, 2, 3, 4), p + q, p * Quaternion(1, 2, 3, 4), 2 * p, p.inverse,
+                        Quaternion(p), Quaternion(matrix=p.rotation_matrix)]:
+            self.assertIsNone(unknown._known_unit)
+
+    def test_known_unit_product_limit(self):
+        p = Quaternion.random()
+        for _ in range(100):
+            p = p * Quaternion.random()
+            self.assertTrue(p._known_unit is None or p._known_unit <= 4)
+        p._normalise()
+        self.assertEqual(p._known_unit, 0)
+
+    def test_known_unit_reset_on_modification(self):
+        q = Quaternion.random()
+        q[0] = 2.0
+        self.assertIsNone(q._known_unit)
+        q = Quaternion.random()
+        q.vector = [1.0, 2.0, 3.0]
+        self.assertIsNone(q._known_unit)
+        q = Quaternion.random()
+        q.q = np.array([1.0, 2.0, 3.0, 4.0])
+        self.assertIsNone(q._known_unit)
+        np.testing.assert_almost_equal(q.rotation_matrix, q.normalised.rotation_matrix, decimal=ALMOST_EQUAL_TOLERANCE)
+        self.assertAlmostEqual(np.linalg.det(q.rotation_matrix), 1.0, ALMOST_EQUAL_TOLERANCE)
+
+    def test_known_unit_reset_on_in_place_write(self):
+        for accessor in ['q', 'elements']:
+            q = Quaternion(axis=[0, 0, 1], angle=0.7)
+            getattr(q, accessor)[0] = 5.0
+            expected = Quaternion(q.q.copy())
+            self.assertEqual(q.inverse * q, Quaternion(1.0))
+            np.testing.assert_almost_equal(q.rotate([1.0, 0.0, 0.0]), expected.rotate([1.0, 0.0, 0.0]), decimal=ALMOST_EQUAL_TOLERANCE)
+            np.testing.assert_almost_equal(q.rotation_matrix, expected.rotation_matrix, decimal=ALMOST_EQUAL_TOLERANCE)
+            self.assertTrue(q.normalised.is_unit())
+        q = Quaternion(axis=[0, 0, 1], angle=0.7)
+        q.vector[0] = 5.0
+        self.assertEqual(q.inverse * q, Quaternion(1.0))
+        self.assertTrue(q.normalised.is_unit())
+
+    def test_known_unit_reset_on_aliasing(self):
+        a = Quaternion(axis=[0, 0, 1], angle=0.7)
+        b = Quaternion(a)
+        b[0] = 3.0
+        self.assertEqual(a[0], 3.0)
+        self.assertEqual(a.inverse * a, Quaternion(1.0))
+        self.assertTrue(a.normalised.is_unit())
+        a = Quaternion(axis=[0, 0, 1], angle=0.7)
+        b = Quaternion(a)
+        a.integrate([0, 0, 0], 0.1)
+        b[0] = 3.0
+        self.assertIsNotNone(a._known_unit)
+        self.assertTrue(a.is_unit())
+        self.assertAlmostEqual(np.linalg.det(a.rotation_matrix), 1.0, ALMOST_EQUAL_TOLERANCE)
+        for normalise in [Quaternion._normalise, Quaternion._fast_normalise]:
+            a = Quaternion(axis=[0, 0, 1], angle=0.7)
+            b = Quaternion(a)
+            normalise(a)
+            b[0] = 3.0
+            self.assertTrue(a.is_unit())
+
+    def test_known_unit_not_assumed_from_matrix(self):
+        R = Quaternion(axis=[1, 2, 3], angle=0.5).rotation_matrix * (1 + 3e-6)
+        m = Quaternion(matrix=R)
+        self.assertIsNone(m._known_unit)
+        self.assertEqual(m.inverse * m, Quaternion(1.0))
+        self.assertTrue(m.normalised.is_unit())
+
     def test_q_matrix(self):
         a, b, c, d = randomElements()
         q = Quaternion(a, b, c, d)
@@ -802,6 +922,60 @@ class TestQuaternionFeatures(unittest.TestCase):
             np.testing.assert_almost_equal(q2.rotate((0, r, 0)), q3.rotate((0, r, 0)), decimal=ALMOST_EQUAL_TOLERANCE)
             np.testing.assert_almost_equal(q2.rotate((0, 0, r)), q3.rotate((0, 0, r)), decimal=ALMOST_EQUAL_TOLERANCE)
 
+    def test_read_paths_do_not_modify_object(self):
+        q = Quaternion(1.0, 2.0, 3.0, 4.0)
+        elements = q.elements.copy()
+        unit = q.normalised
+        np.testing.assert_almost_equal(q.rotate([1.0, 2.0, 3.0]), unit.rotate([1.0, 2.0, 3.0]), decimal=ALMOST_EQUAL_TOLERANCE)
+        np.testing.assert_almost_equal(q.rotation_matrix, unit.rotation_matrix, decimal=ALMOST_EQUAL_TOLERANCE)
+        np.testing.assert_almost_equal(q.yaw_pitch_roll, unit.yaw_pitch_roll, decimal=ALMOST_EQUAL_TOLERANCE)
+        np.testing.assert_almost_equal(q.axis, unit.axis, decimal=ALMOST_EQUAL_TOLERANCE)
+        self.assertAlmostEqual(q.angle, unit.angle, ALMOST_EQUAL_TOLERANCE)
+        np.testing.assert_array_equal(q.elements, elements)
+
+    def test_concurrent_reads(self):
+        import threading
+        q = Quaternion(1.0, 2.0, 3.0, 4.0)
+        expected = q.normalised.rotation_matrix
+        errors = []
+
+        def worker():
+            for _ in range(200):
+                if not np.allclose(q.rotation_matrix, expected):
+                    errors.append(q.elements.copy())
+                Quaternion.slerp(q, Quaternion(-1.0, 0.0, 0.0, 0.0), 0.5)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+        np.testing.assert_array_equal(q.elements, [1.0, 2.0, 3.0, 4.0])
+
+    def test_rotate_many(self):
+        q = Quaternion(randomElements())
+        v = np.random.uniform(-10, 10, (50, 3))
+        rotated = q.rotate(v)
+        self.assertEqual(rotated.shape, (50, 3))
+        for u, r in zip(v, rotated):
+            np.testing.assert_almost_equal(r, q.rotate(u), decimal=ALMOST_EQUAL_TOLERANCE)
+
+        out = np.empty_like(v)
+        result = q.rotate(v, out=out)
+        self.assertTrue(result is out)
+        np.testing.assert_array_equal(out, rotated)
+        with self.assertRaises(ValueError):
+            q.rotate(np.zeros((5, 4)))
+
+        # The zero quaternion maps every vector to zero on every path
+        zero = Quaternion(0.0, 0.0, 0.0, 0.0)
+        np.testing.assert_array_equal(zero.rotate([1.0, 2.0, 3.0]), [0.0, 0.0, 0.0])
+        np.testing.assert_array_equal(zero.rotate(v), np.zeros((50, 3)))
+        np.testing.assert_array_equal(QuaternionArray([zero] * 50).rotate(v), np.zeros((50, 3)))
+        both = QuaternionArray([zero, q])
+        np.testing.assert_almost_equal(both.rotate(v[:2]), [zero.rotate(v[0]), q.rotate(v[1])], decimal=ALMOST_EQUAL_TOLERANCE)
+
     def test_conversion_to_matrix(self):
         q = Quaternion.random()
         a, b, c, d = tuple(q.elements)
@@ -962,6 +1136,23 @@ class TestQuaternionFeatures(unittest.TestCase):
         q._normalise()
         self.assertAlmostEqual(0, Quaternion.distance(q,p), places=8)
 
+    def test_distance_matches_maps(self):
+        for _ in range(20):
+            q = Quaternion(randomElements())
+            p = Quaternion(randomElements())
+            self.assertAlmostEqual(Quaternion.distance(q, p), Quaternion.log_map(q, p).norm, ALMOST_EQUAL_TOLERANCE)
+            self.assertAlmostEqual(Quaternion.sym_distance(q, p), Quaternion.sym_log_map(q, p).norm, ALMOST_EQUAL_TOLERANCE)
+            self.assertAlmostEqual(Quaternion.absolute_distance(q, p), min((q - p).norm, (q + p).norm), ALMOST_EQUAL_TOLERANCE)
+        for q, p in [(3, -0.5), (1, -1), (2, 5), (0.5, Quaternion(1, 2, 3, 4))]:
+            q, p = Quaternion(q), Quaternion(p)
+            self.assertAlmostEqual(Quaternion.distance(q, p), Quaternion.log_map(q, p).norm, ALMOST_EQUAL_TOLERANCE)
+            self.assertAlmostEqual(Quaternion.sym_distance(q, p), Quaternion.sym_log_map(q, p).norm, ALMOST_EQUAL_TOLERANCE)
+        self.assertAlmostEqual(Quaternion.sym_distance(Quaternion(3), Quaternion(-0.5)), log(6), ALMOST_EQUAL_TOLERANCE)
+        self.assertEqual(Quaternion.sym_distance(Quaternion(1), Quaternion(-1)), 0.0)
+        self.assertTrue(isnan(Quaternion.sym_distance(Quaternion(-2), Quaternion(0.7))))
+        with self.assertRaises(ZeroDivisionError):
+            Quaternion.distance(Quaternion(0), q)
+
     def test_absolute_distance(self):
         q = Quaternion(scalar=0, vector=[1,0,0])
         p = Quaternion(scalar=0, vector=[0,1,0])
@@ -1013,6 +1204,16 @@ class TestQuaternionFeatures(unittest.TestCase):
                 assert q4 == q6 or q4 == -q6
                 assert q5 == q7 or q5 == -q7
 
+    def test_slerp_does_not_modify_endpoints(self):
+        q1 = Quaternion(2.0, 0.0, 0.0, 0.0)
+        q2 = Quaternion(axis=[1, 0, 0], angle=3 * pi / 2) # Negative dot product with q1
+        e1, e2 = q1.elements.copy(), q2.elements.copy()
+        q3 = Quaternion.slerp(q1, q2, 0.5)
+        expected = Quaternion(axis=[1, 0, 0], angle=-pi / 4)
+        self.assertTrue(q3 == expected or q3 == -expected)
+        np.testing.assert_array_equal(q1.elements, e1)
+        np.testing.assert_array_equal(q2.elements, e2)
+
     def test_interpolate(self):
         q1 = Quaternion(axis=[1, 0, 0], angle=0.0)
         q2 = Quaternion(axis=[1, 0, 0], angle=2*pi/3)
@@ -1075,6 +1276,90 @@ class TestQuaternionUtilities(unittest.TestCase):
         self.assertFalse(q is q2)
         self.assertFalse(q.q is q2.q)
 
+    def test_compact_representation(self):
+        import pickle
+        import weakref
+        q = Quaternion.random()
+        self.assertFalse(hasattr(q, '__dict__'))
+        with self.assertRaises(AttributeError):
+            q.label = "orientation"
+        self.assertTrue(weakref.ref(q)() is q)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            q2 = pickle.loads(pickle.dumps(q, protocol=protocol))
+            self.assertEqual(q, q2)
+            self.assertEqual(q2._known_unit, q._known_unit)
+            q2 = pickle.loads(pickle.dumps(Quaternion(1, 2, 3, 4), protocol=protocol))
+            np.testing.assert_array_equal(q2.q, [1.0, 2.0, 3.0, 4.0])
+            self.assertIsNone(q2._known_unit)
+
+class TestQuaternionCaching(unittest.TestCase):
+    def test_cached_values_match(self):
+        q = Quaternion.random()
+        q.enable_cache()
+        for _ in range(2):
+            np.testing.assert_array_equal(q.rotation_matrix, q.normalised.rotation_matrix)
+            self.assertEqual(q.norm, q.normalised.norm)
+            self.assertEqual(q.inverse, q.normalised.inverse)
+            self.assertEqual(q.yaw_pitch_roll, q.normalised.yaw_pitch_roll)
+            self.assertEqual(q.angle, q.normalised.angle)
+
+    def test_cached_values_are_copies(self):
+        q = Quaternion.random()
+        q.enable_cache()
+        R = q.rotation_matrix
+        R[0, 0] = 100.0
+        self.assertNotEqual(q.rotation_matrix[0, 0], 100.0)
+        inverse = q.inverse
+        inverse[0] = 100.0
+        self.assertNotEqual(q.inverse[0], 100.0)
+
+    def test_cache_invalidation(self):
+        q = Quaternion(axis=[0, 0, 1], angle=pi / 2)
+        q.enable_cache()
+        self.assertAlmostEqual(q.angle, pi / 2, ALMOST_EQUAL_TOLERANCE)
+
+        q.q = Quaternion(axis=[0, 0, 1], angle=pi / 4).q
+        self.assertAlmostEqual(q.angle, pi / 4, ALMOST_EQUAL_TOLERANCE)
+
+        q[0] = 0.0
+        self.assertEqual(q.norm, np.linalg.norm(q.vector))
+
+        q.vector = [1.0, 0.0, 0.0]
+        np.testing.assert_almost_equal(q.axis, [1.0, 0.0, 0.0], decimal=ALMOST_EQUAL_TOLERANCE)
+        self.assertAlmostEqual(q.angle, pi, ALMOST_EQUAL_TOLERANCE)
+
+    def test_disable_cache(self):
+        q = Quaternion.random()
+        q.enable_cache()
+        q.norm
+        q.disable_cache()
+        self.assertIsNone(q._cache)
+        self.assertAlmostEqual(q.norm, 1.0, ALMOST_EQUAL_TOLERANCE)
+
+class TestQuaternionBackends(unittest.TestCase):
+    def tearDown(self):
+        Quaternion.set_backend('python')
+
+    def test_default_backend(self):
+        self.assertEqual(Quaternion.get_backend(), 'python')
+
+    def test_backends_agree(self):
+        p = Quaternion(randomElements())
+        q = Quaternion(randomElements())
+        results = {}
+        for name in ['python', 'numpy']:
+            Quaternion.set_backend(name)
+            self.assertEqual(Quaternion.get_backend(), name)
+            results[name] = [-p, p + q, p - q, p * q, p.conjugate, p.inverse, p / q,
+                             Quaternion(p.norm), Quaternion(float(p.is_unit()))]
+        for a, b in zip(results['python'], results['numpy']):
+            self.assertEqual(a, b)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            Quaternion.set_backend('fortran')
+        self.assertEqual(Quaternion.get_backend(), 'python')
+
 class TestQuaternionHashing(unittest.TestCase):
     def test_equal_quaternions(self):
         q1 = Quaternion(1, 0, 0, 0)
@@ -1089,5 +1374,108 @@ class TestQuaternionHashing(unittest.TestCase):
         self.assertNotEqual(hash(q1), hash(q2))
 
 
+class TestFrozenQuaternion(unittest.TestCase):
+
+    def test_init(self):
+        q = Quaternion(randomElements())
+        f = FrozenQuaternion(q)
+        self.assertEqual(f, q)
+        self.assertFalse(f.q is q.q)
+        q[0] = 5.0
+        self.assertNotEqual(f, q)
+        self.assertEqual(FrozenQuaternion(axis=[1, 0, 0], angle=pi / 2), Quaternion(axis=[1, 0, 0], angle=pi / 2))
+        self.assertEqual(FrozenQuaternion(1, 2, 3, 4), Quaternion(1, 2, 3, 4))
+        # Frozen elements are shared along with the hash
+        g = FrozenQuaternion(f)
+        self.assertTrue(g.q is f.q)
+        self.assertEqual(hash(g), hash(f))
+
+    def test_from_array_view(self):
+        qa = QuaternionArray([[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]])
+        f = FrozenQuaternion.from_array(qa.q[0], copy=False)
+        h = hash(f)
+        qa.q[0, 0] = 5.0
+        self.assertEqual(f[0], 1.0)
+        self.assertEqual(hash(f), h)
+        self.assertEqual(hash(f), hash(FrozenQuaternion(1, 0, 0, 0)))
+        a = np.array([1.0, 2.0, 3.0, 4.0])
+        self.assertTrue(FrozenQuaternion.from_array(a, copy=False).q is a)
+
+    def test_rotate(self):
+        f = FrozenQuaternion(axis=[0, 0, 1], angle=pi / 2)
+        elements = f.q
+        np.testing.assert_almost_equal(f.rotate([1.0, 0.0, 0.0]), [0.0, 1.0, 0.0], decimal=ALMOST_EQUAL_TOLERANCE)
+        rotated = f.rotate(Quaternion(vector=[1.0, 0.0, 0.0]))
+        self.assertIsInstance(rotated, FrozenQuaternion)
+        self.assertEqual(rotated, Quaternion(vector=[0.0, 1.0, 0.0]))
+        self.assertTrue(f.q is elements)
+
+    def test_immutable(self):
+        f = FrozenQuaternion(1, 2, 3, 4)
+        with self.assertRaises(AttributeError):
+            f.q = np.zeros(4)
+        with self.assertRaises(AttributeError):
+            f.vector = [0, 0, 1]
+        with self.assertRaises(TypeError):
+            f[0] = 0.0
+        with self.assertRaises(ValueError):
+            f.q[0] = 0.0
+        with self.assertRaises(AttributeError):
+            f.integrate([1, 0, 0], 0.1)
+        with self.assertRaises(AttributeError):
+            f._normalise()
+        with self.assertRaises(AttributeError):
+            f.foo = 1
+        self.assertEqual(f, Quaternion(1, 2, 3, 4))
+
+    def test_hash(self):
+        f = FrozenQuaternion(randomElements())
+        q = Quaternion(f.elements)
+        self.assertEqual(hash(f), hash(q))
+        cache = {f: 1}
+        self.assertEqual(cache[FrozenQuaternion(q)], 1)
+        self.assertEqual(cache[q], 1)
+        self.assertEqual(len({f, FrozenQuaternion(f), f.thaw()}), 1)
+
+    def test_operations(self):
+        p = FrozenQuaternion.random()
+        q = FrozenQuaternion.random()
+        self.assertIsInstance(p, FrozenQuaternion)
+        for result in [p * q, p + q, p - q, -p, p / q, p ** 0.5, 2 * p, p.inverse, p.conjugate, p.normalised,
+                       FrozenQuaternion.slerp(p, q, 0.3), FrozenQuaternion.exp(p)]:
+            self.assertIsInstance(result, FrozenQuaternion)
+            self.assertFalse(result.q.flags.writeable)
+        self.assertEqual(p * q, p.thaw() * q.thaw())
+        self.assertEqual(FrozenQuaternion.slerp(p, q, 0.3), Quaternion.slerp(p.thaw(), q.thaw(), 0.3))
+        np.testing.assert_array_equal(p.rotation_matrix, p.thaw().rotation_matrix)
+        s = FrozenQuaternion(1, 2, 3, 4)
+        self.assertTrue(s.normalised.is_unit())
+        self.assertEqual(s, Quaternion(1, 2, 3, 4))
+
+    def test_thaw(self):
+        f = FrozenQuaternion(1, 2, 3, 4)
+        for q in [f.thaw(), Quaternion(f)]:
+            self.assertIs(type(q), Quaternion)
+            q[0] = 0.0
+            self.assertEqual(q, Quaternion(0, 2, 3, 4))
+        self.assertEqual(f, Quaternion(1, 2, 3, 4))
+        shared = f.thaw(copy=False)
+        self.assertTrue(shared.q is f.q)
+
+    def test_copy_and_pickle(self):
+        from copy import copy, deepcopy
+        import pickle
+        f = FrozenQuaternion(randomElements())
+        self.assertIs(copy(f), f)
+        self.assertIs(deepcopy(f), f)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            g = pickle.loads(pickle.dumps(f, protocol=protocol))
+            self.assertIsInstance(g, FrozenQuaternion)
+            self.assertEqual(g, f)
+            self.assertEqual(hash(g), hash(f))
+            self.assertFalse(g.q.flags.writeable)
+        self.assertEqual(repr(FrozenQuaternion(1, 0, 0, 0))[:17], "FrozenQuaternion(")
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,365 @@
+#!/usr/bin python
+# -*- coding: utf-8 -*-
+"""
+This file is part of the pyquaternion python module
+
+Author:         Kieran Wynn
+Website:        https://github.com/KieranWynn/pyquaternion
+Documentation:  http://kieranwynn.github.io/pyquaternion/
+
+Version:         1.0.0
+License:         The MIT License (MIT)
+
+Copyright (c) 2015 Kieran Wynn
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+test_quaternion_array.py - Unit test for batched quaternion_array module
+
+"""
+
+import unittest
+from math import log
+
+import numpy as np
+
+from pyquaternion import Quaternion, QuaternionArray
+
+
+ALMOST_EQUAL_TOLERANCE = 13
+
+def randomArray(n=16):
+    return np.random.uniform(-1, 1, (n, 4))
+
+class TestQuaternionArrayInitialisation(unittest.TestCase):
+
+    def test_init_from_array(self):
+        a = randomArray()
+        qa = QuaternionArray(a)
+        self.assertEqual(len(qa), 16)
+        self.assertEqual(qa.q.dtype, np.float64)
+        np.testing.assert_array_equal(qa.q, a)
+        self.assertFalse(qa.q is a)
+
+    def test_init_from_single_sequence(self):
+        qa = QuaternionArray([1, 2, 3, 4])
+        self.assertEqual(qa.q.shape, (1, 4))
+
+    def test_init_from_quaternions(self):
+        qs = [Quaternion.random() for _ in range(5)]
+        qa = QuaternionArray(qs)
+        for q, p in zip(qs, qa):
+            self.assertEqual(q, p)
+        self.assertEqual(qa[2], qs[2])
+
+    def test_init_invalid(self):
+        with self.assertRaises(ValueError):
+            QuaternionArray(np.zeros((5, 3)))
+        with self.assertRaises(ValueError):
+            QuaternionArray([["a", "b", "c", "d"]])
+
+    def test_random(self):
+        qa = QuaternionArray.random(1000)
+        self.assertEqual(qa.q.shape, (1000, 4))
+        np.testing.assert_almost_equal(qa.norm, np.ones(1000), decimal=ALMOST_EQUAL_TOLERANCE)
+        # Rows are not all the same
+        self.assertGreater(np.ptp(qa.scalar), 0.0)
+
+    def test_random_reproducible(self):
+        a = Quaternion.random(50, rng=np.random.default_rng(42))
+        b = QuaternionArray.random(50, rng=np.random.default_rng(42))
+        self.assertIsInstance(a, QuaternionArray)
+        np.testing.assert_array_equal(a.q, b.q)
+        c = QuaternionArray.random(50, rng=np.random.default_rng(43))
+        self.assertFalse(np.array_equal(a.q, c.q))
+
+    def test_random_matches_single(self):
+        qa = QuaternionArray.random(1, rng=np.random.default_rng(1))
+        self.assertEqual(qa[0], Quaternion.random(rng=np.random.default_rng(1)))
+
+    def test_slicing(self):
+        qa = QuaternionArray(randomArray())
+        self.assertIsInstance(qa[2:5], QuaternionArray)
+        self.assertEqual(len(qa[2:5]), 3)
+        self.assertEqual(len(qa[qa.scalar > 2.0]), 0)
+        qa[0] = Quaternion(1, 0, 0, 0)
+        self.assertEqual(qa[0], Quaternion(1, 0, 0, 0))
+
+
+class TestQuaternionArrayArithmetic(unittest.TestCase):
+
+    def assertMatchesScalar(self, qa, quaternions):
+        self.assertIsInstance(qa, QuaternionArray)
+        for p, q in zip(qa, quaternions):
+            np.testing.assert_almost_equal(p.q, q.q, decimal=ALMOST_EQUAL_TOLERANCE)
+
+    def test_add_sub_neg(self):
+        a, b = QuaternionArray(randomArray()), QuaternionArray(randomArray())
+        self.assertMatchesScalar(a + b, [p + q for p, q in zip(a, b)])
+        self.assertMatchesScalar(a - b, [p - q for p, q in zip(a, b)])
+        self.assertMatchesScalar(-a, [-p for p in a])
+        self.assertMatchesScalar(a + 2.5, [p + 2.5 for p in a])
+        self.assertMatchesScalar(2.5 - a, [2.5 - p for p in a])
+
+    def test_multiply(self):
+        a, b = QuaternionArray(randomArray()), QuaternionArray(randomArray())
+        r = Quaternion.random()
+        self.assertMatchesScalar(a * b, [p * q for p, q in zip(a, b)])
+        self.assertMatchesScalar(a * r, [p * r for p in a])
+        self.assertMatchesScalar(r * a, [r * p for p in a])
+        self.assertMatchesScalar(3.0 * a, [3.0 * p for p in a])
+
+    def test_mixed_arithmetic_with_four_elements(self):
+        # A length-4 array must not be mistaken for the elements of a single quaternion
+        a = QuaternionArray(randomArray(4))
+        r = Quaternion.random()
+        self.assertMatchesScalar(r + a, [r + p for p in a])
+        self.assertMatchesScalar(r - a, [r - p for p in a])
+        self.assertMatchesScalar(r * a, [r * p for p in a])
+
+
+class TestQuaternionArrayFeatures(unittest.TestCase):
+
+    def test_conjugate_inverse(self):
+        a = QuaternionArray(randomArray())
+        for p, c, i in zip(a, a.conjugate, a.inverse):
+            self.assertEqual(c, p.conjugate)
+            self.assertEqual(i, p.inverse)
+        with self.assertRaises(ZeroDivisionError):
+            QuaternionArray(np.zeros((2, 4))).inverse
+
+    def test_norm_normalised(self):
+        a = QuaternionArray(np.vstack((randomArray(), np.zeros(4))))
+        np.testing.assert_almost_equal(a.norm, np.linalg.norm(a.q, axis=1), decimal=ALMOST_EQUAL_TOLERANCE)
+        n = a.normalised
+        np.testing.assert_almost_equal(n.norm[:-1], 1.0, decimal=ALMOST_EQUAL_TOLERANCE)
+        self.assertEqual(n[-1], Quaternion(0.0))
+
+    def test_rotate(self):
+        a = QuaternionArray(randomArray())
+        v = np.random.uniform(-1, 1, (16, 3))
+        rotated = a.rotate(v)
+        self.assertEqual(rotated.shape, (16, 3))
+        for q, u, r in zip(a, v, rotated):
+            np.testing.assert_almost_equal(r, q.rotate(u), decimal=ALMOST_EQUAL_TOLERANCE)
+        single = a.rotate([1.0, 0.0, 0.0])
+        for q, r in zip(a, single):
+            np.testing.assert_almost_equal(r, q.rotate([1.0, 0.0, 0.0]), decimal=ALMOST_EQUAL_TOLERANCE)
+
+    def test_rotate_broadcast_rows(self):
+        a = QuaternionArray(randomArray())
+        v = np.random.uniform(-1, 1, (16, 5, 3))
+        rotated = a.rotate(v)
+        self.assertEqual(rotated.shape, (16, 5, 3))
+        for q, vs, rs in zip(a, v, rotated):
+            np.testing.assert_almost_equal(rs, q.rotate(vs), decimal=ALMOST_EQUAL_TOLERANCE)
+
+        out = np.empty_like(v)
+        self.assertTrue(a.rotate(v, out=out) is out)
+        np.testing.assert_array_equal(out, rotated)
+        with self.assertRaises(ValueError):
+            a.rotate(np.zeros((15, 3)))
+
+    def test_rotate_does_not_modify_elements(self):
+        elements = randomArray()
+        a = QuaternionArray(elements)
+        a.rotate(np.ones(3))
+        a.rotation_matrix
+        np.testing.assert_array_equal(a.q, elements)
+
+    def test_rotation_matrix(self):
+        a = QuaternionArray(randomArray())
+        R = a.rotation_matrix
+        self.assertEqual(R.shape, (16, 3, 3))
+        for q, m in zip(a, R):
+            np.testing.assert_almost_equal(m, q.rotation_matrix, decimal=ALMOST_EQUAL_TOLERANCE)
+
+
+    def test_zero_quaternion_matrices(self):
+        a = QuaternionArray([[0.0, 0.0, 0.0, 0.0], [1.0, 0.0, 0.0, 0.0]])
+        np.testing.assert_array_equal(a.rotation_matrix[0], np.zeros((3, 3)))
+        np.testing.assert_array_equal(a.rotation_matrix[1], np.eye(3))
+        np.testing.assert_array_equal(a.transformation_matrix[0], np.diag([0.0, 0.0, 0.0, 1.0]))
+        q = Quaternion(0.0, 0.0, 0.0, 0.0)
+        np.testing.assert_array_equal(q.rotation_matrix, np.zeros((3, 3)))
+        np.testing.assert_array_equal(q.transformation_matrix, np.diag([0.0, 0.0, 0.0, 1.0]))
+
+    def test_rotation_matrix_out(self):
+        a = QuaternionArray(randomArray())
+        out = np.empty((16, 3, 3))
+        self.assertTrue(a.get_rotation_matrix(out=out) is out)
+        np.testing.assert_array_equal(out, a.rotation_matrix)
+        with self.assertRaises(ValueError):
+            a.get_rotation_matrix(out=np.empty((15, 3, 3)))
+
+    def test_transformation_matrix(self):
+        a = QuaternionArray(randomArray())
+        out = np.full((16, 4, 4), np.nan)
+        T = a.get_transformation_matrix(out=out)
+        self.assertTrue(T is out)
+        for q, m in zip(a, T):
+            np.testing.assert_almost_equal(m, q.transformation_matrix, decimal=ALMOST_EQUAL_TOLERANCE)
+
+
+    def test_from_matrix(self):
+        # Include half-turns about each axis so that every branch of the trace method is exercised
+        qs = [Quaternion.random() for _ in range(32)]
+        qs += [Quaternion(axis=axis, angle=np.pi) for axis in np.eye(3)]
+        qs += [Quaternion()]
+        R = np.array([q.rotation_matrix for q in qs])
+        T = np.array([q.transformation_matrix for q in qs])
+        for stack in (R, T):
+            a = QuaternionArray.from_matrix(stack)
+            self.assertEqual(len(a), len(qs))
+            for p, q in zip(a, qs):
+                self.assertEqual(p, Quaternion(matrix=q.rotation_matrix))
+
+    def test_from_matrix_validation(self):
+        R = np.array([Quaternion.random().rotation_matrix for _ in range(10)])
+        R[3] *= 2.0
+        R[7] = -R[7]
+        np.testing.assert_array_equal(np.flatnonzero(~QuaternionArray.validate_matrix(R)), [3, 7])
+        with self.assertRaises(ValueError) as context:
+            QuaternionArray.from_matrix(R)
+        self.assertIn("[3, 7]", str(context.exception))
+        QuaternionArray.from_matrix(R, validate=False)
+        with self.assertRaises(ValueError):
+            QuaternionArray.from_matrix(np.zeros((3, 2, 2)))
+        with self.assertRaises(TypeError):
+            QuaternionArray.from_matrix([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+
+
+class TestQuaternionArrayExpLog(unittest.TestCase):
+
+    def assertMatchesScalar(self, qa, quaternions):
+        self.assertIsInstance(qa, QuaternionArray)
+        self.assertEqual(len(qa), len(quaternions))
+        for p, q in zip(qa, quaternions):
+            np.testing.assert_almost_equal(p.q, q.q, decimal=ALMOST_EQUAL_TOLERANCE)
+
+    def test_exp_log(self):
+        a = randomArray()
+        a[0, 1:] = 0.0 # Real quaternion
+        a[1, 0] = 0.0 # Pure quaternion
+        self.assertMatchesScalar(QuaternionArray.exp(a), [Quaternion.exp(Quaternion(e)) for e in a])
+        self.assertMatchesScalar(QuaternionArray.log(a), [Quaternion.log(Quaternion(e)) for e in a])
+        # As for Quaternion.log(), negative real quaternions do not round trip
+        np.testing.assert_almost_equal(QuaternionArray.exp(QuaternionArray.log(a[1:])).q, a[1:], decimal=ALMOST_EQUAL_TOLERANCE)
+
+    def test_log_zero(self):
+        result = QuaternionArray.log(np.zeros((2, 4)))
+        self.assertTrue(np.all(np.isneginf(result.scalar)))
+        self.assertTrue(np.all(np.isnan(result.vector)))
+
+    def test_power(self):
+        a = QuaternionArray(np.vstack((randomArray(), [2.0, 0.0, 0.0, 0.0], np.zeros(4))))
+        for exponent in [0.5, -0.5, 2, 3.3]:
+            self.assertMatchesScalar(a ** exponent, [q ** exponent for q in a])
+
+    def test_maps(self):
+        q = QuaternionArray(randomArray())
+        p = QuaternionArray(randomArray())
+        for name in ['exp_map', 'log_map', 'sym_exp_map', 'sym_log_map']:
+            batched = getattr(QuaternionArray, name)
+            scalar = getattr(Quaternion, name)
+            self.assertMatchesScalar(batched(q, p), [scalar(a, b) for a, b in zip(q, p)])
+            # A single base point is used for every argument
+            self.assertMatchesScalar(batched(q[0], p), [scalar(q[0], b) for b in p])
+
+    def test_log_map_inverts_exp_map(self):
+        q = QuaternionArray.random(16)
+        eta = QuaternionArray(np.hstack((np.zeros((16, 1)), np.random.uniform(-1, 1, (16, 3)))))
+        np.testing.assert_almost_equal(QuaternionArray.log_map(q, QuaternionArray.exp_map(q, eta)).q, eta.q, decimal=ALMOST_EQUAL_TOLERANCE)
+        with self.assertRaises(ZeroDivisionError):
+            QuaternionArray.log_map(np.zeros((16, 4)), q)
+
+
+class TestQuaternionArrayDistance(unittest.TestCase):
+
+    def test_matches_scalar(self):
+        a = QuaternionArray(randomArray(64))
+        b = QuaternionArray(randomArray(64))
+        for name in ['distance', 'absolute_distance', 'sym_distance']:
+            result = getattr(QuaternionArray, name)(a, b)
+            self.assertEqual(result.shape, (64,))
+            expected = [getattr(Quaternion, name)(p, q) for p, q in zip(a, b)]
+            np.testing.assert_almost_equal(result, expected, decimal=ALMOST_EQUAL_TOLERANCE)
+
+    def test_broadcast(self):
+        q = Quaternion.random()
+        a = QuaternionArray.random(10)
+        np.testing.assert_almost_equal(QuaternionArray.distance(q, a), [Quaternion.distance(q, p) for p in a], decimal=ALMOST_EQUAL_TOLERANCE)
+        self.assertEqual(QuaternionArray.distance(q, q).shape, (1,))
+
+    def test_special_cases(self):
+        a = QuaternionArray([[0.5, 0.5, 0.5, 0.5], [0.0, 1.0, 0.0, 0.0], [0.0, 0.6, 0.0, 0.8]])
+        np.testing.assert_almost_equal(QuaternionArray.distance(a, -a), np.zeros(3), decimal=8)
+        np.testing.assert_almost_equal(QuaternionArray.absolute_distance(a, -a), np.zeros(3), decimal=ALMOST_EQUAL_TOLERANCE)
+        np.testing.assert_almost_equal(QuaternionArray.sym_distance(a, -a), np.full(3, np.pi), decimal=8)
+        self.assertTrue(np.isnan(QuaternionArray.distance(a[0], np.zeros(4))[0]))
+        self.assertTrue(np.isnan(QuaternionArray.sym_distance(np.zeros(4), a[0])[0]))
+        real0 = [[3.0, 0.0, 0.0, 0.0], [1.0, 0.0, 0.0, 0.0], [-2.0, 0.0, 0.0, 0.0], [0.5, 0.0, 0.0, 0.0]]
+        real1 = [[-0.5, 0.0, 0.0, 0.0], [-1.0, 0.0, 0.0, 0.0], [0.7, 0.0, 0.0, 0.0], [1.0, 2.0, 3.0, 4.0]]
+        expected = [Quaternion.sym_distance(Quaternion(p), Quaternion(q)) for p, q in zip(real0, real1)]
+        np.testing.assert_almost_equal(QuaternionArray.sym_distance(real0, real1), expected, decimal=ALMOST_EQUAL_TOLERANCE)
+        np.testing.assert_almost_equal(expected, [log(6), 0.0, np.nan, Quaternion.sym_log_map(Quaternion(0.5), Quaternion(1, 2, 3, 4)).norm], decimal=ALMOST_EQUAL_TOLERANCE)
+        with self.assertRaises(ZeroDivisionError):
+            QuaternionArray.distance(np.zeros(4), a)
+
+
+class TestQuaternionArrayInterpolation(unittest.TestCase):
+
+    def test_slerp_matches_scalar(self):
+        a = QuaternionArray.random(64)
+        b = QuaternionArray.random(64)
+        b[:8] = a[:8].q * 1.00001 # Nearby endpoints use the linear fallback
+        b[8:16] = -a[8:16] # Opposite signs take the shortest path
+        amounts = np.random.random(64)
+        result = QuaternionArray.slerp(a, b, amounts)
+        self.assertEqual(result.q.shape, (64, 4))
+        for i, q in enumerate(result):
+            np.testing.assert_almost_equal(q.q, Quaternion.slerp(a[i], b[i], amounts[i]).q, decimal=ALMOST_EQUAL_TOLERANCE)
+
+    def test_slerp_broadcast(self):
+        q0 = Quaternion(axis=[0, 0, 1], angle=0.0)
+        q1 = Quaternion(axis=[0, 0, 1], angle=np.pi / 2)
+        result = QuaternionArray.slerp(q0, q1, np.linspace(0, 1, 5))
+        for q, angle in zip(result, np.linspace(0, np.pi / 2, 5)):
+            self.assertEqual(q, Quaternion(axis=[0, 0, 1], angle=angle))
+        a = QuaternionArray.random(10)
+        np.testing.assert_almost_equal(QuaternionArray.slerp(a, q1, 1.0).q, np.tile(q1.q, (10, 1)), decimal=ALMOST_EQUAL_TOLERANCE)
+        self.assertEqual(len(QuaternionArray.slerp(q0, q1)), 1)
+
+    def test_slerp_unit_and_unmodified(self):
+        elements = randomArray()
+        a = QuaternionArray(elements)
+        b = QuaternionArray.random(16)
+        result = QuaternionArray.slerp(a, b, 0.3)
+        np.testing.assert_almost_equal(result.norm, np.ones(16), decimal=ALMOST_EQUAL_TOLERANCE)
+        np.testing.assert_array_equal(a.q, elements)
+
+    def test_slerp_invalid_shape(self):
+        with self.assertRaises(ValueError):
+            QuaternionArray.slerp(QuaternionArray.random(4), QuaternionArray.random(5))
+        with self.assertRaises(ValueError):
+            QuaternionArray.slerp(QuaternionArray.random(4), QuaternionArray.random(4), np.zeros((2, 4)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,312 @@
+#!/usr/bin python
+# -*- coding: utf-8 -*-
+"""
+This file is part of the pyquaternion python module
+
+Author:         Kieran Wynn
+Website:        https://github.com/KieranWynn/pyquaternion
+Documentation:  http://kieranwynn.github.io/pyquaternion/
+
+Version:         1.0.0
+License:         The MIT License (MIT)
+
+Copyright (c) 2015 Kieran Wynn
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+test_spatial.py - Unit test for pairwise distance and search functions
+
+"""
+
+import unittest
+
+import numpy as np
+
+from pyquaternion import Quaternion, QuaternionArray, RotationIndex, deduplicate, pairwise_distances, pairwise_top_k, rotation_keys
+
+
+ALMOST_EQUAL_TOLERANCE = 13
+
+METRICS = ['absolute_distance', 'distance', 'sym_distance']
+
+def randomArray(n=16):
+    return np.random.uniform(-1, 1, (n, 4))
+
+class TestPairwiseDistances(unittest.TestCase):
+
+    def test_matches_scalar(self):
+        a = randomArray(7)
+        b = randomArray(5)
+        for metric in METRICS:
+            d = pairwise_distances(a, b, metric)
+            self.assertEqual(d.shape, (7, 5))
+            for i in range(7):
+                for j in range(5):
+                    expected = getattr(Quaternion, metric)(Quaternion(a[i]), Quaternion(b[j]))
+                    self.assertAlmostEqual(d[i, j], expected, ALMOST_EQUAL_TOLERANCE)
+
+    def test_real_quaternions(self):
+        a = np.array([[3.0, 0.0, 0.0, 0.0], [1.0, 0.0, 0.0, 0.0], [-2.0, 0.0, 0.0, 0.0], [0.5, 0.5, 0.5, 0.5]])
+        b = np.array([[-0.5, 0.0, 0.0, 0.0], [-1.0, 0.0, 0.0, 0.0], [0.7, 0.0, 0.0, 0.0], [1.0, 2.0, 3.0, 4.0]])
+        for metric in METRICS:
+            d = pairwise_distances(a, b, metric)
+            for i in range(4):
+                for j in range(4):
+                    expected = getattr(Quaternion, metric)(Quaternion(a[i]), Quaternion(b[j]))
+                    np.testing.assert_almost_equal(d[i, j], expected, decimal=ALMOST_EQUAL_TOLERANCE)
+        real = np.zeros((200, 4))
+        real[:, 0] = np.random.uniform(0.1, 2.0, 200) * np.random.choice([-1.0, 1.0], 200)
+        expected = np.abs(np.log(np.abs(real[:, 0] / real[:, 0, np.newaxis])))
+        np.testing.assert_almost_equal(pairwise_distances(real, metric='distance'), expected, decimal=ALMOST_EQUAL_TOLERANCE)
+
+    def test_chunk_size(self):
+        a = randomArray(50)
+        b = randomArray(30)
+        for metric in METRICS:
+            full = pairwise_distances(a, b, metric)
+            for chunk_size in [1, 7, 50, 100]:
+                np.testing.assert_almost_equal(pairwise_distances(a, b, metric, chunk_size=chunk_size), full, decimal=ALMOST_EQUAL_TOLERANCE)
+
+    def test_input_forms(self):
+        a = randomArray(4)
+        b = randomArray(3)
+        np.testing.assert_array_equal(pairwise_distances(a), pairwise_distances(a, a))
+        expected = pairwise_distances(a, b)
+        np.testing.assert_array_equal(pairwise_distances(QuaternionArray(a), [Quaternion(r) for r in b]), expected)
+        np.testing.assert_almost_equal(pairwise_distances(Quaternion(a[0]), b), expected[:1], decimal=ALMOST_EQUAL_TOLERANCE)
+        self.assertEqual(pairwise_distances(a, np.empty((0, 4))).shape, (4, 0))
+
+    def test_self_distance(self):
+        qa = QuaternionArray.random(20)
+        for metric in METRICS:
+            np.testing.assert_almost_equal(np.diag(pairwise_distances(qa, metric=metric)), np.zeros(20), decimal=7)
+
+    def test_invalid(self):
+        a = randomArray(3)
+        with self.assertRaises(ValueError):
+            pairwise_distances(a, metric='manhattan')
+        with self.assertRaises(ZeroDivisionError):
+            pairwise_distances(np.zeros((1, 4)), a, 'distance')
+
+
+class TestPairwiseTopK(unittest.TestCase):
+
+    def test_matches_sorted_matrix(self):
+        a = randomArray(40)
+        b = randomArray(25)
+        for metric in METRICS:
+            d = pairwise_distances(a, b, metric)
+            for k in [1, 3, 25]:
+                indices, distances = pairwise_top_k(a, b, k, metric, chunk_size=9)
+                self.assertEqual(indices.shape, (40, k))
+                np.testing.assert_array_equal(distances, np.sort(d, axis=1)[:, :k])
+                np.testing.assert_array_equal(np.take_along_axis(d, indices, axis=1), distances)
+
+    def test_nearest_is_self(self):
+        qa = QuaternionArray.random(30)
+        indices, distances = pairwise_top_k(qa)
+        np.testing.assert_array_equal(indices[:, 0], np.arange(30))
+
+    def test_antipodal(self):
+        # q and -q are the same rotation
+        qa = QuaternionArray.random(10)
+        indices, distances = pairwise_top_k(qa, -qa)
+        np.testing.assert_array_equal(indices[:, 0], np.arange(10))
+
+    def test_invalid_k(self):
+        a = randomArray(5)
+        for k in [0, 6]:
+            with self.assertRaises(ValueError):
+                pairwise_top_k(a, k=k)
+
+class TestRotationIndex(unittest.TestCase):
+
+    def buildIndex(self, refs):
+        # Several insertions of uneven size, with small leaves, to exercise merging and deep trees
+        index = RotationIndex(refs[:50], leaf_size=4)
+        index.insert(refs[50:51])
+        index.insert(refs[51:120])
+        index.insert(refs[120:])
+        return index
+
+    def test_insert(self):
+        index = RotationIndex()
+        self.assertEqual(len(index), 0)
+        index.insert(QuaternionArray.random(10))
+        index.insert(Quaternion.random())
+        index.insert(np.empty((0, 4)))
+        self.assertEqual(len(index), 11)
+
+    def test_query_matches_scan(self):
+        refs = QuaternionArray.random(300)
+        queries = QuaternionArray.random(20)
+        index = self.buildIndex(refs)
+        for k in [1, 4, 300]:
+            indices, distances = index.query(queries, k)
+            expected_indices, expected_distances = pairwise_top_k(queries, refs, k)
+            np.testing.assert_array_equal(indices, expected_indices)
+            np.testing.assert_almost_equal(distances, expected_distances, decimal=ALMOST_EQUAL_TOLERANCE)
+
+    def test_query_sign(self):
+        refs = QuaternionArray.random(200)
+        refs[0] = [1.0, 0.0, 0.0, 0.0]
+        index = self.buildIndex(refs)
+        queries = QuaternionArray(np.vstack(([1.0, 0.0, 0.0, 0.0], QuaternionArray.random(10).q)))
+        for metric in METRICS:
+            indices, distances = index.query(queries, 5, metric)
+            self.assertTrue(np.all(np.isfinite(distances)))
+            negated_indices, negated_distances = index.query(-queries, 5, metric)
+            np.testing.assert_array_equal(negated_indices, indices)
+            np.testing.assert_array_equal(negated_distances, distances)
+            within, found = index.query_radius(queries, 0.5, metric)
+            negated_within, negated_found = index.query_radius(-queries, 0.5, metric)
+            self.assertIn(0, within[0])
+            for i in range(len(queries)):
+                np.testing.assert_array_equal(negated_within[i], within[i])
+                np.testing.assert_array_equal(negated_found[i], found[i])
+
+    def test_query_metrics(self):
+        refs = QuaternionArray.random(200)
+        index = self.buildIndex(refs)
+        q = Quaternion.random()
+        for metric in METRICS:
+            indices, distances = index.query(q, 10, metric)
+            self.assertEqual(indices.shape, (1, 10))
+            np.testing.assert_array_equal(indices, index.query(q, 10)[0])
+            for i, d in zip(indices[0], distances[0]):
+                r = refs[i] if np.dot(q.q, refs[i].q) > 0 else -refs[i]
+                self.assertAlmostEqual(d, getattr(Quaternion, metric)(q, r), ALMOST_EQUAL_TOLERANCE)
+
+    def test_antipodal(self):
+        # q and -q are the same rotation
+        refs = QuaternionArray.random(100)
+        index = RotationIndex(refs, leaf_size=4)
+        indices, distances = index.query(-refs)
+        np.testing.assert_array_equal(indices[:, 0], np.arange(100))
+        np.testing.assert_almost_equal(distances[:, 0], np.zeros(100), decimal=7)
+
+    def test_scaled(self):
+        # Only the rotation matters
+        refs = randomArray(50)
+        index = RotationIndex(refs * 3.0)
+        indices, distances = index.query(refs[:5] * 0.5)
+        np.testing.assert_array_equal(indices[:, 0], np.arange(5))
+
+    def test_query_radius(self):
+        refs = QuaternionArray.random(300)
+        queries = QuaternionArray.random(20)
+        index = self.buildIndex(refs)
+        for metric in METRICS:
+            indices, distances = index.query_radius(queries, 0.5, metric)
+            self.assertEqual(len(indices), 20)
+            for q, found, d in zip(queries, indices, distances):
+                expected = np.array([getattr(Quaternion, metric)(q, r if np.dot(q.q, r.q) > 0 else -r) for r in refs])
+                np.testing.assert_array_equal(np.sort(found), np.nonzero(expected <= 0.5)[0])
+                np.testing.assert_almost_equal(d, expected[found], decimal=ALMOST_EQUAL_TOLERANCE)
+                self.assertTrue(np.all(np.diff(d) >= 0))
+        self.assertEqual(len(index.query_radius(queries[0], -1.0)[0][0]), 0)
+        self.assertEqual(len(index.query_radius(queries[0], 4.0, 'distance')[0][0]), 300)
+
+    def test_invalid(self):
+        index = RotationIndex(QuaternionArray.random(5))
+        for k in [0, 6]:
+            with self.assertRaises(ValueError):
+                index.query(Quaternion.random(), k)
+        with self.assertRaises(ValueError):
+            index.query(Quaternion.random(), metric='manhattan')
+        with self.assertRaises(ValueError):
+            index.query_radius(Quaternion.random(), 0.1, metric='manhattan')
+        with self.assertRaises(ValueError):
+            index.insert(Quaternion(0, 0, 0, 0))
+        with self.assertRaises(ValueError):
+            index.query(Quaternion(0, 0, 0, 0))
+        with self.assertRaises(ValueError):
+            RotationIndex(leaf_size=0)
+        with self.assertRaises(ValueError):
+            RotationIndex().query(Quaternion.random())
+
+class TestDeduplicate(unittest.TestCase):
+
+    def greedyDeduplicate(self, a, tol):
+        # Reference O(n^2) implementation
+        kept = []
+        inverse = []
+        for q in a:
+            matches = [i for i, k in enumerate(kept) if Quaternion.absolute_distance(q.normalised, k.normalised) <= tol]
+            if matches:
+                inverse.append(matches[0])
+            else:
+                inverse.append(len(kept))
+                kept.append(q)
+        return inverse
+
+    def test_rotation_keys(self):
+        qa = QuaternionArray.random(100)
+        keys = rotation_keys(qa, 1e-6)
+        self.assertEqual(keys.shape, (100, 4))
+        np.testing.assert_array_equal(rotation_keys(-qa * 2.0, 1e-6), keys)
+        self.assertEqual(len(set(map(tuple, keys.tolist()))), 100)
+        np.testing.assert_array_equal(rotation_keys(Quaternion(0, -1, 0, 0), 0.1), [[0, 10, 0, 0]])
+        with self.assertRaises(ValueError):
+            rotation_keys(qa, 0.0)
+
+    def test_repeats(self):
+        base = QuaternionArray.random(50)
+        repeats = np.random.randint(0, 50, 200)
+        noise = np.random.normal(size=(200, 4)) * 1e-10
+        signs = np.random.choice([-1.0, 1.0], (200, 1))
+        scales = np.random.uniform(0.5, 2.0, (200, 1))
+        a = np.concatenate((base.q, (base.q[repeats] + noise) * signs * scales))
+        unique, index, inverse = deduplicate(a, 1e-8, return_index=True, return_inverse=True)
+        self.assertIsInstance(unique, QuaternionArray)
+        np.testing.assert_array_equal(unique.q, base.q)
+        np.testing.assert_array_equal(index, np.arange(50))
+        np.testing.assert_array_equal(inverse, np.concatenate((np.arange(50), repeats)))
+
+    def test_matches_greedy(self):
+        qa = QuaternionArray.random(300)
+        for tol in [0.1, 0.3, 1.0]:
+            unique, index, inverse = deduplicate(qa, tol, return_index=True, return_inverse=True)
+            expected = self.greedyDeduplicate(qa, tol)
+            np.testing.assert_array_equal(inverse, expected)
+            np.testing.assert_array_equal(unique.q, qa.q[index])
+            np.testing.assert_array_equal(inverse[index], np.arange(len(index)))
+
+    def test_fold(self):
+        # Nearly opposite quaternions either side of w = 0 are nearly the same rotation
+        a = [[1e-12, 1, 0, 0], [-1e-12, -1, 1e-12, 0], [0, -1, 0, 0], [0, 0, 1, 0]]
+        self.assertEqual(self.greedyDeduplicate(QuaternionArray(a), 1e-9), [0, 0, 0, 1])
+        np.testing.assert_array_equal(deduplicate(a, 1e-9, return_inverse=True)[1], [0, 0, 0, 1])
+        np.testing.assert_array_equal(deduplicate(a, 0.0, return_inverse=True)[1], [0, 1, 2, 3])
+
+    def test_returns(self):
+        qa = QuaternionArray.random(5)
+        self.assertIsInstance(deduplicate(qa), QuaternionArray)
+        self.assertEqual(len(deduplicate(qa, return_index=True)), 2)
+        self.assertEqual(len(deduplicate(QuaternionArray(np.empty((0, 4))), return_inverse=True)[1]), 0)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            deduplicate(QuaternionArray.random(5), -1.0)
+        with self.assertRaises(ValueError):
+            deduplicate([[1, 0, 0, 0], [0, 0, 0, 0]])
+
+
+if __name__ == '__main__':
+    unittest.main()